@@ -47,6 +47,9 @@ def _get_or_create_secret_key(app_data_dir: Path) -> str:
         cp.set("company", "name", "OtoServis Pro")
         cp.set("company", "currency", "TRY")
         cp.set("company", "vat_rate", "20.0")
+    if not cp.has_section("database"):
+        cp.add_section("database")
+        cp.set("database", "performance_profile", "balanced")
 
     os.makedirs(app_data_dir, exist_ok=True)
     with open(config_file, "w", encoding="utf-8") as f:
@@ -55,6 +58,15 @@ def _get_or_create_secret_key(app_data_dir: Path) -> str:
     return key
 
 
+def _read_config_value(app_data_dir: Path, section: str, key: str, fallback: str) -> str:
+    """Read an optional value from the per-installation config.ini."""
+    config_file = app_data_dir / "config.ini"
+    cp = configparser.ConfigParser()
+    if config_file.exists():
+        cp.read(config_file, encoding="utf-8")
+    return cp.get(section, key, fallback=fallback)
+
+
 # ── Resolve paths ──
 APP_DATA_DIR = _get_app_data_dir()
 
@@ -81,11 +93,50 @@ class Settings(BaseSettings):
     # Database — stored in AppData, NOT inside the project folder
     APP_DATA_DIR: Path = APP_DATA_DIR
     DATABASE_URL: str = f"sqlite:///{APP_DATA_DIR / 'otoservis.db'}"
+    ASYNC_DATABASE_URL: str = f"sqlite+aiosqlite:///{APP_DATA_DIR / 'otoservis.db'}"
+
+    # SQLite performance profile — see PERFORMANCE_PROFILES in app/core/database.py
+    DB_PERFORMANCE_PROFILE: str = _read_config_value(APP_DATA_DIR, "database", "performance_profile", "balanced")
+
+    # Split mode: read-only connection pool + one serialized writer connection (SQLite only)
+    DB_SPLIT_READ_WRITE: bool = _read_config_value(APP_DATA_DIR, "database", "split_read_write", "false")
+    DB_READ_POOL_SIZE: int = _read_config_value(APP_DATA_DIR, "database", "read_pool_size", "8")
+    DB_WRITE_TIMEOUT: int = _read_config_value(APP_DATA_DIR, "database", "write_timeout", "30")
+
+    # Serve the hot list/detail pages from async handlers on an aiosqlite session
+    # (read-only); writes and every other page stay on the sync threadpool path.
+    # Off by default: measured slower than the sync handlers on SQLite, since
+    # aiosqlite hands every query to its own thread (app/utils/read_benchmark.py)
+    DB_ASYNC_READS: bool = _read_config_value(APP_DATA_DIR, "database", "async_reads", "false")
 
     # Security — unique per installation
     SECRET_KEY: str = _get_or_create_secret_key(APP_DATA_DIR)
     SESSION_MAX_AGE: int = 3600 * 8  # 8 hours
 
+    # SQL instrumentation — per-request query stats and N+1 detection
+    SQL_STATS_ENABLED: bool = True
+    SQL_N_PLUS_ONE_THRESHOLD: int = 5  # same statement more often than this in one request
+    SQL_STATS_HISTORY: int = 200  # requests kept in the rolling table
+
+    # Dashboard widget cache — dropped on relevant writes, TTL (seconds) as a fallback
+    DASHBOARD_CACHE_TTL: int = 60
+
+    # Report cache — LRU by (type, start, end); ranges ending before today change
+    # only when a closed order from that range is edited, so they live longer
+    REPORT_CACHE_SIZE: int = 64
+    REPORT_CACHE_TTL: int = 300
+    REPORT_CACHE_PAST_TTL: int = 86400
+
+    # Search result totals per (table, query) while the user pages through
+    # them; dropped when rows of that table change
+    SEARCH_COUNT_CACHE_SIZE: int = 256
+    SEARCH_COUNT_TTL: int = 120
+
+    # Typeahead suggestions per (table, scope, typed prefix); each keystroke of
+    # a prefix someone already typed is served from memory
+    TYPEAHEAD_CACHE_SIZE: int = 512
+    TYPEAHEAD_CACHE_TTL: int = 30
+
     # VAT
     DEFAULT_VAT_RATE: float = 20.0
 
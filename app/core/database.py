@@ -1,43 +1,248 @@
+import logging
+from contextlib import contextmanager
+
+from fastapi import Request
 from sqlalchemy import create_engine, event
-from sqlalchemy.orm import sessionmaker, DeclarativeBase
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker, DeclarativeBase, Session
 
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
+
+# SQLite pragma sets, selected with DB_PERFORMANCE_PROFILE / config.ini [database].
+# cache_size is negative → KiB (SQLite convention), mmap_size is bytes, busy_timeout is ms.
+PERFORMANCE_PROFILES = {
+    "safe": {
+        "synchronous": "FULL",
+        "cache_size": -8_000,
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+        "busy_timeout": 5_000,
+    },
+    "balanced": {
+        "synchronous": "NORMAL",
+        "cache_size": -64_000,
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 10_000,
+    },
+    "fast": {
+        "synchronous": "NORMAL",
+        "cache_size": -256_000,
+        "mmap_size": 1024 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 15_000,
+    },
+}
+DEFAULT_PROFILE = "balanced"
+
+
+def get_performance_profile(name: str = None) -> dict:
+    """Return the pragma set for a profile name, falling back to the default profile."""
+    name = (name or settings.DB_PERFORMANCE_PROFILE or DEFAULT_PROFILE).lower()
+    if name not in PERFORMANCE_PROFILES:
+        logger.warning(f"Unknown database performance profile '{name}', using '{DEFAULT_PROFILE}'")
+        name = DEFAULT_PROFILE
+    return PERFORMANCE_PROFILES[name]
+
 
+_IS_SQLITE = "sqlite" in settings.DATABASE_URL
+SPLIT_MODE = settings.DB_SPLIT_READ_WRITE and _IS_SQLITE
+
+# Request methods served from the read-only pool in split mode
+READ_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+# In split mode this is the single writer connection: the pool holds exactly one
+# connection, so concurrent writers queue for it instead of racing for SQLite's lock.
 engine = create_engine(
     settings.DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {},
+    connect_args={"check_same_thread": False} if _IS_SQLITE else {},
     echo=settings.DEBUG,
+    **({"pool_size": 1, "max_overflow": 0, "pool_timeout": settings.DB_WRITE_TIMEOUT} if SPLIT_MODE else {}),
 )
 
+if SPLIT_MODE:
+    read_engine = create_engine(
+        settings.DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        echo=settings.DEBUG,
+        pool_size=settings.DB_READ_POOL_SIZE,
+        max_overflow=0,
+    )
+else:
+    read_engine = engine
+
+# Engine behind get_async_db. It only serves reads (query_only), so every
+# write still goes through the sync services and their unit_of_work.
+async_engine = create_async_engine(settings.ASYNC_DATABASE_URL, echo=settings.DEBUG)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, read_only: bool = False):
+    """Enable WAL mode, foreign keys and the configured performance profile."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    for pragma, value in get_performance_profile().items():
+        cursor.execute(f"PRAGMA {pragma}={value}")
+    if read_only:
+        cursor.execute("PRAGMA query_only=ON")
+    cursor.close()
+
 
-# Enable WAL mode and foreign keys for SQLite
 @event.listens_for(engine, "connect")
 def set_sqlite_pragma(dbapi_connection, connection_record):
-    if "sqlite" in settings.DATABASE_URL:
-        cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA journal_mode=WAL")
-        cursor.execute("PRAGMA foreign_keys=ON")
-        cursor.close()
+    if _IS_SQLITE:
+        _apply_sqlite_pragmas(dbapi_connection)
+
+
+if SPLIT_MODE:
+    @event.listens_for(read_engine, "connect")
+    def set_sqlite_read_pragma(dbapi_connection, connection_record):
+        _apply_sqlite_pragmas(dbapi_connection, read_only=True)
+
+
+@event.listens_for(async_engine.sync_engine, "connect")
+def set_sqlite_async_pragma(dbapi_connection, connection_record):
+    if async_engine.dialect.name == "sqlite":
+        _apply_sqlite_pragmas(dbapi_connection, read_only=True)
+
+
+def get_effective_pragmas() -> dict:
+    """Read back the pragma values SQLite actually applied on a pooled connection."""
+    if not _IS_SQLITE:
+        return {}
+    names = ["journal_mode", "foreign_keys", *get_performance_profile().keys()]
+    with engine.connect() as conn:
+        return {name: conn.exec_driver_sql(f"PRAGMA {name}").scalar() for name in names}
+
+
+def log_effective_pragmas():
+    """Log the active performance profile and the pragma values in effect."""
+    pragmas = get_effective_pragmas()
+    if pragmas:
+        summary = ", ".join(f"{k}={v}" for k, v in pragmas.items())
+        logger.info(f"SQLite profile '{settings.DB_PERFORMANCE_PROFILE}': {summary}")
+    if SPLIT_MODE:
+        logger.info(f"SQLite split mode: {settings.DB_READ_POOL_SIZE} read connections, 1 writer")
 
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
 
 class Base(DeclarativeBase):
     pass
 
 
-def get_db():
-    """FastAPI dependency that provides a database session."""
-    db = SessionLocal()
+def get_db(request: Request):
+    """FastAPI dependency that provides a database session.
+
+    In split mode, read-only requests get a session on the reader pool. Every
+    other request checks out the writer connection up front and keeps it until
+    the response is done, so waiting happens here (in the threadpool) rather
+    than in the middle of a route.
+    """
+    if not SPLIT_MODE:
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+    elif request.method in READ_METHODS:
+        db = ReadSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+    else:
+        with engine.connect() as connection:
+            db = SessionLocal(bind=connection)
+            try:
+                yield db
+            finally:
+                db.close()
+
+
+async def get_async_db():
+    """FastAPI dependency that provides a read-only AsyncSession (see async_engine)."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# Session.info key holding how many unit_of_work blocks are open.
+_UOW_DEPTH = "unit_of_work_depth"
+
+
+@contextmanager
+def unit_of_work(db: Session):
+    """Run a block of repository calls as one transaction with a single commit.
+
+    While a unit is open, repositories only flush, so the whole service
+    operation costs one commit (one fsync) instead of one per call. Nested
+    units join the outermost one; an exception rolls everything back.
+    """
+    depth = db.info.get(_UOW_DEPTH, 0)
+    db.info[_UOW_DEPTH] = depth + 1
     try:
         yield db
+        if depth == 0:
+            db.commit()
+    except Exception:
+        if depth == 0:
+            db.rollback()
+        raise
     finally:
-        db.close()
+        db.info[_UOW_DEPTH] = depth
+
+
+def commit_or_flush(db: Session, obj=None) -> None:
+    """Commit (and reload obj) on its own, or just flush inside a unit of work.
+
+    Inside a unit, generated keys and defaults are available after the flush
+    and anything else expired on commit reloads lazily, so no refresh is done.
+    """
+    if db.info.get(_UOW_DEPTH, 0):
+        db.flush()
+        return
+    db.commit()
+    if obj is not None:
+        db.refresh(obj)
+
+
+def import_models():
+    """Import every model module so Base.metadata knows all tables."""
+    from app.models import user, customer, vehicle, work_order, work_order_item, part, payment, invoice, audit_log, work_order_photo, entity_counter, document_sequence, daily_revenue  # noqa: F401
+
+
+# Revision that matches the schema the app created with create_all before
+# migrations existed; such databases are stamped with it, then upgraded.
+BASELINE_REVISION = "0001"
+
+
+def _alembic_config():
+    from alembic.config import Config
+
+    cfg = Config()
+    cfg.set_main_option("script_location", str(settings.BASE_DIR / "app" / "migrations"))
+    return cfg
 
 
 def init_db():
-    """Create all tables. Used at startup."""
-    from app.models import user, customer, vehicle, work_order, work_order_item, part, payment, invoice, audit_log, work_order_photo  # noqa: F401
-    Base.metadata.create_all(bind=engine)
+    """Bring the schema up to date with Alembic. Used at startup."""
+    from alembic import command
+    from sqlalchemy import inspect
+
+    import_models()
+    cfg = _alembic_config()
+    with engine.begin() as connection:
+        cfg.attributes["connection"] = connection
+        inspector = inspect(connection)
+        if not inspector.has_table("alembic_version") and inspector.has_table("work_orders"):
+            logger.info(f"Existing database without migration history, stamping {BASELINE_REVISION}")
+            command.stamp(cfg, BASELINE_REVISION)
+        command.upgrade(cfg, "head")
+    log_effective_pragmas()
@@ -1,8 +1,9 @@
 from typing import Optional
 from fastapi import Request, HTTPException, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import get_async_db, get_db
 from app.models.user import User
 from app.core.enums import UserRole
 from app.services.auth_service import AuthService
@@ -22,6 +23,19 @@ def get_current_user(request: Request, db: Session = Depends(get_db)) -> User:
     return user
 
 
+async def get_current_user_async(request: Request, db: AsyncSession = Depends(get_async_db)) -> User:
+    """get_current_user for async handlers, reading the user on the AsyncSession."""
+    user_id = request.session.get("user_id")
+    if not user_id:
+        raise HTTPException(status_code=303, headers={"Location": "/auth/login"})
+
+    user = await db.get(User, user_id)
+    if not user or not user.is_active:
+        request.session.clear()
+        raise HTTPException(status_code=303, headers={"Location": "/auth/login"})
+    return user
+
+
 def get_optional_user(request: Request, db: Session = Depends(get_db)) -> Optional[User]:
     """Get the current user if authenticated, otherwise None."""
     user_id = request.session.get("user_id")
@@ -0,0 +1,134 @@
+"""
+Per-request SQL instrumentation.
+
+SQLAlchemy cursor events record every statement executed while a request is
+being served: statement count, total DB time and how often each statement
+shape repeated. A shape that runs more than SQL_N_PLUS_ONE_THRESHOLD times
+in one request is flagged as an N+1 (typically a lazy load inside a
+template loop).
+
+Results are returned as X-DB-* response headers and kept in a rolling
+in-memory table (see get_recent_requests).
+"""
+
+import re
+import time
+import logging
+import threading
+from collections import Counter, deque
+from contextvars import ContextVar
+from typing import Optional, List
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_IN_LIST = re.compile(r"\(\?(?:,\s*\?)+\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a parameterized statement so repeated executions compare equal."""
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    return _IN_LIST.sub("(?)", shape)
+
+
+class RequestQueryStats:
+    """Statements executed while serving one request."""
+
+    def __init__(self, method: str, path: str):
+        self.method = method
+        self.path = path
+        self.query_count = 0
+        self.db_time = 0.0
+        self.shapes: Counter = Counter()
+        self.status_code: Optional[int] = None
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, elapsed: float):
+        with self._lock:
+            self.query_count += 1
+            self.db_time += elapsed
+            self.shapes[statement_shape(statement)] += 1
+
+    def n_plus_one(self, threshold: int = None) -> List[tuple]:
+        """Statement shapes that repeated more than `threshold` times."""
+        threshold = threshold or settings.SQL_N_PLUS_ONE_THRESHOLD
+        return [(shape, n) for shape, n in self.shapes.most_common() if n > threshold]
+
+    def as_dict(self) -> dict:
+        return {
+            "method": self.method,
+            "path": self.path,
+            "status_code": self.status_code,
+            "started_at": self.started_at,
+            "query_count": self.query_count,
+            "db_time_ms": round(self.db_time * 1000, 2),
+            "n_plus_one": [{"statement": shape, "count": n} for shape, n in self.n_plus_one()],
+        }
+
+
+_current_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("request_query_stats", default=None)
+_recent_requests: deque = deque(maxlen=settings.SQL_STATS_HISTORY)
+
+
+def get_current_stats() -> Optional[RequestQueryStats]:
+    """Stats of the request being served on this context, if any."""
+    return _current_stats.get()
+
+
+def get_recent_requests() -> List[dict]:
+    """Rolling table of the most recent requests, newest first."""
+    return [stats.as_dict() for stats in reversed(list(_recent_requests))]
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start_time"):
+        conn.info["query_start_time"].pop()
+
+
+class QueryStatsMiddleware(BaseHTTPMiddleware):
+    """Attach per-request SQL stats to the response and the rolling table."""
+
+    async def dispatch(self, request: Request, call_next):
+        if not settings.SQL_STATS_ENABLED or request.url.path.startswith("/static"):
+            return await call_next(request)
+
+        stats = RequestQueryStats(request.method, request.url.path)
+        token = _current_stats.set(stats)
+        try:
+            response = await call_next(request)
+        finally:
+            _current_stats.reset(token)
+
+        stats.status_code = response.status_code
+        suspects = stats.n_plus_one()
+        response.headers["X-DB-Queries"] = str(stats.query_count)
+        response.headers["X-DB-Time-Ms"] = f"{stats.db_time * 1000:.2f}"
+        response.headers["X-DB-N-Plus-One"] = str(len(suspects))
+        _recent_requests.append(stats)
+
+        for shape, n in suspects:
+            logger.warning(f"Possible N+1 on {request.method} {request.url.path}: {n}x {shape[:200]}")
+        return response
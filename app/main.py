@@ -10,9 +10,10 @@ from app.core.config import settings
 from app.core.database import init_db
 from app.core.security import hash_password
 from app.core.enums import UserRole
+from app.core.query_stats import QueryStatsMiddleware
 
 # Import routers
-from app.routers import auth, dashboard, customers, vehicles, work_orders, parts, payments, backup, reports
+from app.routers import auth, dashboard, customers, vehicles, work_orders, parts, payments, backup, reports, diagnostics, search
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +64,9 @@ def create_app() -> FastAPI:
     # Session middleware
     app.add_middleware(SessionMiddleware, secret_key=settings.SECRET_KEY, max_age=settings.SESSION_MAX_AGE)
 
+    # Per-request SQL stats (X-DB-* headers, N+1 warnings)
+    app.add_middleware(QueryStatsMiddleware)
+
     # Static files
     app.mount("/static", StaticFiles(directory=str(settings.STATIC_DIR)), name="static")
 
@@ -73,7 +77,12 @@ def create_app() -> FastAPI:
     )
     app.state.templates = TemplateEngine(templates)
 
-    # Register routers
+    # Register routers. With DB_ASYNC_READS the async list/detail handlers
+    # are registered first, so they take those paths from the sync ones.
+    if settings.DB_ASYNC_READS:
+        app.include_router(customers.async_router)
+        app.include_router(vehicles.async_router)
+        app.include_router(work_orders.async_router)
     app.include_router(auth.router)
     app.include_router(dashboard.router)
     app.include_router(customers.router)
@@ -83,6 +92,8 @@ def create_app() -> FastAPI:
     app.include_router(payments.router)
     app.include_router(backup.router)
     app.include_router(reports.router)
+    app.include_router(diagnostics.router)
+    app.include_router(search.router)
 
     @app.on_event("startup")
     async def startup():
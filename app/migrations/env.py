@@ -0,0 +1,71 @@
+"""Alembic environment — runs against Settings.DATABASE_URL.
+
+When called from init_db the open connection is passed in through
+config.attributes["connection"]; from the CLI a new engine is created.
+"""
+
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import engine_from_config, pool
+
+from app.core.config import settings
+from app.core.database import Base, import_models
+
+config = context.config
+
+if config.config_file_name is not None and config.attributes.get("connection") is None:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+import_models()
+target_metadata = Base.metadata
+
+
+def include_name(name, type_, parent_names) -> bool:
+    """Keep autogenerate away from the FTS5 search indexes (0006_search_fts):
+    the virtual tables and their shadow tables are not in the metadata, so
+    they would otherwise come out as drop_table.
+    """
+    return not (type_ == "table" and "_fts" in name)
+
+
+def _configure(connection=None, url=None):
+    context.configure(
+        connection=connection,
+        url=url,
+        target_metadata=target_metadata,
+        include_name=include_name,
+        render_as_batch=True,  # SQLite needs table rebuilds for ALTER
+        literal_binds=url is not None,
+    )
+
+
+def run_migrations_offline() -> None:
+    _configure(url=settings.DATABASE_URL)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _configure(connection=connection)
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
+    connectable = engine_from_config(
+        {"sqlalchemy.url": settings.DATABASE_URL},
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+    with connectable.connect() as connection:
+        _configure(connection=connection)
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,302 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16
+
+Schema as created by Base.metadata.create_all before migrations were
+introduced. Existing databases without an alembic_version table are
+stamped with this revision instead of running it.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('customers',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('type', sa.Enum('INDIVIDUAL', 'CORPORATE', name='customertype'), nullable=False),
+    sa.Column('full_name', sa.String(length=150), nullable=False),
+    sa.Column('company_name', sa.String(length=200), nullable=True),
+    sa.Column('tax_number', sa.String(length=20), nullable=True),
+    sa.Column('tax_office', sa.String(length=100), nullable=True),
+    sa.Column('phone', sa.String(length=20), nullable=False),
+    sa.Column('email', sa.String(length=100), nullable=True),
+    sa.Column('address', sa.Text(), nullable=True),
+    sa.Column('city', sa.String(length=50), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('total_debt', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('is_deleted', sa.Boolean(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('customers', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_customers_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_customers_is_deleted'), ['is_deleted'], unique=False)
+        batch_op.create_index(batch_op.f('ix_customers_phone'), ['phone'], unique=False)
+        batch_op.create_index(batch_op.f('ix_customers_tax_number'), ['tax_number'], unique=False)
+
+    op.create_table('parts',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('stock_code', sa.String(length=50), nullable=False),
+    sa.Column('name', sa.String(length=200), nullable=False),
+    sa.Column('category', sa.String(length=100), nullable=True),
+    sa.Column('purchase_price', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('sale_price', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('stock_quantity', sa.Integer(), nullable=False),
+    sa.Column('critical_level', sa.Integer(), nullable=False),
+    sa.Column('supplier_name', sa.String(length=200), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.CheckConstraint('stock_quantity >= 0', name='ck_parts_stock_non_negative'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('parts', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_parts_category'), ['category'], unique=False)
+        batch_op.create_index(batch_op.f('ix_parts_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_parts_stock_code'), ['stock_code'], unique=True)
+
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('username', sa.String(length=50), nullable=False),
+    sa.Column('full_name', sa.String(length=100), nullable=False),
+    sa.Column('hashed_password', sa.String(length=255), nullable=False),
+    sa.Column('role', sa.Enum('ADMIN', 'TECHNICIAN', name='userrole'), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_users_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_users_username'), ['username'], unique=True)
+
+    op.create_table('audit_logs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('entity_name', sa.String(length=50), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=False),
+    sa.Column('action', sa.Enum('CREATE', 'UPDATE', 'DELETE', name='auditaction'), nullable=False),
+    sa.Column('timestamp', sa.DateTime(), nullable=False),
+    sa.Column('changes_json', sa.Text(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('audit_logs', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_audit_logs_entity_name'), ['entity_name'], unique=False)
+        batch_op.create_index(batch_op.f('ix_audit_logs_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_audit_logs_timestamp'), ['timestamp'], unique=False)
+
+    op.create_table('vehicles',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('customer_id', sa.Integer(), nullable=False),
+    sa.Column('plate_number', sa.String(length=15), nullable=False),
+    sa.Column('brand', sa.String(length=50), nullable=False),
+    sa.Column('model', sa.String(length=50), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=True),
+    sa.Column('fuel_type', sa.Enum('GASOLINE', 'DIESEL', 'LPG', 'HYBRID', 'ELECTRIC', name='fueltype'), nullable=True),
+    sa.Column('transmission_type', sa.Enum('MANUAL', 'AUTOMATIC', name='transmissiontype'), nullable=True),
+    sa.Column('chassis_number', sa.String(length=30), nullable=True),
+    sa.Column('engine_number', sa.String(length=30), nullable=True),
+    sa.Column('current_km', sa.Integer(), nullable=True),
+    sa.Column('inspection_expiry_date', sa.Date(), nullable=True),
+    sa.Column('insurance_expiry_date', sa.Date(), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('is_deleted', sa.Boolean(), nullable=False),
+    sa.ForeignKeyConstraint(['customer_id'], ['customers.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('vehicles', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_vehicles_chassis_number'), ['chassis_number'], unique=True)
+        batch_op.create_index(batch_op.f('ix_vehicles_customer_id'), ['customer_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_vehicles_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_vehicles_is_deleted'), ['is_deleted'], unique=False)
+        batch_op.create_index(batch_op.f('ix_vehicles_plate_number'), ['plate_number'], unique=True)
+
+    op.create_table('work_orders',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('work_order_number', sa.String(length=20), nullable=False),
+    sa.Column('vehicle_id', sa.Integer(), nullable=False),
+    sa.Column('customer_id', sa.Integer(), nullable=False),
+    sa.Column('technician_id', sa.Integer(), nullable=True),
+    sa.Column('complaint_description', sa.Text(), nullable=True),
+    sa.Column('internal_notes', sa.Text(), nullable=True),
+    sa.Column('km_in', sa.Integer(), nullable=True),
+    sa.Column('km_out', sa.Integer(), nullable=True),
+    sa.Column('fuel_level', sa.String(length=20), nullable=True),
+    sa.Column('status', sa.Enum('PENDING', 'APPROVED', 'IN_PROGRESS', 'COMPLETED', 'DELIVERED', 'CANCELLED', name='workorderstatus'), nullable=False),
+    sa.Column('labor_total', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('parts_total', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('discount_total', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('subtotal', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('vat_rate', sa.Numeric(precision=5, scale=2), nullable=False),
+    sa.Column('vat_total', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('grand_total', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('is_deleted', sa.Boolean(), nullable=False),
+    sa.ForeignKeyConstraint(['customer_id'], ['customers.id'], ),
+    sa.ForeignKeyConstraint(['technician_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['vehicle_id'], ['vehicles.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('work_orders', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_work_orders_customer_id'), ['customer_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_work_orders_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_work_orders_is_deleted'), ['is_deleted'], unique=False)
+        batch_op.create_index(batch_op.f('ix_work_orders_status'), ['status'], unique=False)
+        batch_op.create_index(batch_op.f('ix_work_orders_technician_id'), ['technician_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_work_orders_vehicle_id'), ['vehicle_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_work_orders_work_order_number'), ['work_order_number'], unique=True)
+
+    op.create_table('invoices',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('invoice_number', sa.String(length=30), nullable=False),
+    sa.Column('work_order_id', sa.Integer(), nullable=False),
+    sa.Column('issue_date', sa.Date(), nullable=False),
+    sa.Column('due_date', sa.Date(), nullable=True),
+    sa.Column('payment_status', sa.Enum('UNPAID', 'PARTIAL', 'PAID', name='paymentstatus'), nullable=False),
+    sa.Column('subtotal', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('vat_total', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('grand_total', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['work_order_id'], ['work_orders.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('work_order_id')
+    )
+    with op.batch_alter_table('invoices', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_invoices_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_invoices_invoice_number'), ['invoice_number'], unique=True)
+
+    op.create_table('payments',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('work_order_id', sa.Integer(), nullable=False),
+    sa.Column('amount', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('payment_method', sa.Enum('CASH', 'CARD', 'TRANSFER', name='paymentmethod'), nullable=False),
+    sa.Column('payment_date', sa.DateTime(), nullable=False),
+    sa.Column('reference_number', sa.String(length=100), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['work_order_id'], ['work_orders.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('payments', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_payments_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_payments_work_order_id'), ['work_order_id'], unique=False)
+
+    op.create_table('work_order_items',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('work_order_id', sa.Integer(), nullable=False),
+    sa.Column('type', sa.Enum('PART', 'LABOR', name='workorderitemtype'), nullable=False),
+    sa.Column('part_id', sa.Integer(), nullable=True),
+    sa.Column('description', sa.String(length=300), nullable=False),
+    sa.Column('quantity', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('unit_price', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('discount', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('vat_rate', sa.Numeric(precision=5, scale=2), nullable=False),
+    sa.Column('total_price', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['part_id'], ['parts.id'], ),
+    sa.ForeignKeyConstraint(['work_order_id'], ['work_orders.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('work_order_items', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_work_order_items_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_work_order_items_work_order_id'), ['work_order_id'], unique=False)
+
+    op.create_table('work_order_photos',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('work_order_id', sa.Integer(), nullable=False),
+    sa.Column('filename', sa.String(length=255), nullable=False),
+    sa.Column('original_filename', sa.String(length=255), nullable=False),
+    sa.Column('category', sa.Enum('BEFORE', 'AFTER', 'DAMAGE', 'OTHER', name='photocategory'), nullable=False),
+    sa.Column('caption', sa.Text(), nullable=True),
+    sa.Column('uploaded_by', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['uploaded_by'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['work_order_id'], ['work_orders.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('work_order_photos', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_work_order_photos_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_work_order_photos_work_order_id'), ['work_order_id'], unique=False)
+
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('work_order_photos', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_work_order_photos_work_order_id'))
+        batch_op.drop_index(batch_op.f('ix_work_order_photos_id'))
+
+    op.drop_table('work_order_photos')
+    with op.batch_alter_table('work_order_items', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_work_order_items_work_order_id'))
+        batch_op.drop_index(batch_op.f('ix_work_order_items_id'))
+
+    op.drop_table('work_order_items')
+    with op.batch_alter_table('payments', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_payments_work_order_id'))
+        batch_op.drop_index(batch_op.f('ix_payments_id'))
+
+    op.drop_table('payments')
+    with op.batch_alter_table('invoices', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_invoices_invoice_number'))
+        batch_op.drop_index(batch_op.f('ix_invoices_id'))
+
+    op.drop_table('invoices')
+    with op.batch_alter_table('work_orders', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_work_orders_work_order_number'))
+        batch_op.drop_index(batch_op.f('ix_work_orders_vehicle_id'))
+        batch_op.drop_index(batch_op.f('ix_work_orders_technician_id'))
+        batch_op.drop_index(batch_op.f('ix_work_orders_status'))
+        batch_op.drop_index(batch_op.f('ix_work_orders_is_deleted'))
+        batch_op.drop_index(batch_op.f('ix_work_orders_id'))
+        batch_op.drop_index(batch_op.f('ix_work_orders_customer_id'))
+
+    op.drop_table('work_orders')
+    with op.batch_alter_table('vehicles', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_vehicles_plate_number'))
+        batch_op.drop_index(batch_op.f('ix_vehicles_is_deleted'))
+        batch_op.drop_index(batch_op.f('ix_vehicles_id'))
+        batch_op.drop_index(batch_op.f('ix_vehicles_customer_id'))
+        batch_op.drop_index(batch_op.f('ix_vehicles_chassis_number'))
+
+    op.drop_table('vehicles')
+    with op.batch_alter_table('audit_logs', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_audit_logs_timestamp'))
+        batch_op.drop_index(batch_op.f('ix_audit_logs_id'))
+        batch_op.drop_index(batch_op.f('ix_audit_logs_entity_name'))
+
+    op.drop_table('audit_logs')
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_users_username'))
+        batch_op.drop_index(batch_op.f('ix_users_id'))
+
+    op.drop_table('users')
+    with op.batch_alter_table('parts', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_parts_stock_code'))
+        batch_op.drop_index(batch_op.f('ix_parts_id'))
+        batch_op.drop_index(batch_op.f('ix_parts_category'))
+
+    op.drop_table('parts')
+    with op.batch_alter_table('customers', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_customers_tax_number'))
+        batch_op.drop_index(batch_op.f('ix_customers_phone'))
+        batch_op.drop_index(batch_op.f('ix_customers_is_deleted'))
+        batch_op.drop_index(batch_op.f('ix_customers_id'))
+
+    op.drop_table('customers')
@@ -0,0 +1,66 @@
+"""query indexes
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16
+
+Composite and partial indexes matched to the repository and report queries.
+Partial indexes cover only rows with is_deleted = 0, which is what every
+list, count and revenue query filters on. They replace the single-column
+is_deleted indexes, which the planner preferred over the composite ones
+despite matching about every row.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+LIVE = {"sqlite_where": sa.text("is_deleted = 0"), "postgresql_where": sa.text("NOT is_deleted")}
+ACTIVE_PARTS = {"sqlite_where": sa.text("is_active = 1"), "postgresql_where": sa.text("is_active")}
+
+INDEXES = [
+    # WorkOrderRepository.get_all / get_by_status / get_active_orders / count_active
+    ("ix_work_orders_live_id", "work_orders", ["id"], LIVE),
+    ("ix_work_orders_live_status_id", "work_orders", ["status", "id"], LIVE),
+    # get_revenue_*, get_recent_completed and reports date ranges
+    ("ix_work_orders_live_status_completed", "work_orders", ["status", "completed_at"], LIVE),
+    # get_by_vehicle / get_by_customer
+    ("ix_work_orders_live_vehicle_id", "work_orders", ["vehicle_id", "id"], LIVE),
+    ("ix_work_orders_live_customer_id", "work_orders", ["customer_id", "id"], LIVE),
+    ("ix_customers_live_id", "customers", ["id"], LIVE),
+    ("ix_vehicles_live_id", "vehicles", ["id"], LIVE),
+    ("ix_vehicles_live_customer_id", "vehicles", ["customer_id", "id"], LIVE),
+    # PartRepository.get_all_active / get_low_stock
+    ("ix_parts_active_name", "parts", ["name"], ACTIVE_PARTS),
+    ("ix_parts_active_stock", "parts", ["stock_quantity"], ACTIVE_PARTS),
+    # PaymentRepository.get_by_work_order
+    ("ix_payments_work_order_date", "payments", ["work_order_id", "payment_date"], {}),
+    # Parts usage report
+    ("ix_work_order_items_part_id", "work_order_items", ["part_id"], {}),
+    # AuditLogRepository.get_for_entity
+    ("ix_audit_logs_entity", "audit_logs", ["entity_name", "entity_id", "timestamp"], {}),
+]
+
+
+SOFT_DELETE_TABLES = ["customers", "vehicles", "work_orders"]
+
+
+def upgrade() -> None:
+    for table in SOFT_DELETE_TABLES:
+        op.drop_index(f"ix_{table}_is_deleted", table_name=table)
+    for name, table, columns, where in INDEXES:
+        op.create_index(name, table, columns, unique=False, **where)
+
+
+def downgrade() -> None:
+    for name, table, _columns, _where in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
+    for table in SOFT_DELETE_TABLES:
+        op.create_index(f"ix_{table}_is_deleted", table, ["is_deleted"], unique=False)
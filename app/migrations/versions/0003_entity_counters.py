@@ -0,0 +1,45 @@
+"""entity counters
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16
+
+Live row counts for the list pages, maintained by BaseRepository in the
+same transaction as each write. Seeded here from the current tables; the
+"live" predicate must match each repository's _live_filter().
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+LIVE_PREDICATES = {
+    "customers": "is_deleted = 0",
+    "vehicles": "is_deleted = 0",
+    "work_orders": "is_deleted = 0",
+    "parts": "is_active = 1",
+}
+
+
+def upgrade() -> None:
+    op.create_table('entity_counters',
+    sa.Column('entity_name', sa.String(length=50), nullable=False),
+    sa.Column('live_count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('entity_name')
+    )
+    for table, predicate in LIVE_PREDICATES.items():
+        op.execute(
+            f"INSERT INTO entity_counters (entity_name, live_count) "
+            f"SELECT '{table}', COUNT(*) FROM {table} WHERE {predicate}"
+        )
+
+
+def downgrade() -> None:
+    op.drop_table('entity_counters')
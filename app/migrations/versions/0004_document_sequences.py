@@ -0,0 +1,45 @@
+"""document sequences
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16
+
+Per-prefix, per-month counters for work order (IS-) and invoice (FTR-)
+numbers. Seeded with the highest number already issued for each month so
+numbering continues where the LIKE-based lookup left off.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+NUMBERED_COLUMNS = [("work_orders", "work_order_number"), ("invoices", "invoice_number")]
+
+
+def upgrade() -> None:
+    sequences = op.create_table('document_sequences',
+    sa.Column('prefix', sa.String(length=20), nullable=False),
+    sa.Column('last_value', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('prefix')
+    )
+
+    last_values = {}
+    bind = op.get_bind()
+    for table, column in NUMBERED_COLUMNS:
+        for (number,) in bind.execute(sa.text(f"SELECT {column} FROM {table}")):
+            prefix, _, value = number.rpartition("-")
+            if prefix and value.isdigit():
+                last_values[prefix] = max(last_values.get(prefix, 0), int(value))
+    if last_values:
+        op.bulk_insert(sequences, [{"prefix": p, "last_value": v} for p, v in last_values.items()])
+
+
+def downgrade() -> None:
+    op.drop_table('document_sequences')
@@ -0,0 +1,47 @@
+"""daily revenue rollup
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16
+
+Closed work order totals per completion day and technician, rewritten by
+the work order service whenever a closed order changes. Seeded here from
+work_orders with the same aggregate as DailyRevenueRepository.rebuild().
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('daily_revenue',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('technician_id', sa.Integer(), nullable=False),
+    sa.Column('order_count', sa.Integer(), nullable=False),
+    sa.Column('labor_total', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('parts_total', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('vat_total', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('grand_total', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'technician_id')
+    )
+    # Enum columns store member names
+    op.execute(
+        "INSERT INTO daily_revenue "
+        "(day, technician_id, order_count, labor_total, parts_total, vat_total, grand_total) "
+        "SELECT DATE(completed_at), COALESCE(technician_id, 0), COUNT(*), "
+        "SUM(labor_total), SUM(parts_total), SUM(vat_total), SUM(grand_total) "
+        "FROM work_orders "
+        "WHERE is_deleted = 0 AND status IN ('COMPLETED', 'DELIVERED') AND completed_at IS NOT NULL "
+        "GROUP BY DATE(completed_at), COALESCE(technician_id, 0)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('daily_revenue')
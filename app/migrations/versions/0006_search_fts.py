@@ -0,0 +1,73 @@
+"""full-text search indexes
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-16
+
+SQLite FTS5 indexes for customer, vehicle and part search. They are
+external-content tables (the text lives only in the base table) kept in
+sync by triggers, and are filled from the existing rows here. Two- and
+three-character prefix indexes keep the first keystrokes cheap. Other
+backends skip this revision and search with ILIKE.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Base table -> indexed columns at this revision. 0007 rebuilds these
+# indexes over the search_key column alone (SearchKeyMixin, built from the
+# models' __search_words__ / __search_codes__), which is what they index now.
+FTS_COLUMNS = {
+    "customers": ["full_name", "phone", "company_name", "tax_number"],
+    "vehicles": ["plate_number", "brand", "model"],
+    "parts": ["name", "stock_code", "category"],
+}
+
+
+def _is_sqlite() -> bool:
+    return op.get_bind().dialect.name == "sqlite"
+
+
+def upgrade() -> None:
+    if not _is_sqlite():
+        return
+    for table, columns in FTS_COLUMNS.items():
+        fts = f"{table}_fts"
+        cols = ", ".join(columns)
+        new = ", ".join(f"new.{c}" for c in columns)
+        old = ", ".join(f"old.{c}" for c in columns)
+        op.execute(
+            f"CREATE VIRTUAL TABLE {fts} USING fts5({cols}, content='{table}', content_rowid='id', "
+            f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+        )
+        op.execute(
+            f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN "
+            f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END"
+        )
+        op.execute(
+            f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old}); END"
+        )
+        op.execute(
+            f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {cols} ON {table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old}); "
+            f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END"
+        )
+        op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    if not _is_sqlite():
+        return
+    for table in FTS_COLUMNS:
+        fts = f"{table}_fts"
+        for suffix in ("ai", "ad", "au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+        op.execute(f"DROP TABLE IF EXISTS {fts}")
@@ -0,0 +1,111 @@
+"""normalized search keys
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-16
+
+Adds search_key (Turkish-folded, diacritic-free text, see
+app.utils.text.build_search_key) to customers, vehicles and parts and
+fills it from the existing rows. On SQLite the FTS5 indexes from 0006 are
+rebuilt over search_key alone, so they match the same folded text.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.text import build_search_key
+
+
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Base table -> (word columns, code columns); must match the models'
+# __search_words__ / __search_codes__
+SEARCH_KEY_COLUMNS = {
+    "customers": (["full_name", "company_name"], ["phone", "tax_number"]),
+    "vehicles": (["brand", "model"], ["plate_number"]),
+    "parts": (["name", "category"], ["stock_code"]),
+}
+
+# FTS5 columns as created by 0006, restored on downgrade
+PREVIOUS_FTS_COLUMNS = {
+    "customers": ["full_name", "phone", "company_name", "tax_number"],
+    "vehicles": ["plate_number", "brand", "model"],
+    "parts": ["name", "stock_code", "category"],
+}
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _is_sqlite() -> bool:
+    return op.get_bind().dialect.name == "sqlite"
+
+
+def _drop_fts(table: str) -> None:
+    fts = f"{table}_fts"
+    for suffix in ("ai", "ad", "au"):
+        op.execute(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+    op.execute(f"DROP TABLE IF EXISTS {fts}")
+
+
+def _create_fts(table: str, columns: list) -> None:
+    """External-content FTS5 index over columns, kept in sync by triggers."""
+    fts = f"{table}_fts"
+    cols = ", ".join(columns)
+    new = ", ".join(f"new.{c}" for c in columns)
+    old = ", ".join(f"old.{c}" for c in columns)
+    op.execute(
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({cols}, content='{table}', content_rowid='id', "
+        f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+    )
+    op.execute(
+        f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END"
+    )
+    op.execute(
+        f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old}); END"
+    )
+    op.execute(
+        f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {cols} ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old}); "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END"
+    )
+    op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def _backfill(table: str, words: list, codes: list) -> None:
+    bind = op.get_bind()
+    rows = bind.execute(sa.text(f"SELECT id, {', '.join(words + codes)} FROM {table}")).fetchall()
+    update = sa.text(f"UPDATE {table} SET search_key = :key WHERE id = :id")
+    for offset in range(0, len(rows), BACKFILL_BATCH_SIZE):
+        bind.execute(update, [
+            {"id": row[0], "key": build_search_key(row[1:len(words) + 1], row[len(words) + 1:])}
+            for row in rows[offset:offset + BACKFILL_BATCH_SIZE]
+        ])
+
+
+def upgrade() -> None:
+    sqlite = _is_sqlite()
+    for table, (words, codes) in SEARCH_KEY_COLUMNS.items():
+        if sqlite:
+            # The 0006 triggers reference the table; drop them before it changes
+            _drop_fts(table)
+        op.add_column(table, sa.Column('search_key', sa.Text(), nullable=True))
+        _backfill(table, words, codes)
+        if sqlite:
+            _create_fts(table, ["search_key"])
+
+
+def downgrade() -> None:
+    sqlite = _is_sqlite()
+    for table, columns in PREVIOUS_FTS_COLUMNS.items():
+        if sqlite:
+            _drop_fts(table)
+        op.drop_column(table, 'search_key')
+        if sqlite:
+            _create_fts(table, columns)
@@ -0,0 +1,73 @@
+"""canonical plate keys
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-16
+
+Adds plate_key (plate without spacing, uppercased, see
+app.utils.text.plate_key) with a unique index and its reverse,
+plate_key_rev, with a partial index for last-characters lookups. Existing
+rows are backfilled; if two plates differ only in spacing, the live (then
+oldest) vehicle gets the key and the others are left NULL and logged.
+`python -m app.utils.maintenance check-plates` lists them until the
+duplicates are corrected.
+"""
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.text import plate_key
+
+
+revision: str = '0008'
+down_revision: Union[str, None] = '0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    op.add_column('vehicles', sa.Column('plate_key', sa.String(length=15), nullable=True))
+    op.add_column('vehicles', sa.Column('plate_key_rev', sa.String(length=15), nullable=True))
+
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT id, plate_number FROM vehicles ORDER BY is_deleted, id")).fetchall()
+    taken = set()
+    params = []
+    duplicates = 0
+    for vehicle_id, plate_number in rows:
+        key = plate_key(plate_number)
+        if not key:
+            continue
+        if key in taken:
+            logger.warning("Vehicle %s: plate %r duplicates another vehicle's plate key, left unset",
+                           vehicle_id, plate_number)
+            duplicates += 1
+            continue
+        taken.add(key)
+        params.append({"id": vehicle_id, "key": key, "rev": key[::-1]})
+    if duplicates:
+        logger.warning("%d vehicle(s) share a plate with another vehicle; run "
+                       "'python -m app.utils.maintenance check-plates' and correct them", duplicates)
+    update = sa.text("UPDATE vehicles SET plate_key = :key, plate_key_rev = :rev WHERE id = :id")
+    for offset in range(0, len(params), BACKFILL_BATCH_SIZE):
+        bind.execute(update, params[offset:offset + BACKFILL_BATCH_SIZE])
+
+    op.create_index('ix_vehicles_plate_key', 'vehicles', ['plate_key'], unique=True)
+    op.create_index(
+        'ix_vehicles_live_plate_key_rev', 'vehicles', ['plate_key_rev'],
+        sqlite_where=sa.text("is_deleted = 0"), postgresql_where=sa.text("NOT is_deleted"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_vehicles_live_plate_key_rev', table_name='vehicles')
+    op.drop_index('ix_vehicles_plate_key', table_name='vehicles')
+    op.drop_column('vehicles', 'plate_key_rev')
+    op.drop_column('vehicles', 'plate_key')
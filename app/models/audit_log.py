@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum as SAEnum, func
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, Enum as SAEnum, func
 
 from app.core.database import Base
 from app.core.enums import AuditAction
@@ -14,3 +14,7 @@ class AuditLog(Base):
     action = Column(SAEnum(AuditAction), nullable=False)
     timestamp = Column(DateTime, default=func.now(), nullable=False, index=True)
     changes_json = Column(Text, nullable=True)
+
+    __table_args__ = (
+        Index("ix_audit_logs_entity", "entity_name", "entity_id", "timestamp"),
+    )
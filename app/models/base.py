@@ -1,6 +1,15 @@
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Boolean, func
+from sqlalchemy import Column, DateTime, Boolean, Index, Text, event, func, text
+
+from app.core.config import settings
+from app.utils.text import build_search_key
+
+# Loader strategy for every relationship. Repository queries load what their
+# view renders with joinedload/selectinload options; anything else is loaded
+# on first access, or raises in DEBUG so a missing option (an N+1 in a
+# template loop) fails loudly during development.
+RELATIONSHIP_LAZY = "raise_on_sql" if settings.DEBUG else "select"
 
 
 class TimestampMixin:
@@ -10,5 +19,44 @@ class TimestampMixin:
 
 
 class SoftDeleteMixin:
-    """Mixin that adds soft delete support."""
-    is_deleted = Column(Boolean, default=False, nullable=False, index=True)
+    """Mixin that adds soft delete support.
+
+    Not indexed on its own: queries use the partial live_index() indexes
+    declared on each table instead.
+    """
+    is_deleted = Column(Boolean, default=False, nullable=False)
+
+
+def live_index(name: str, *columns: str) -> Index:
+    """Partial index over rows that are not soft-deleted (is_deleted = 0)."""
+    return Index(
+        name,
+        *columns,
+        sqlite_where=text("is_deleted = 0"),
+        postgresql_where=text("NOT is_deleted"),
+    )
+
+
+class SearchKeyMixin:
+    """Mixin that adds search_key, the Turkish-folded text search matches against.
+
+    Subclasses list the columns in __search_words__ (names, free text) and
+    __search_codes__ (phones, plates, codes; also stored without spacing).
+    The key is rebuilt whenever a row is inserted or updated through the ORM.
+    """
+    __search_words__: tuple = ()
+    __search_codes__: tuple = ()
+
+    search_key = Column(Text, nullable=True)
+
+    def refresh_search_key(self) -> None:
+        self.search_key = build_search_key(
+            (getattr(self, name) for name in self.__search_words__),
+            (getattr(self, name) for name in self.__search_codes__),
+        )
+
+
+@event.listens_for(SearchKeyMixin, "before_insert", propagate=True)
+@event.listens_for(SearchKeyMixin, "before_update", propagate=True)
+def _refresh_search_key(mapper, connection, target):
+    target.refresh_search_key()
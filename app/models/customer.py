@@ -3,11 +3,13 @@ from sqlalchemy.orm import relationship
 
 from app.core.database import Base
 from app.core.enums import CustomerType
-from app.models.base import TimestampMixin, SoftDeleteMixin
+from app.models.base import RELATIONSHIP_LAZY, TimestampMixin, SoftDeleteMixin, SearchKeyMixin, live_index
 
 
-class Customer(Base, TimestampMixin, SoftDeleteMixin):
+class Customer(Base, TimestampMixin, SoftDeleteMixin, SearchKeyMixin):
     __tablename__ = "customers"
+    __search_words__ = ("full_name", "company_name")
+    __search_codes__ = ("phone", "tax_number")
 
     id = Column(Integer, primary_key=True, index=True)
     type = Column(SAEnum(CustomerType), default=CustomerType.INDIVIDUAL, nullable=False)
@@ -23,5 +25,9 @@ class Customer(Base, TimestampMixin, SoftDeleteMixin):
     total_debt = Column(Numeric(12, 2), default=0, nullable=False)
 
     # Relationships
-    vehicles = relationship("Vehicle", back_populates="customer", lazy="selectin")
+    vehicles = relationship("Vehicle", back_populates="customer", lazy=RELATIONSHIP_LAZY)
     work_orders = relationship("WorkOrder", back_populates="customer", lazy="dynamic")
+
+    __table_args__ = (
+        live_index("ix_customers_live_id", "id"),
+    )
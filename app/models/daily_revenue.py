@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Date, Integer, Numeric
+
+from app.core.database import Base
+
+# technician_id value for orders without an assigned technician
+NO_TECHNICIAN = 0
+
+
+class DailyRevenue(Base):
+    """Closed (completed or delivered) work order totals per completion day and technician.
+
+    Rows are derived from work_orders and rewritten by
+    DailyRevenueRepository.refresh_day() in the same transaction as the
+    write that changed them.
+    """
+
+    __tablename__ = "daily_revenue"
+
+    day = Column(Date, primary_key=True)
+    # Not a foreign key: NO_TECHNICIAN stands in for "unassigned"
+    technician_id = Column(Integer, primary_key=True, default=NO_TECHNICIAN)
+    order_count = Column(Integer, default=0, nullable=False)
+    labor_total = Column(Numeric(12, 2), default=0, nullable=False)
+    parts_total = Column(Numeric(12, 2), default=0, nullable=False)
+    vat_total = Column(Numeric(12, 2), default=0, nullable=False)
+    grand_total = Column(Numeric(12, 2), default=0, nullable=False)
@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Integer, String
+
+from app.core.database import Base
+
+
+class DocumentSequence(Base):
+    """Last number handed out per document prefix and month (e.g. "IS-202610")."""
+
+    __tablename__ = "document_sequences"
+
+    prefix = Column(String(20), primary_key=True)
+    last_value = Column(Integer, default=0, nullable=False)
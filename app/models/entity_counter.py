@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Integer, String
+
+from app.core.database import Base
+
+
+class EntityCounter(Base):
+    """Live row count per table, kept in step by BaseRepository writes."""
+
+    __tablename__ = "entity_counters"
+
+    entity_name = Column(String(50), primary_key=True)
+    live_count = Column(Integer, default=0, nullable=False)
@@ -3,6 +3,7 @@ from sqlalchemy.orm import relationship
 
 from app.core.database import Base
 from app.core.enums import PaymentStatus
+from app.models.base import RELATIONSHIP_LAZY
 
 
 class Invoice(Base):
@@ -20,4 +21,4 @@ class Invoice(Base):
     created_at = Column(DateTime, default=func.now(), nullable=False)
 
     # Relationships
-    work_order = relationship("WorkOrder", back_populates="invoice")
+    work_order = relationship("WorkOrder", back_populates="invoice", lazy=RELATIONSHIP_LAZY)
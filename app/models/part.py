@@ -1,11 +1,13 @@
-from sqlalchemy import Column, Integer, String, Numeric, Boolean, CheckConstraint
+from sqlalchemy import Column, Integer, String, Numeric, Boolean, CheckConstraint, Index, text
 
 from app.core.database import Base
-from app.models.base import TimestampMixin
+from app.models.base import TimestampMixin, SearchKeyMixin
 
 
-class Part(Base, TimestampMixin):
+class Part(Base, TimestampMixin, SearchKeyMixin):
     __tablename__ = "parts"
+    __search_words__ = ("name", "category")
+    __search_codes__ = ("stock_code",)
 
     id = Column(Integer, primary_key=True, index=True)
     stock_code = Column(String(50), unique=True, nullable=False, index=True)
@@ -20,4 +22,7 @@ class Part(Base, TimestampMixin):
 
     __table_args__ = (
         CheckConstraint("stock_quantity >= 0", name="ck_parts_stock_non_negative"),
+        # Active part list (ordered by name) and low-stock alerts
+        Index("ix_parts_active_name", "name", sqlite_where=text("is_active = 1"), postgresql_where=text("is_active")),
+        Index("ix_parts_active_stock", "stock_quantity", sqlite_where=text("is_active = 1"), postgresql_where=text("is_active")),
     )
@@ -1,8 +1,9 @@
-from sqlalchemy import Column, Integer, String, Numeric, DateTime, ForeignKey, Enum as SAEnum, func
+from sqlalchemy import Column, Integer, String, Numeric, DateTime, ForeignKey, Index, Enum as SAEnum, func
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
 from app.core.enums import PaymentMethod
+from app.models.base import RELATIONSHIP_LAZY
 
 
 class Payment(Base):
@@ -17,4 +18,8 @@ class Payment(Base):
     created_at = Column(DateTime, default=func.now(), nullable=False)
 
     # Relationships
-    work_order = relationship("WorkOrder", back_populates="payments")
+    work_order = relationship("WorkOrder", back_populates="payments", lazy=RELATIONSHIP_LAZY)
+
+    __table_args__ = (
+        Index("ix_payments_work_order_date", "work_order_id", "payment_date"),
+    )
@@ -1,17 +1,24 @@
-from sqlalchemy import Column, Integer, String, Text, Date, ForeignKey, Enum as SAEnum
+from sqlalchemy import Column, Integer, String, Text, Date, ForeignKey, Enum as SAEnum, event, inspect
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
 from app.core.enums import FuelType, TransmissionType
-from app.models.base import TimestampMixin, SoftDeleteMixin
+from app.models.base import RELATIONSHIP_LAZY, TimestampMixin, SoftDeleteMixin, SearchKeyMixin, live_index
+from app.utils.text import plate_key
 
 
-class Vehicle(Base, TimestampMixin, SoftDeleteMixin):
+class Vehicle(Base, TimestampMixin, SoftDeleteMixin, SearchKeyMixin):
     __tablename__ = "vehicles"
+    __search_words__ = ("brand", "model")
+    __search_codes__ = ("plate_number",)
 
     id = Column(Integer, primary_key=True, index=True)
     customer_id = Column(Integer, ForeignKey("customers.id"), nullable=False, index=True)
     plate_number = Column(String(15), unique=True, nullable=False, index=True)
+    # plate_key(plate_number) and its reverse, for exact/prefix and
+    # last-characters lookups as index range scans
+    plate_key = Column(String(15), unique=True, nullable=True, index=True)
+    plate_key_rev = Column(String(15), nullable=True)
     brand = Column(String(50), nullable=False)
     model = Column(String(50), nullable=False)
     year = Column(Integer, nullable=True)
@@ -25,5 +32,30 @@ class Vehicle(Base, TimestampMixin, SoftDeleteMixin):
     notes = Column(Text, nullable=True)
 
     # Relationships
-    customer = relationship("Customer", back_populates="vehicles")
+    customer = relationship("Customer", back_populates="vehicles", lazy=RELATIONSHIP_LAZY)
     work_orders = relationship("WorkOrder", back_populates="vehicle", lazy="dynamic")
+
+    __table_args__ = (
+        live_index("ix_vehicles_live_id", "id"),
+        live_index("ix_vehicles_live_customer_id", "customer_id", "id"),
+        live_index("ix_vehicles_live_plate_key_rev", "plate_key_rev"),
+    )
+
+
+@event.listens_for(Vehicle, "before_insert")
+def _set_plate_key(mapper, connection, target):
+    _refresh_plate_key(target)
+
+
+@event.listens_for(Vehicle, "before_update")
+def _update_plate_key(mapper, connection, target):
+    # Only when the plate itself changed: a vehicle whose key was left unset
+    # by migration 0008 (see check-plates) must stay editable.
+    if inspect(target).attrs.plate_number.history.has_changes():
+        _refresh_plate_key(target)
+
+
+def _refresh_plate_key(target):
+    key = plate_key(target.plate_number)
+    target.plate_key = key or None
+    target.plate_key_rev = key[::-1] or None
@@ -3,7 +3,7 @@ from sqlalchemy.orm import relationship
 
 from app.core.database import Base
 from app.core.enums import WorkOrderStatus
-from app.models.base import TimestampMixin, SoftDeleteMixin
+from app.models.base import RELATIONSHIP_LAZY, TimestampMixin, SoftDeleteMixin, live_index
 
 
 class WorkOrder(Base, TimestampMixin, SoftDeleteMixin):
@@ -40,9 +40,22 @@ class WorkOrder(Base, TimestampMixin, SoftDeleteMixin):
     completed_at = Column(DateTime, nullable=True)
 
     # Relationships
-    vehicle = relationship("Vehicle", back_populates="work_orders")
-    customer = relationship("Customer", back_populates="work_orders")
-    technician = relationship("User", foreign_keys=[technician_id])
-    items = relationship("WorkOrderItem", back_populates="work_order", cascade="all, delete-orphan", lazy="selectin")
-    payments = relationship("Payment", back_populates="work_order", lazy="selectin")
-    invoice = relationship("Invoice", back_populates="work_order", uselist=False)
+    vehicle = relationship("Vehicle", back_populates="work_orders", lazy=RELATIONSHIP_LAZY)
+    customer = relationship("Customer", back_populates="work_orders", lazy=RELATIONSHIP_LAZY)
+    technician = relationship("User", foreign_keys=[technician_id], lazy=RELATIONSHIP_LAZY)
+    items = relationship(
+        "WorkOrderItem", back_populates="work_order", cascade="all, delete-orphan", lazy=RELATIONSHIP_LAZY
+    )
+    payments = relationship("Payment", back_populates="work_order", lazy=RELATIONSHIP_LAZY)
+    invoice = relationship("Invoice", back_populates="work_order", uselist=False, lazy=RELATIONSHIP_LAZY)
+
+    __table_args__ = (
+        # List pages (get_all) and per-status lists / active counts
+        live_index("ix_work_orders_live_id", "id"),
+        live_index("ix_work_orders_live_status_id", "status", "id"),
+        # Revenue, recent completed and report date ranges
+        live_index("ix_work_orders_live_status_completed", "status", "completed_at"),
+        # Vehicle and customer detail pages
+        live_index("ix_work_orders_live_vehicle_id", "vehicle_id", "id"),
+        live_index("ix_work_orders_live_customer_id", "customer_id", "id"),
+    )
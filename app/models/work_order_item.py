@@ -1,9 +1,9 @@
-from sqlalchemy import Column, Integer, String, Numeric, ForeignKey, Enum as SAEnum
+from sqlalchemy import Column, Integer, String, Numeric, ForeignKey, Index, Enum as SAEnum
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
 from app.core.enums import WorkOrderItemType
-from app.models.base import TimestampMixin
+from app.models.base import RELATIONSHIP_LAZY, TimestampMixin
 
 
 class WorkOrderItem(Base, TimestampMixin):
@@ -22,5 +22,10 @@ class WorkOrderItem(Base, TimestampMixin):
     total_price = Column(Numeric(12, 2), default=0, nullable=False)
 
     # Relationships
-    work_order = relationship("WorkOrder", back_populates="items")
-    part = relationship("Part")
+    work_order = relationship("WorkOrder", back_populates="items", lazy=RELATIONSHIP_LAZY)
+    part = relationship("Part", lazy=RELATIONSHIP_LAZY)
+
+    __table_args__ = (
+        # Parts usage report joins items to parts
+        Index("ix_work_order_items_part_id", "part_id"),
+    )
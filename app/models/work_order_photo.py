@@ -1,9 +1,9 @@
 from sqlalchemy import Column, Integer, String, Text, ForeignKey, Enum as SAEnum
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import backref, relationship
 
 from app.core.database import Base
 from app.core.enums import PhotoCategory
-from app.models.base import TimestampMixin
+from app.models.base import RELATIONSHIP_LAZY, TimestampMixin
 
 
 class WorkOrderPhoto(Base, TimestampMixin):
@@ -18,5 +18,7 @@ class WorkOrderPhoto(Base, TimestampMixin):
     uploaded_by = Column(Integer, ForeignKey("users.id"), nullable=True)
 
     # Relationships
-    work_order = relationship("WorkOrder", backref="photos")
-    uploader = relationship("User", foreign_keys=[uploaded_by])
+    work_order = relationship(
+        "WorkOrder", backref=backref("photos", lazy=RELATIONSHIP_LAZY), lazy=RELATIONSHIP_LAZY
+    )
+    uploader = relationship("User", foreign_keys=[uploaded_by], lazy=RELATIONSHIP_LAZY)
@@ -1,6 +1,7 @@
 import json
 from sqlalchemy.orm import Session
 
+from app.core.database import commit_or_flush
 from app.models.audit_log import AuditLog
 from app.core.enums import AuditAction
 
@@ -25,7 +26,7 @@ class AuditLogRepository:
             changes_json=json.dumps(changes, default=str) if changes else None,
         )
         self.db.add(audit)
-        self.db.commit()
+        commit_or_flush(self.db)
         return audit
 
     def get_for_entity(self, entity_name: str, entity_id: int):
@@ -1,6 +1,17 @@
-from typing import TypeVar, Generic, Type, Optional, List
+from typing import Callable, TypeVar, Generic, Type, Optional, List
+from sqlalchemy import Float, Integer, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.core.database import Base
+from app.core.database import Base, commit_or_flush
+from app.models.entity_counter import EntityCounter
+from app.repositories.entity_counter_repo import EntityCounterRepository
+from app.utils.cache import invalidate_on_commit
+from app.utils.pagination import OffsetPage, Page, keyset_paginate, keyset_paginate_async, NEXT
+from app.utils.search import (
+    FTS_RANK_LIMIT, fts_match_count, fts_match_expression, has_fts_table, search_count_cache,
+    typeahead_cache,
+)
+from app.utils.text import fold_text
 
 ModelType = TypeVar("ModelType", bound=Base)
 
@@ -8,9 +19,160 @@ ModelType = TypeVar("ModelType", bound=Base)
 class BaseRepository(Generic[ModelType]):
     """Generic repository with CRUD, soft-delete, pagination, and filtering."""
 
+    # Repositories behind the list pages set this so count() reads the
+    # entity_counters row instead of running COUNT(*) on every page view.
+    counted: bool = False
+
+    # search() matches the model's search_key (see SearchKeyMixin). On
+    # SQLite, fts_table names the FTS5 index over that column (kept in sync
+    # by triggers); without it search() falls back to LIKE '%term%'.
+    fts_table: Optional[str] = None
+
     def __init__(self, model: Type[ModelType], db: Session):
         self.model = model
         self.db = db
+        self.counters = EntityCounterRepository(db)
+
+    def list_options(self) -> tuple:
+        """Loader options for the rows list pages render (get_all, get_page,
+        search), e.g. joinedload() of a parent shown in every row.
+        Relationships are not loaded eagerly by default (see RELATIONSHIP_LAZY).
+        """
+        return ()
+
+    def _live_filter(self, query):
+        """Restrict a query to the rows count() reports."""
+        if hasattr(self.model, "is_deleted"):
+            query = query.filter(self.model.is_deleted == False)  # noqa: E712
+        return query
+
+    def _is_live(self, db_obj: ModelType) -> bool:
+        return not getattr(db_obj, "is_deleted", False)
+
+    def _adjust_counter(self, delta: int) -> None:
+        """Apply a live-count change inside the caller's transaction."""
+        if not self.counted or not delta:
+            return
+        if not self.counters.adjust(self.model.__tablename__, delta):
+            # Counter row missing: seed it from the (already flushed) table.
+            self.counters.set(self.model.__tablename__, self.count_live_rows())
+
+    def count_live_rows(self) -> int:
+        """COUNT(*) of live rows, bypassing the counter table."""
+        return self._live_filter(self.db.query(self.model)).count()
+
+    def rebuild_counter(self) -> tuple:
+        """Recount live rows and overwrite the counter; returns (stored, actual)."""
+        stored = self.counters.get(self.model.__tablename__)
+        actual = self.count_live_rows()
+        if stored != actual:
+            self.counters.set(self.model.__tablename__, actual)
+        commit_or_flush(self.db)
+        return stored, actual
+
+    def _uses_fts(self, match: Optional[str]) -> bool:
+        return bool(match and self.fts_table and has_fts_table(self.db, self.fts_table))
+
+    def search(self, query: str, skip: int = 0, limit: int = 50) -> List[ModelType]:
+        """Live rows whose search_key matches query.
+
+        The query is folded like the key (fold_text), so "ŞAHİN" finds
+        "Şahin" and "sahin". With an FTS5 index every word must match the
+        start of a word in the key, and results are ranked by bm25 (newest
+        first when there are more than FTS_RANK_LIMIT matches). Otherwise a
+        key containing the whole folded input matches, newest first.
+        """
+        folded = fold_text(query)
+        if not folded:
+            # Nothing left to match on; LIKE '%%' would return every row
+            return []
+        match = fts_match_expression(folded)
+        rows = self.db.query(self.model).options(*self.list_options())
+        if self._uses_fts(match):
+            hits = (
+                text(f"SELECT rowid, rank FROM {self.fts_table} WHERE {self.fts_table} MATCH :match")
+                .bindparams(match=match)
+                .columns(rowid=Integer, rank=Float)
+                .subquery()
+            )
+            rows = rows.join(hits, self.model.id == hits.c.rowid)
+            if fts_match_count(self.db, self.fts_table, match, FTS_RANK_LIMIT + 1) > FTS_RANK_LIMIT:
+                order = (hits.c.rowid.desc(),)
+            else:
+                order = (hits.c.rank, hits.c.rowid.desc())
+        else:
+            rows = rows.filter(self.model.search_key.like(f"%{folded}%"))
+            order = (self.model.id.desc(),)
+        return self._live_filter(rows).order_by(*order).offset(skip).limit(limit).all()
+
+    def count_search(self, query: str) -> int:
+        """Number of live rows search() finds for query.
+
+        Counts ids only (no ranking, no row loading) and is cached per
+        query until this table changes, so paging costs one count.
+        """
+        folded = fold_text(query)
+        if not folded:
+            return 0
+        match = fts_match_expression(folded)
+
+        def load() -> int:
+            rows = self.db.query(func.count()).select_from(self.model)
+            if self._uses_fts(match):
+                hits = (
+                    text(f"SELECT rowid FROM {self.fts_table} WHERE {self.fts_table} MATCH :match")
+                    .bindparams(match=match)
+                    .columns(rowid=Integer)
+                    .subquery()
+                )
+                rows = rows.join(hits, self.model.id == hits.c.rowid)
+            else:
+                rows = rows.filter(self.model.search_key.like(f"%{folded}%"))
+            return self._live_filter(rows).scalar()
+
+        return self.cached_count("search", folded, load)
+
+    def cached_count(self, kind: str, key: str, loader: Callable[[], int]) -> int:
+        """Count from search_count_cache, computed by loader on a miss."""
+        return search_count_cache.get_or_set((self.model.__tablename__, kind, key), loader)
+
+    def _invalidate_search_caches(self) -> None:
+        """Drop this table's search totals and typeahead results after commit."""
+        if hasattr(self.model, "search_key"):
+            for cache in (search_count_cache, typeahead_cache):
+                invalidate_on_commit(self.db, cache, self.model.__tablename__)
+
+    def search_page(self, query: str, page: int = 1, per_page: int = 20) -> OffsetPage:
+        """One page of search() results plus the (cached) total."""
+        total = self.count_search(query)
+        result = OffsetPage(total=total, per_page=per_page)
+        result.page = min(page, result.total_pages)
+        if total:
+            result.items = self.search(query, skip=(result.page - 1) * per_page, limit=per_page)
+        return result
+
+    def rebuild_search_keys(self) -> int:
+        """Recompute search_key for every row; returns how many changed.
+
+        Rows written through the ORM keep their key current; this repairs
+        rows imported or edited with plain SQL.
+        """
+        changed = 0
+        for db_obj in self.db.query(self.model).yield_per(1000):
+            old_key = db_obj.search_key
+            db_obj.refresh_search_key()
+            changed += db_obj.search_key != old_key
+        self._invalidate_search_caches()
+        commit_or_flush(self.db)
+        return changed
+
+    def rebuild_search_index(self) -> bool:
+        """Repopulate the FTS5 index from the base table; False if there is none."""
+        if not self.fts_table or not has_fts_table(self.db, self.fts_table):
+            return False
+        self.db.execute(text(f"INSERT INTO {self.fts_table}({self.fts_table}) VALUES ('rebuild')"))
+        commit_or_flush(self.db)
+        return True
 
     def get_by_id(self, id: int) -> Optional[ModelType]:
         return self.db.query(self.model).filter(self.model.id == id).first()
@@ -28,39 +190,114 @@ class BaseRepository(Generic[ModelType]):
         limit: int = 100,
         include_deleted: bool = False,
     ) -> List[ModelType]:
-        query = self.db.query(self.model)
+        query = self.db.query(self.model).options(*self.list_options())
         if not include_deleted and hasattr(self.model, "is_deleted"):
             query = query.filter(self.model.is_deleted == False)  # noqa: E712
         return query.order_by(self.model.id.desc()).offset(skip).limit(limit).all()
 
-    def count(self, include_deleted: bool = False) -> int:
-        query = self.db.query(self.model)
+    def get_page(
+        self,
+        cursor: Optional[str] = None,
+        direction: str = NEXT,
+        limit: int = 20,
+        include_deleted: bool = False,
+    ) -> Page:
+        """Keyset-paginated listing, newest first; cost does not grow with depth."""
+        query = self.db.query(self.model).options(*self.list_options())
         if not include_deleted and hasattr(self.model, "is_deleted"):
             query = query.filter(self.model.is_deleted == False)  # noqa: E712
-        return query.count()
+        return keyset_paginate(query, (self.model.id,), cursor=cursor, direction=direction, limit=limit)
+
+    def count(self, include_deleted: bool = False) -> int:
+        if include_deleted:
+            return self.db.query(self.model).count()
+        if self.counted:
+            stored = self.counters.get(self.model.__tablename__)
+            if stored is not None:
+                return stored
+        return self.count_live_rows()
 
     def create(self, obj_data: dict) -> ModelType:
         db_obj = self.model(**obj_data)
         self.db.add(db_obj)
-        self.db.commit()
-        self.db.refresh(db_obj)
+        self.db.flush()
+        self._adjust_counter(int(self._is_live(db_obj)))
+        self._invalidate_search_caches()
+        commit_or_flush(self.db, db_obj)
         return db_obj
 
     def update(self, db_obj: ModelType, obj_data: dict) -> ModelType:
+        was_live = self._is_live(db_obj)
         for key, value in obj_data.items():
             if hasattr(db_obj, key):
                 setattr(db_obj, key, value)
-        self.db.commit()
-        self.db.refresh(db_obj)
+        self.db.flush()
+        self._adjust_counter(int(self._is_live(db_obj)) - int(was_live))
+        self._invalidate_search_caches()
+        commit_or_flush(self.db, db_obj)
         return db_obj
 
     def soft_delete(self, db_obj: ModelType) -> ModelType:
         if hasattr(db_obj, "is_deleted"):
+            was_live = self._is_live(db_obj)
             db_obj.is_deleted = True
-            self.db.commit()
-            self.db.refresh(db_obj)
+            self.db.flush()
+            self._adjust_counter(-int(was_live))
+            self._invalidate_search_caches()
+            commit_or_flush(self.db, db_obj)
         return db_obj
 
     def hard_delete(self, db_obj: ModelType) -> None:
+        was_live = self._is_live(db_obj)
         self.db.delete(db_obj)
-        self.db.commit()
+        self.db.flush()
+        self._adjust_counter(-int(was_live))
+        self._invalidate_search_caches()
+        commit_or_flush(self.db)
+
+
+
+class AsyncBaseRepository(Generic[ModelType]):
+    """Read-only counterpart of BaseRepository for handlers on get_async_db.
+
+    Only the reads behind the list and detail pages are here. Writes keep
+    going through BaseRepository, which maintains entity_counters and drops
+    the search caches; the async engine is query_only and would refuse them.
+    Subclasses share list_options() with their sync repository.
+    """
+
+    counted: bool = False
+
+    def __init__(self, model: Type[ModelType], db: AsyncSession):
+        self.model = model
+        self.db = db
+
+    def list_options(self) -> tuple:
+        return ()
+
+    def _live_filter(self, stmt):
+        if hasattr(self.model, "is_deleted"):
+            stmt = stmt.where(self.model.is_deleted == False)  # noqa: E712
+        return stmt
+
+    async def get_active_by_id(self, id: int) -> Optional[ModelType]:
+        stmt = self._live_filter(select(self.model).where(self.model.id == id))
+        return (await self.db.execute(stmt)).scalars().first()
+
+    async def get_page(self, cursor: Optional[str] = None, direction: str = NEXT, limit: int = 20) -> Page:
+        """Keyset-paginated live rows, newest first, like BaseRepository.get_page."""
+        stmt = self._live_filter(select(self.model).options(*self.list_options()))
+        return await keyset_paginate_async(
+            self.db, stmt, (self.model.id,), cursor=cursor, direction=direction, limit=limit
+        )
+
+    async def count(self) -> int:
+        """Live rows from entity_counters, or COUNT(*) if the table has no counter."""
+        if self.counted:
+            stored = (await self.db.execute(
+                select(EntityCounter.live_count).where(EntityCounter.entity_name == self.model.__tablename__)
+            )).scalar()
+            if stored is not None:
+                return stored
+        stmt = self._live_filter(select(func.count()).select_from(self.model))
+        return (await self.db.execute(stmt)).scalar_one()
@@ -1,37 +1,35 @@
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
 
 from app.models.customer import Customer
-from app.repositories.base import BaseRepository
+from app.repositories.base import AsyncBaseRepository, BaseRepository
 
 
 class CustomerRepository(BaseRepository[Customer]):
+    counted = True
+    fts_table = "customers_fts"
+
     def __init__(self, db: Session):
         super().__init__(Customer, db)
 
-    def search(self, query: str, skip: int = 0, limit: int = 50) -> List[Customer]:
-        search_term = f"%{query}%"
-        return (
-            self.db.query(Customer)
-            .filter(Customer.is_deleted == False)  # noqa: E712
-            .filter(
-                or_(
-                    Customer.full_name.ilike(search_term),
-                    Customer.phone.ilike(search_term),
-                    Customer.company_name.ilike(search_term),
-                    Customer.tax_number.ilike(search_term),
-                )
-            )
-            .order_by(Customer.id.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
-
     def get_by_phone(self, phone: str) -> Optional[Customer]:
         return (
             self.db.query(Customer)
             .filter(Customer.phone == phone, Customer.is_deleted == False)  # noqa: E712
             .first()
         )
+
+    def get_names(self, ids: Iterable[int]) -> List[Tuple[int, str]]:
+        """(id, full_name) for the given customers, in one query."""
+        ids = list(ids)
+        if not ids:
+            return []
+        return self.db.query(Customer.id, Customer.full_name).filter(Customer.id.in_(ids)).all()
+
+
+class AsyncCustomerRepository(AsyncBaseRepository[Customer]):
+    counted = True
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(Customer, db)
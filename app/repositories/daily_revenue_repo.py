@@ -0,0 +1,116 @@
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Dict, List, Tuple
+from sqlalchemy import Date, delete, func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from app.core.database import commit_or_flush
+from app.core.enums import WorkOrderStatus
+from app.models.daily_revenue import DailyRevenue, NO_TECHNICIAN
+from app.models.work_order import WorkOrder
+
+# Statuses whose orders count as revenue, dated by completed_at
+CLOSED_STATUSES = [WorkOrderStatus.COMPLETED, WorkOrderStatus.DELIVERED]
+
+ROLLUP_FIELDS = ["order_count", "labor_total", "parts_total", "vat_total", "grand_total"]
+
+
+def month_bounds(day: date) -> Tuple[date, date]:
+    """First day of day's month and first day of the next one (half-open)."""
+    start = day.replace(day=1)
+    return start, (start + timedelta(days=32)).replace(day=1)
+
+
+class DailyRevenueRepository:
+    """daily_revenue rollup: one row per completion day and technician."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _aggregate(self, day_expr, *criteria):
+        """SELECT of rollup rows computed from work_orders, grouped by day_expr and technician."""
+        technician = func.coalesce(WorkOrder.technician_id, NO_TECHNICIAN)
+        return (
+            select(
+                day_expr.label("day"),
+                technician.label("technician_id"),
+                func.count().label("order_count"),
+                *[
+                    func.coalesce(func.sum(getattr(WorkOrder, field)), 0).label(field)
+                    for field in ROLLUP_FIELDS[1:]
+                ],
+            )
+            .where(
+                WorkOrder.is_deleted == False,  # noqa: E712
+                WorkOrder.status.in_(CLOSED_STATUSES),
+                WorkOrder.completed_at.isnot(None),
+                *criteria,
+            )
+            .group_by(day_expr, technician)
+        )
+
+    def _insert(self, rows_select):
+        self.db.execute(insert(DailyRevenue).from_select(["day", "technician_id", *ROLLUP_FIELDS], rows_select))
+
+    def refresh_day(self, day: date) -> None:
+        """Rewrite the rows for one day from work_orders in the current transaction.
+
+        Reads only that day's closed orders (half-open range on completed_at),
+        so it is cheap enough to run on every write that affects the day.
+        """
+        # Pending status/total changes must be visible to the aggregate
+        self.db.flush()
+        start = datetime.combine(day, time.min)
+        self.db.execute(delete(DailyRevenue).where(DailyRevenue.day == day))
+        self._insert(
+            self._aggregate(
+                literal(day, Date),
+                WorkOrder.completed_at >= start,
+                WorkOrder.completed_at < start + timedelta(days=1),
+            )
+        )
+
+    def rebuild(self) -> Tuple[int, int]:
+        """Recompute the whole table; returns (rows before, rows after)."""
+        before = self.db.query(func.count()).select_from(DailyRevenue).scalar()
+        self.db.execute(delete(DailyRevenue))
+        self._insert(self._aggregate(func.date(WorkOrder.completed_at)))
+        after = self.db.query(func.count()).select_from(DailyRevenue).scalar()
+        commit_or_flush(self.db)
+        return before, after
+
+    def find_drift(self) -> List[dict]:
+        """Compare stored rows with a fresh aggregate; lists every (day, technician) that differs."""
+        def keyed(rows):
+            # SQLite sums money as REAL, so compare at cent precision
+            return {
+                (str(r.day), r.technician_id): {
+                    "order_count": r.order_count,
+                    **{f: Decimal(str(getattr(r, f))).quantize(Decimal("0.01")) for f in ROLLUP_FIELDS[1:]},
+                }
+                for r in rows
+            }
+
+        stored = keyed(self.db.execute(select(DailyRevenue)).scalars())
+        actual = keyed(self.db.execute(self._aggregate(func.date(WorkOrder.completed_at))))
+        drift = []
+        for day, technician_id in sorted(stored.keys() | actual.keys()):
+            old = stored.get((day, technician_id), {})
+            new = actual.get((day, technician_id), {})
+            fields = {
+                f: {"stored": str(old.get(f)), "expected": str(new.get(f))}
+                for f in ROLLUP_FIELDS
+                if old.get(f) != new.get(f)
+            }
+            if fields:
+                drift.append({"day": day, "technician_id": technician_id, "fields": fields})
+        return drift
+
+    def totals_between(self, start: date, end: date) -> Dict[str, Decimal]:
+        """Summed rollup for days in [start, end)."""
+        row = self.db.execute(
+            select(
+                *[func.coalesce(func.sum(getattr(DailyRevenue, f)), 0).label(f) for f in ROLLUP_FIELDS]
+            ).where(DailyRevenue.day >= start, DailyRevenue.day < end)
+        ).one()
+        return {f: getattr(row, f) for f in ROLLUP_FIELDS}
@@ -0,0 +1,110 @@
+from datetime import date
+from typing import List, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+
+from app.core.enums import WorkOrderStatus
+from app.models.customer import Customer
+from app.models.daily_revenue import DailyRevenue
+from app.models.entity_counter import EntityCounter
+from app.models.part import Part
+from app.models.vehicle import Vehicle
+from app.models.work_order import WorkOrder
+from app.repositories.daily_revenue_repo import CLOSED_STATUSES, month_bounds
+
+ACTIVE_STATUSES = [WorkOrderStatus.PENDING, WorkOrderStatus.APPROVED, WorkOrderStatus.IN_PROGRESS]
+
+
+class DashboardRepository:
+    """Read model for the dashboard: flat rows and scalars, no ORM entities."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_kpis(self, today: Optional[date] = None) -> dict:
+        """All headline figures in a single SELECT of scalar subqueries.
+
+        Revenue is read from the daily_revenue rollup: at most a month of
+        rows per technician instead of the work order history.
+        """
+        today = today or date.today()
+        month_start, month_end = month_bounds(today)
+        live = WorkOrder.is_deleted == False  # noqa: E712
+
+        active_orders = (
+            select(func.count()).select_from(WorkOrder)
+            .where(live, WorkOrder.status.in_(ACTIVE_STATUSES))
+        )
+        revenue_today = (
+            select(func.coalesce(func.sum(DailyRevenue.grand_total), 0))
+            .where(DailyRevenue.day == today)
+        )
+        revenue_month = (
+            select(func.coalesce(func.sum(DailyRevenue.grand_total), 0))
+            .where(DailyRevenue.day >= month_start, DailyRevenue.day < month_end)
+        )
+        # Maintained counter, falling back to COUNT(*) if the row is missing
+        total_customers = func.coalesce(
+            select(EntityCounter.live_count)
+            .where(EntityCounter.entity_name == Customer.__tablename__)
+            .scalar_subquery(),
+            select(func.count()).select_from(Customer)
+            .where(Customer.is_deleted == False)  # noqa: E712
+            .scalar_subquery(),
+        )
+
+        row = self.db.execute(
+            select(
+                active_orders.scalar_subquery().label("active_orders"),
+                revenue_today.scalar_subquery().label("revenue_today"),
+                revenue_month.scalar_subquery().label("revenue_month"),
+                total_customers.label("total_customers"),
+            )
+        ).one()
+        return {
+            "active_orders": row.active_orders,
+            "revenue_today": float(row.revenue_today),
+            "revenue_month": float(row.revenue_month),
+            "total_customers": row.total_customers,
+        }
+
+    def _order_rows(self, *columns):
+        return (
+            self.db.query(
+                WorkOrder.id,
+                WorkOrder.work_order_number,
+                WorkOrder.status,
+                Vehicle.plate_number,
+                Customer.full_name.label("customer_name"),
+                *columns,
+            )
+            .join(Vehicle, Vehicle.id == WorkOrder.vehicle_id)
+            .join(Customer, Customer.id == WorkOrder.customer_id)
+            .filter(WorkOrder.is_deleted == False)  # noqa: E712
+        )
+
+    def get_active_orders(self, limit: int = 5) -> List:
+        return (
+            self._order_rows()
+            .filter(WorkOrder.status.in_(ACTIVE_STATUSES))
+            .order_by(WorkOrder.id.desc())
+            .limit(limit)
+            .all()
+        )
+
+    def get_recent_completed(self, limit: int = 5) -> List:
+        return (
+            self._order_rows(WorkOrder.grand_total)
+            .filter(WorkOrder.status.in_(CLOSED_STATUSES))
+            .order_by(WorkOrder.completed_at.desc())
+            .limit(limit)
+            .all()
+        )
+
+    def get_low_stock(self) -> List:
+        return (
+            self.db.query(Part.id, Part.name, Part.stock_code, Part.stock_quantity)
+            .filter(Part.is_active == True, Part.stock_quantity <= Part.critical_level)  # noqa: E712
+            .order_by(Part.stock_quantity)
+            .all()
+        )
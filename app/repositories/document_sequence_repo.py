@@ -0,0 +1,36 @@
+from datetime import datetime
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.models.document_sequence import DocumentSequence
+
+_UPSERT = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+class DocumentSequenceRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def next_value(self, prefix: str) -> int:
+        """Increment and return the counter for prefix in one statement.
+
+        The upsert takes the write lock and runs in the caller's transaction,
+        so concurrent creates serialize on it and a rollback hands the
+        number back (no gaps, no duplicates).
+        """
+        insert = _UPSERT[self.db.get_bind().dialect.name]
+        stmt = (
+            insert(DocumentSequence)
+            .values(prefix=prefix, last_value=1)
+            .on_conflict_do_update(
+                index_elements=[DocumentSequence.prefix],
+                set_={"last_value": DocumentSequence.last_value + 1},
+            )
+            .returning(DocumentSequence.last_value)
+        )
+        return self.db.execute(stmt).scalar_one()
+
+    def next_number(self, code: str) -> str:
+        """Next document number for this month, e.g. "IS-202610-0001"."""
+        prefix = f"{code}-{datetime.now().strftime('%Y%m')}"
+        return f"{prefix}-{self.next_value(prefix):04d}"
@@ -0,0 +1,33 @@
+from typing import Optional
+from sqlalchemy.orm import Session
+
+from app.models.entity_counter import EntityCounter
+
+
+class EntityCounterRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get(self, entity_name: str) -> Optional[int]:
+        return (
+            self.db.query(EntityCounter.live_count)
+            .filter(EntityCounter.entity_name == entity_name)
+            .scalar()
+        )
+
+    def adjust(self, entity_name: str, delta: int) -> bool:
+        """Add delta in the current transaction; False if the counter row is missing."""
+        updated = (
+            self.db.query(EntityCounter)
+            .filter(EntityCounter.entity_name == entity_name)
+            .update({EntityCounter.live_count: EntityCounter.live_count + delta}, synchronize_session=False)
+        )
+        return updated > 0
+
+    def set(self, entity_name: str, live_count: int) -> None:
+        counter = self.db.get(EntityCounter, entity_name)
+        if counter is None:
+            self.db.add(EntityCounter(entity_name=entity_name, live_count=live_count))
+        else:
+            counter.live_count = live_count
+        self.db.flush()
@@ -1,9 +1,9 @@
 from typing import Optional
 from sqlalchemy.orm import Session
-from datetime import datetime
 
 from app.models.invoice import Invoice
 from app.repositories.base import BaseRepository
+from app.repositories.document_sequence_repo import DocumentSequenceRepository
 
 
 class InvoiceRepository(BaseRepository[Invoice]):
@@ -18,17 +18,5 @@ class InvoiceRepository(BaseRepository[Invoice]):
         )
 
     def get_next_invoice_number(self) -> str:
-        now = datetime.now()
-        prefix = f"FTR-{now.strftime('%Y%m')}"
-        last_invoice = (
-            self.db.query(Invoice)
-            .filter(Invoice.invoice_number.like(f"{prefix}%"))
-            .order_by(Invoice.id.desc())
-            .first()
-        )
-        if last_invoice:
-            last_num = int(last_invoice.invoice_number.split("-")[-1])
-            next_num = last_num + 1
-        else:
-            next_num = 1
-        return f"{prefix}-{next_num:04d}"
+        """Allocate the next FTR- number; call inside the creating transaction."""
+        return DocumentSequenceRepository(self.db).next_number("FTR")
@@ -1,15 +1,28 @@
 from typing import List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import case, cast, func, Integer
 
+from app.core.enums import WorkOrderItemType
 from app.models.part import Part
+from app.models.work_order_item import WorkOrderItem
 from app.repositories.base import BaseRepository
+from app.utils.pagination import Page, keyset_paginate, NEXT
 
 
 class PartRepository(BaseRepository[Part]):
+    counted = True
+    fts_table = "parts_fts"
+
     def __init__(self, db: Session):
         super().__init__(Part, db)
 
+    def _live_filter(self, query):
+        """The part list and its header cover active parts only."""
+        return query.filter(Part.is_active == True)  # noqa: E712
+
+    def _is_live(self, db_obj: Part) -> bool:
+        return bool(db_obj.is_active)
+
     def get_by_stock_code(self, stock_code: str) -> Optional[Part]:
         return self.db.query(Part).filter(Part.stock_code == stock_code).first()
 
@@ -21,30 +34,72 @@ class PartRepository(BaseRepository[Part]):
             .all()
         )
 
-    def search(self, query: str, skip: int = 0, limit: int = 50) -> List[Part]:
-        search_term = f"%{query}%"
+    def get_all_active(self, skip: int = 0, limit: int = 100) -> List[Part]:
         return (
             self.db.query(Part)
             .filter(Part.is_active == True)  # noqa: E712
-            .filter(
-                or_(
-                    Part.name.ilike(search_term),
-                    Part.stock_code.ilike(search_term),
-                    Part.category.ilike(search_term),
-                )
-            )
-            .order_by(Part.id.desc())
+            .order_by(Part.name)
             .offset(skip)
             .limit(limit)
             .all()
         )
 
-    def get_all_active(self, skip: int = 0, limit: int = 100) -> List[Part]:
-        return (
-            self.db.query(Part)
-            .filter(Part.is_active == True)  # noqa: E712
-            .order_by(Part.name)
-            .offset(skip)
-            .limit(limit)
+    def get_active_page(self, cursor: Optional[str] = None, direction: str = NEXT, limit: int = 20) -> Page:
+        """Active parts A→Z; (name, id) is served by ix_parts_active_name."""
+        query = self.db.query(Part).filter(Part.is_active == True)  # noqa: E712
+        return keyset_paginate(
+            query, (Part.name, Part.id), cursor=cursor, direction=direction, limit=limit, descending=False
+        )
+
+    def decrement_stock(self, work_order_id: int) -> List[dict]:
+        """Take the part items of a work order out of stock in one UPDATE.
+
+        Quantities are summed per part (each line truncated to whole units, as
+        before) and subtracted relative to the current stock, clamped at zero,
+        so concurrent completions cannot overwrite each other. Returns one
+        entry per part that did not have enough stock; for those figures to be
+        exact the transaction must already hold the write lock on SQLite
+        (flush a write first), while other databases lock the rows here.
+        """
+        needed = (
+            self.db.query(
+                WorkOrderItem.part_id.label("part_id"),
+                func.sum(cast(WorkOrderItem.quantity, Integer)).label("quantity"),
+            )
+            .filter(
+                WorkOrderItem.work_order_id == work_order_id,
+                WorkOrderItem.type == WorkOrderItemType.PART,
+                WorkOrderItem.part_id.isnot(None),
+            )
+            .group_by(WorkOrderItem.part_id)
+            .subquery()
+        )
+        rows = (
+            self.db.query(Part.id, Part.stock_code, Part.name, Part.stock_quantity, needed.c.quantity)
+            .join(needed, needed.c.part_id == Part.id)
+            .with_for_update(of=Part)
             .all()
         )
+        quantities = {row.id: row.quantity for row in rows if row.quantity > 0}
+        if not quantities:
+            return []
+
+        remaining = Part.stock_quantity - case(quantities, value=Part.id, else_=0)
+        self.db.query(Part).filter(Part.id.in_(quantities)).update(
+            {Part.stock_quantity: case((remaining < 0, 0), else_=remaining)},
+            synchronize_session="fetch",
+        )
+        # Suggestions show the stock level
+        self._invalidate_search_caches()
+        return [
+            {
+                "part_id": row.id,
+                "stock_code": row.stock_code,
+                "name": row.name,
+                "needed": row.quantity,
+                "available": row.stock_quantity,
+                "missing": row.quantity - row.stock_quantity,
+            }
+            for row in rows
+            if row.quantity > row.stock_quantity
+        ]
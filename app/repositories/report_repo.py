@@ -0,0 +1,143 @@
+from datetime import date, datetime, time, timedelta
+from typing import List, Tuple
+from sqlalchemy import and_, func
+from sqlalchemy.orm import Session
+
+from app.models.customer import Customer
+from app.models.part import Part
+from app.models.user import User
+from app.models.vehicle import Vehicle
+from app.models.work_order import WorkOrder
+from app.models.work_order_item import WorkOrderItem
+from app.repositories.daily_revenue_repo import CLOSED_STATUSES
+
+
+def datetime_range(start: date, end: date) -> Tuple[datetime, datetime]:
+    """Inclusive date range -> half-open datetime range [start 00:00, end+1 00:00)."""
+    return datetime.combine(start, time.min), datetime.combine(end + timedelta(days=1), time.min)
+
+
+def _hours_between(dialect: str, start, end):
+    """SQL expression for the hours from start to end."""
+    if dialect == "postgresql":
+        return func.extract("epoch", end - start) / 3600.0
+    return (func.julianday(end) - func.julianday(start)) * 24.0
+
+
+class ReportRepository:
+    """Report queries. Date filters compare completed_at itself against a
+    half-open range, so ix_work_orders_live_status_completed serves them as
+    an index range scan instead of evaluating date() on every row.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _closed_between(self, query, start: date, end: date):
+        range_start, range_end = datetime_range(start, end)
+        return query.filter(
+            WorkOrder.is_deleted == False,  # noqa: E712
+            WorkOrder.status.in_(CLOSED_STATUSES),
+            WorkOrder.completed_at >= range_start,
+            WorkOrder.completed_at < range_end,
+        )
+
+    def closed_orders_query(self, start: date, end: date):
+        """Closed orders completed in the range, newest first, as flat rows."""
+        query = (
+            self.db.query(
+                WorkOrder.id,
+                WorkOrder.work_order_number,
+                WorkOrder.completed_at,
+                WorkOrder.labor_total,
+                WorkOrder.parts_total,
+                WorkOrder.vat_total,
+                WorkOrder.grand_total,
+                Vehicle.plate_number,
+                Customer.full_name.label("customer_name"),
+            )
+            .join(Vehicle, Vehicle.id == WorkOrder.vehicle_id)
+            .join(Customer, Customer.id == WorkOrder.customer_id)
+        )
+        return self._closed_between(query, start, end).order_by(WorkOrder.completed_at.desc())
+
+    def get_closed_orders(self, start: date, end: date) -> List:
+        return self.closed_orders_query(start, end).all()
+
+    def get_technician_stats(self, start: date, end: date) -> List:
+        """Per active user: closed orders in the range, revenue, average ticket,
+        labor share of labor + parts, and average hours from creation to
+        completion. One grouped query; users without orders get zero rows.
+        """
+        range_start, range_end = datetime_range(start, end)
+        labor = func.coalesce(func.sum(WorkOrder.labor_total), 0)
+        parts = func.coalesce(func.sum(WorkOrder.parts_total), 0)
+        hours = _hours_between(self.db.get_bind().dialect.name, WorkOrder.created_at, WorkOrder.completed_at)
+        return (
+            self.db.query(
+                User.id,
+                User.full_name,
+                func.count(WorkOrder.id).label("order_count"),
+                func.coalesce(func.sum(WorkOrder.grand_total), 0).label("revenue"),
+                func.coalesce(func.avg(WorkOrder.grand_total), 0).label("avg_ticket"),
+                (labor * 100.0 / func.nullif(labor + parts, 0)).label("labor_share"),
+                func.avg(hours).label("avg_turnaround_hours"),
+            )
+            .outerjoin(
+                WorkOrder,
+                and_(
+                    WorkOrder.technician_id == User.id,
+                    WorkOrder.is_deleted == False,  # noqa: E712
+                    WorkOrder.status.in_(CLOSED_STATUSES),
+                    WorkOrder.completed_at >= range_start,
+                    WorkOrder.completed_at < range_end,
+                ),
+            )
+            .filter(User.is_active == True)  # noqa: E712
+            .group_by(User.id, User.full_name)
+            .order_by(func.coalesce(func.sum(WorkOrder.grand_total), 0).desc(), User.full_name)
+            .all()
+        )
+
+    def get_most_serviced_vehicles(self, limit: int = 20) -> List:
+        return (
+            self.db.query(
+                Vehicle.id,
+                Vehicle.plate_number,
+                Vehicle.brand,
+                Vehicle.model,
+                Customer.full_name.label("customer_name"),
+                func.count(WorkOrder.id).label("order_count"),
+            )
+            .join(WorkOrder, WorkOrder.vehicle_id == Vehicle.id)
+            .join(Customer, Customer.id == Vehicle.customer_id)
+            .filter(WorkOrder.is_deleted == False, Vehicle.is_deleted == False)  # noqa: E712
+            .group_by(Vehicle.id, Customer.full_name)
+            .order_by(func.count(WorkOrder.id).desc())
+            .limit(limit)
+            .all()
+        )
+
+    def get_most_used_parts(self, limit: int = 20) -> List:
+        return (
+            self.db.query(
+                Part.name,
+                Part.stock_code,
+                func.sum(WorkOrderItem.quantity).label("total_used"),
+            )
+            .join(WorkOrderItem, WorkOrderItem.part_id == Part.id)
+            .group_by(Part.id)
+            .order_by(func.sum(WorkOrderItem.quantity).desc())
+            .limit(limit)
+            .all()
+        )
+
+    def customers_with_debt_query(self):
+        return (
+            self.db.query(Customer.id, Customer.full_name, Customer.phone, Customer.total_debt)
+            .filter(Customer.is_deleted == False, Customer.total_debt > 0)  # noqa: E712
+            .order_by(Customer.total_debt.desc())
+        )
+
+    def get_customers_with_debt(self) -> List:
+        return self.customers_with_debt_query().all()
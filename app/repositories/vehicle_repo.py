@@ -1,21 +1,123 @@
 from typing import List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, not_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
 
+from app.models.customer import Customer
 from app.models.vehicle import Vehicle
-from app.repositories.base import BaseRepository
+from app.repositories.base import AsyncBaseRepository, BaseRepository
+from app.utils.search import starts_with
+from app.utils.text import fold_text, plate_key
 
 
 class VehicleRepository(BaseRepository[Vehicle]):
+    counted = True
+    fts_table = "vehicles_fts"
+
     def __init__(self, db: Session):
         super().__init__(Vehicle, db)
 
+    def list_options(self) -> tuple:
+        # The list shows each vehicle's owner
+        return (joinedload(Vehicle.customer).load_only(Customer.full_name),)
+
+    def get_detail(self, id: int) -> Optional[Vehicle]:
+        """Live vehicle with its customer, for the detail page."""
+        return (
+            self.db.query(Vehicle)
+            .options(joinedload(Vehicle.customer))
+            .filter(Vehicle.id == id, Vehicle.is_deleted == False)  # noqa: E712
+            .first()
+        )
+
     def get_by_plate(self, plate_number: str) -> Optional[Vehicle]:
+        """Live vehicle with this plate, however it is spaced or cased."""
+        key = plate_key(plate_number)
+        if not key:
+            return None
         return (
             self.db.query(Vehicle)
-            .filter(Vehicle.plate_number == plate_number.upper(), Vehicle.is_deleted == False)  # noqa: E712
+            .filter(Vehicle.plate_key == key, Vehicle.is_deleted == False)  # noqa: E712
             .first()
         )
 
+    def find_plate_key_conflicts(self) -> List[tuple]:
+        """(vehicle, holder) pairs for vehicles left without a plate_key because
+        holder already has the same plate apart from spacing or case.
+        """
+        unkeyed = (
+            self.db.query(Vehicle)
+            .filter(Vehicle.plate_key.is_(None))
+            .order_by(Vehicle.id)
+            .all()
+        )
+        conflicts = []
+        for vehicle in unkeyed:
+            key = plate_key(vehicle.plate_number)
+            holder = self.db.query(Vehicle).filter(Vehicle.plate_key == key).first() if key else None
+            if holder is not None:
+                conflicts.append((vehicle, holder))
+        return conflicts
+
+    def _plate_ranges(self, key: str):
+        """Live vehicles whose plate starts with key, and those that only end with it.
+
+        Kept as two queries: SQLite plans an OR of the two ranges as a full
+        table scan.
+        """
+        live = Vehicle.is_deleted == False  # noqa: E712
+        prefix = starts_with(Vehicle.plate_key, key)
+        starting = self.db.query(Vehicle).filter(*prefix, live).order_by(Vehicle.plate_key)
+        ending = (
+            self.db.query(Vehicle)
+            .filter(*starts_with(Vehicle.plate_key_rev, key[::-1]), live, not_(and_(*prefix)))
+            .order_by(Vehicle.plate_key_rev)
+        )
+        return starting, ending
+
+    def lookup_plate(self, query: str, skip: int = 0, limit: int = 20) -> List[Vehicle]:
+        """Live vehicles whose plate starts with query, then those ending with it.
+
+        "34ABC" and "34 abc" find 34 ABC 123; "123" also finds plates that
+        end in 123. Both are range scans on the plate_key indexes, so the
+        cost depends on the number of matches, not the table size.
+        """
+        key = plate_key(query)
+        if not key:
+            return []
+        starting, ending = self._plate_ranges(key)
+        vehicles = starting.options(*self.list_options()).offset(skip).limit(limit).all()
+        if len(vehicles) < limit:
+            # Rows of the first range before this page, to position the second
+            skipped = max(0, skip - starting.order_by(None).count()) if not vehicles else 0
+            vehicles += ending.options(*self.list_options()).offset(skipped).limit(limit - len(vehicles)).all()
+        return vehicles
+
+    def count_plate_matches(self, query: str) -> int:
+        """Number of vehicles lookup_plate() finds for query (cached like count_search)."""
+        key = plate_key(query)
+        if not key:
+            return 0
+
+        def load() -> int:
+            return sum(q.order_by(None).count() for q in self._plate_ranges(key))
+
+        return self.cached_count("plate", key, load)
+
+    def find_for_customer(self, customer_id: int, query: str = "", limit: int = 20) -> List[Vehicle]:
+        """Live vehicles of one customer, newest first, narrowed to those whose
+        search_key contains query. A customer has few vehicles, so the
+        substring match runs over the ix_vehicles_live_customer_id range.
+        """
+        rows = self.db.query(Vehicle).filter(
+            Vehicle.customer_id == customer_id,
+            Vehicle.is_deleted == False,  # noqa: E712
+        )
+        folded = fold_text(query)
+        if folded:
+            rows = rows.filter(Vehicle.search_key.like(f"%{folded}%"))
+        return rows.order_by(Vehicle.id.desc()).limit(limit).all()
+
     def get_by_customer(self, customer_id: int) -> List[Vehicle]:
         return (
             self.db.query(Vehicle)
@@ -24,18 +126,26 @@ class VehicleRepository(BaseRepository[Vehicle]):
             .all()
         )
 
-    def search(self, query: str, skip: int = 0, limit: int = 50) -> List[Vehicle]:
-        search_term = f"%{query}%"
-        return (
-            self.db.query(Vehicle)
-            .filter(Vehicle.is_deleted == False)  # noqa: E712
-            .filter(
-                Vehicle.plate_number.ilike(search_term)
-                | Vehicle.brand.ilike(search_term)
-                | Vehicle.model.ilike(search_term)
-            )
+
+class AsyncVehicleRepository(AsyncBaseRepository[Vehicle]):
+    counted = True
+    list_options = VehicleRepository.list_options
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(Vehicle, db)
+
+    async def get_detail(self, id: int) -> Optional[Vehicle]:
+        stmt = (
+            select(Vehicle)
+            .options(joinedload(Vehicle.customer))
+            .where(Vehicle.id == id, Vehicle.is_deleted == False)  # noqa: E712
+        )
+        return (await self.db.execute(stmt)).scalars().first()
+
+    async def get_by_customer(self, customer_id: int) -> List[Vehicle]:
+        stmt = (
+            select(Vehicle)
+            .where(Vehicle.customer_id == customer_id, Vehicle.is_deleted == False)  # noqa: E712
             .order_by(Vehicle.id.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
         )
+        return list((await self.db.execute(stmt)).scalars().all())
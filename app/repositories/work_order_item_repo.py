@@ -1,9 +1,20 @@
+from decimal import Decimal
 from typing import List
 from sqlalchemy.orm import Session
+from sqlalchemy import Numeric, case, func, type_coerce
 
+from app.core.database import commit_or_flush
+from app.core.enums import WorkOrderItemType
 from app.models.work_order_item import WorkOrderItem
 from app.repositories.base import BaseRepository
 
+# Work order columns derived from its items
+TOTAL_FIELDS = ("labor_total", "parts_total", "discount_total", "subtotal", "vat_total", "grand_total")
+
+
+def _money(expr):
+    return type_coerce(func.coalesce(func.sum(expr), 0), Numeric(12, 2))
+
 
 class WorkOrderItemRepository(BaseRepository[WorkOrderItem]):
     def __init__(self, db: Session):
@@ -17,8 +28,29 @@ class WorkOrderItemRepository(BaseRepository[WorkOrderItem]):
             .all()
         )
 
+    def totals_query(self):
+        """Per-work-order totals aggregated in SQL (per-item VAT), one row per order."""
+        total = WorkOrderItem.total_price
+        vat = total * func.coalesce(WorkOrderItem.vat_rate, 20) / 100
+        is_labor = WorkOrderItem.type == WorkOrderItemType.LABOR
+        return self.db.query(
+            WorkOrderItem.work_order_id.label("work_order_id"),
+            _money(case((is_labor, total), else_=0)).label("labor_total"),
+            _money(case((is_labor, 0), else_=total)).label("parts_total"),
+            _money(WorkOrderItem.discount).label("discount_total"),
+            _money(total).label("subtotal"),
+            _money(vat).label("vat_total"),
+            _money(total + vat).label("grand_total"),
+        ).group_by(WorkOrderItem.work_order_id)
+
+    def get_totals(self, work_order_id: int) -> dict:
+        row = self.totals_query().filter(WorkOrderItem.work_order_id == work_order_id).first()
+        if row is None:
+            return {field: Decimal("0") for field in TOTAL_FIELDS}
+        return {field: getattr(row, field) for field in TOTAL_FIELDS}
+
     def delete_by_work_order(self, work_order_id: int) -> None:
         self.db.query(WorkOrderItem).filter(
             WorkOrderItem.work_order_id == work_order_id
         ).delete()
-        self.db.commit()
+        commit_or_flush(self.db)
@@ -1,20 +1,53 @@
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
-from datetime import datetime, date
+from decimal import Decimal
+from typing import Iterator, List, Optional, Tuple
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
 
+from app.models.customer import Customer
+from app.models.vehicle import Vehicle
 from app.models.work_order import WorkOrder
 from app.core.enums import WorkOrderStatus
-from app.repositories.base import BaseRepository
+from app.repositories.base import AsyncBaseRepository, BaseRepository
+from app.repositories.document_sequence_repo import DocumentSequenceRepository
+from app.utils.pagination import Page, keyset_paginate, keyset_paginate_async, NEXT
+from app.utils.search import starts_with
 
 
 class WorkOrderRepository(BaseRepository[WorkOrder]):
+    counted = True
+
     def __init__(self, db: Session):
         super().__init__(WorkOrder, db)
 
+    def list_options(self) -> tuple:
+        # The list shows the plate, make and model, and the customer's name
+        return (
+            joinedload(WorkOrder.vehicle).load_only(Vehicle.plate_number, Vehicle.brand, Vehicle.model),
+            joinedload(WorkOrder.customer).load_only(Customer.full_name),
+        )
+
+    def get_detail(self, id: int, with_items: bool = True) -> Optional[WorkOrder]:
+        """Live work order with its vehicle, customer and technician joined in,
+        and its items in one more query unless with_items is False (forms
+        that only show the header).
+
+        Payments, photos and the invoice are read by their own repositories.
+        """
+        options = [joinedload(WorkOrder.vehicle), joinedload(WorkOrder.customer), joinedload(WorkOrder.technician)]
+        if with_items:
+            options.append(selectinload(WorkOrder.items))
+        return (
+            self.db.query(WorkOrder)
+            .options(*options)
+            .filter(WorkOrder.id == id, WorkOrder.is_deleted == False)  # noqa: E712
+            .first()
+        )
+
     def get_by_status(self, status: WorkOrderStatus, skip: int = 0, limit: int = 50) -> List[WorkOrder]:
         return (
             self.db.query(WorkOrder)
+            .options(*self.list_options())
             .filter(WorkOrder.status == status, WorkOrder.is_deleted == False)  # noqa: E712
             .order_by(WorkOrder.id.desc())
             .offset(skip)
@@ -22,20 +55,22 @@ class WorkOrderRepository(BaseRepository[WorkOrder]):
             .all()
         )
 
-    def get_active_orders(self) -> List[WorkOrder]:
-        active_statuses = [
-            WorkOrderStatus.PENDING,
-            WorkOrderStatus.APPROVED,
-            WorkOrderStatus.IN_PROGRESS,
-        ]
+    def get_page_by_status(
+        self, status: WorkOrderStatus, cursor: Optional[str] = None, direction: str = NEXT, limit: int = 20
+    ) -> Page:
+        query = self.db.query(WorkOrder).options(*self.list_options()).filter(
+            WorkOrder.status == status, WorkOrder.is_deleted == False  # noqa: E712
+        )
+        return keyset_paginate(query, (WorkOrder.id,), cursor=cursor, direction=direction, limit=limit)
+
+    def count_by_status(self, status: WorkOrderStatus) -> int:
         return (
             self.db.query(WorkOrder)
-            .filter(WorkOrder.status.in_(active_statuses), WorkOrder.is_deleted == False)  # noqa: E712
-            .order_by(WorkOrder.id.desc())
-            .all()
+            .filter(WorkOrder.status == status, WorkOrder.is_deleted == False)  # noqa: E712
+            .count()
         )
 
-    def count_active(self) -> int:
+    def get_active_orders(self) -> List[WorkOrder]:
         active_statuses = [
             WorkOrderStatus.PENDING,
             WorkOrderStatus.APPROVED,
@@ -43,67 +78,47 @@ class WorkOrderRepository(BaseRepository[WorkOrder]):
         ]
         return (
             self.db.query(WorkOrder)
+            .options(*self.list_options())
             .filter(WorkOrder.status.in_(active_statuses), WorkOrder.is_deleted == False)  # noqa: E712
-            .count()
+            .order_by(WorkOrder.id.desc())
+            .all()
         )
 
-    def get_revenue_today(self) -> float:
-        today = date.today()
-        result = (
-            self.db.query(func.coalesce(func.sum(WorkOrder.grand_total), 0))
-            .filter(
-                WorkOrder.status == WorkOrderStatus.COMPLETED,
-                func.date(WorkOrder.completed_at) == today,
-                WorkOrder.is_deleted == False,  # noqa: E712
-            )
-            .scalar()
-        )
-        return float(result)
-
-    def get_revenue_month(self, year: int = None, month: int = None) -> float:
-        now = datetime.now()
-        year = year or now.year
-        month = month or now.month
-        result = (
-            self.db.query(func.coalesce(func.sum(WorkOrder.grand_total), 0))
-            .filter(
-                WorkOrder.status.in_([WorkOrderStatus.COMPLETED, WorkOrderStatus.DELIVERED]),
-                func.extract("year", WorkOrder.completed_at) == year,
-                func.extract("month", WorkOrder.completed_at) == month,
-                WorkOrder.is_deleted == False,  # noqa: E712
-            )
-            .scalar()
+    def get_next_order_number(self) -> str:
+        """Allocate the next IS- number; call inside the creating transaction."""
+        return DocumentSequenceRepository(self.db).next_number("IS")
+
+    def get_with_item_totals(self, totals) -> Iterator[Tuple[WorkOrder, dict]]:
+        """Every work order paired with the totals in ``totals`` (a per-order subquery)."""
+        fields = [c.name for c in totals.c if c.name != "work_order_id"]
+        rows = (
+            self.db.query(WorkOrder, *[totals.c[f] for f in fields])
+            .outerjoin(totals, totals.c.work_order_id == WorkOrder.id)
+            .order_by(WorkOrder.id)
         )
-        return float(result)
+        for work_order, *values in rows:
+            yield work_order, {f: v if v is not None else Decimal("0") for f, v in zip(fields, values)}
 
-    def get_recent_completed(self, limit: int = 10) -> List[WorkOrder]:
+    def find_by_number(self, prefix: str, limit: int = 10) -> List:
+        """Live orders whose number starts with prefix ("IS-202610-00"), newest
+        first, as flat rows with the plate and customer name.
+        """
         return (
-            self.db.query(WorkOrder)
-            .filter(
-                WorkOrder.status.in_([WorkOrderStatus.COMPLETED, WorkOrderStatus.DELIVERED]),
-                WorkOrder.is_deleted == False,  # noqa: E712
+            self.db.query(
+                WorkOrder.id,
+                WorkOrder.work_order_number,
+                WorkOrder.status,
+                Vehicle.plate_number,
+                Customer.full_name.label("customer_name"),
             )
-            .order_by(WorkOrder.completed_at.desc())
+            .join(Vehicle, Vehicle.id == WorkOrder.vehicle_id)
+            .join(Customer, Customer.id == WorkOrder.customer_id)
+            .filter(*starts_with(WorkOrder.work_order_number, prefix), WorkOrder.is_deleted == False)  # noqa: E712
+            .order_by(WorkOrder.work_order_number.desc())
             .limit(limit)
             .all()
         )
 
-    def get_next_order_number(self) -> str:
-        now = datetime.now()
-        prefix = f"IS-{now.strftime('%Y%m')}"
-        last_order = (
-            self.db.query(WorkOrder)
-            .filter(WorkOrder.work_order_number.like(f"{prefix}%"))
-            .order_by(WorkOrder.id.desc())
-            .first()
-        )
-        if last_order:
-            last_num = int(last_order.work_order_number.split("-")[-1])
-            next_num = last_num + 1
-        else:
-            next_num = 1
-        return f"{prefix}-{next_num:04d}"
-
     def get_by_vehicle(self, vehicle_id: int) -> List[WorkOrder]:
         return (
             self.db.query(WorkOrder)
@@ -113,9 +128,52 @@ class WorkOrderRepository(BaseRepository[WorkOrder]):
         )
 
     def get_by_customer(self, customer_id: int) -> List[WorkOrder]:
+        """The customer's orders with each one's plate, as the customer page shows them."""
         return (
             self.db.query(WorkOrder)
+            .options(joinedload(WorkOrder.vehicle).load_only(Vehicle.plate_number))
             .filter(WorkOrder.customer_id == customer_id, WorkOrder.is_deleted == False)  # noqa: E712
             .order_by(WorkOrder.id.desc())
             .all()
         )
+
+
+class AsyncWorkOrderRepository(AsyncBaseRepository[WorkOrder]):
+    counted = True
+    list_options = WorkOrderRepository.list_options
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(WorkOrder, db)
+
+    async def get_page_by_status(
+        self, status: WorkOrderStatus, cursor: Optional[str] = None, direction: str = NEXT, limit: int = 20
+    ) -> Page:
+        stmt = select(WorkOrder).options(*self.list_options()).where(
+            WorkOrder.status == status, WorkOrder.is_deleted == False  # noqa: E712
+        )
+        return await keyset_paginate_async(
+            self.db, stmt, (WorkOrder.id,), cursor=cursor, direction=direction, limit=limit
+        )
+
+    async def count_by_status(self, status: WorkOrderStatus) -> int:
+        stmt = select(func.count()).select_from(WorkOrder).where(
+            WorkOrder.status == status, WorkOrder.is_deleted == False  # noqa: E712
+        )
+        return (await self.db.execute(stmt)).scalar_one()
+
+    async def get_by_vehicle(self, vehicle_id: int) -> List[WorkOrder]:
+        stmt = (
+            select(WorkOrder)
+            .where(WorkOrder.vehicle_id == vehicle_id, WorkOrder.is_deleted == False)  # noqa: E712
+            .order_by(WorkOrder.id.desc())
+        )
+        return list((await self.db.execute(stmt)).scalars().all())
+
+    async def get_by_customer(self, customer_id: int) -> List[WorkOrder]:
+        stmt = (
+            select(WorkOrder)
+            .options(joinedload(WorkOrder.vehicle).load_only(Vehicle.plate_number))
+            .where(WorkOrder.customer_id == customer_id, WorkOrder.is_deleted == False)  # noqa: E712
+            .order_by(WorkOrder.id.desc())
+        )
+        return list((await self.db.execute(stmt)).scalars().all())
@@ -10,7 +10,7 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 
 
 @router.get("/login")
-async def login_page(request: Request, user=Depends(get_optional_user)):
+def login_page(request: Request, user=Depends(get_optional_user)):
     if user:
         return RedirectResponse("/", status_code=303)
     return request.app.state.templates.TemplateResponse(
@@ -19,7 +19,7 @@ async def login_page(request: Request, user=Depends(get_optional_user)):
 
 
 @router.post("/login")
-async def login(
+def login(
     request: Request,
     username: str = Form(...),
     password: str = Form(...),
@@ -39,6 +39,6 @@ async def login(
 
 
 @router.get("/logout")
-async def logout(request: Request):
+def logout(request: Request):
     request.session.clear()
     return RedirectResponse("/auth/login", status_code=303)
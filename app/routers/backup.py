@@ -10,7 +10,7 @@ router = APIRouter(prefix="/backup", tags=["backup"])
 
 
 @router.get("/")
-async def backup_page(
+def backup_page(
     request: Request,
     user=Depends(require_admin),
 ):
@@ -22,7 +22,7 @@ async def backup_page(
 
 
 @router.post("/create")
-async def create_backup(
+def create_backup(
     request: Request,
     user=Depends(require_admin),
 ):
@@ -49,7 +49,7 @@ async def upload_backup(
 
 
 @router.post("/restore/{filename}")
-async def restore_backup(
+def restore_backup(
     filename: str,
     request: Request,
     user=Depends(require_admin),
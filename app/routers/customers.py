@@ -1,35 +1,24 @@
 from fastapi import APIRouter, Request, Depends, Form, Query
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import RedirectResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
-from app.core.dependencies import get_current_user
+from app.core.database import get_async_db, get_db
+from app.core.dependencies import get_current_user, get_current_user_async
 from app.core.enums import CustomerType
-from app.services.customer_service import CustomerService
+from app.services.customer_service import AsyncCustomerService, CustomerService
 
 router = APIRouter(prefix="/customers", tags=["customers"])
+# List and detail on the AsyncSession; included ahead of router when
+# DB_ASYNC_READS is set (see create_app)
+async_router = APIRouter(prefix="/customers", tags=["customers"])
 
+PER_PAGE = 20
 
-@router.get("/")
-async def customer_list(
-    request: Request,
-    q: str = Query(None),
-    page: int = Query(1, ge=1),
-    user=Depends(get_current_user),
-    db: Session = Depends(get_db),
-):
-    service = CustomerService(db)
-    per_page = 20
-    skip = (page - 1) * per_page
-
-    if q:
-        customers = service.search(q)
-        total = len(customers)
-    else:
-        customers = service.get_all(skip=skip, limit=per_page)
-        total = service.count()
 
-    total_pages = max(1, (total + per_page - 1) // per_page)
+def _list_response(request: Request, user, q, page, customers, total, next_cursor=None, prev_cursor=None):
+    total_pages = max(1, (total + PER_PAGE - 1) // PER_PAGE)
     return request.app.state.templates.TemplateResponse(
         "customers/list.html",
         {
@@ -40,13 +29,70 @@ async def customer_list(
             "page": page,
             "total_pages": total_pages,
             "total": total,
+            "next_cursor": next_cursor,
+            "prev_cursor": prev_cursor,
             "customer_types": CustomerType,
         },
     )
 
 
+def _detail_response(request: Request, user, customer, vehicles, work_orders):
+    return request.app.state.templates.TemplateResponse(
+        "customers/detail.html",
+        {
+            "request": request,
+            "user": user,
+            "customer": customer,
+            "vehicles": vehicles,
+            "work_orders": work_orders,
+        },
+    )
+
+
+@router.get("/")
+def customer_list(
+    request: Request,
+    q: str = Query(None),
+    cursor: str = Query(None),
+    direction: str = Query("next", pattern="^(next|prev)$"),
+    page: int = Query(1, ge=1),
+    user=Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    service = CustomerService(db)
+    if q:
+        result = service.search_page(q, page=page, per_page=PER_PAGE)
+        return _list_response(request, user, q, result.page, result.items, result.total)
+    result = service.get_page(cursor=cursor, direction=direction, limit=PER_PAGE)
+    return _list_response(
+        request, user, q, page, result.items, service.count(), result.next_cursor, result.prev_cursor
+    )
+
+
+@async_router.get("/")
+async def customer_list_async(
+    request: Request,
+    q: str = Query(None),
+    cursor: str = Query(None),
+    direction: str = Query("next", pattern="^(next|prev)$"),
+    page: int = Query(1, ge=1),
+    user=Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+    sync_db: Session = Depends(get_db),
+):
+    if q:
+        # Search (FTS5, cached totals) stays on the sync repositories
+        result = await run_in_threadpool(CustomerService(sync_db).search_page, q, page=page, per_page=PER_PAGE)
+        return _list_response(request, user, q, result.page, result.items, result.total)
+    service = AsyncCustomerService(db)
+    result = await service.get_page(cursor=cursor, direction=direction, limit=PER_PAGE)
+    return _list_response(
+        request, user, q, page, result.items, await service.count(), result.next_cursor, result.prev_cursor
+    )
+
+
 @router.get("/create")
-async def create_form(request: Request, user=Depends(get_current_user)):
+def create_form(request: Request, user=Depends(get_current_user)):
     return request.app.state.templates.TemplateResponse(
         "customers/form.html",
         {"request": request, "user": user, "customer": None, "customer_types": CustomerType},
@@ -54,7 +100,7 @@ async def create_form(request: Request, user=Depends(get_current_user)):
 
 
 @router.post("/create")
-async def create_customer(
+def create_customer(
     request: Request,
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -87,7 +133,7 @@ async def create_customer(
 
 
 @router.get("/{customer_id}")
-async def customer_detail(
+def customer_detail(
     customer_id: int,
     request: Request,
     user=Depends(get_current_user),
@@ -103,20 +149,31 @@ async def customer_detail(
     v_service = VehicleService(db)
     wo_service = WorkOrderService(db)
 
-    return request.app.state.templates.TemplateResponse(
-        "customers/detail.html",
-        {
-            "request": request,
-            "user": user,
-            "customer": customer,
-            "vehicles": v_service.get_by_customer(customer_id),
-            "work_orders": wo_service.get_by_customer(customer_id),
-        },
+    return _detail_response(
+        request, user, customer, v_service.get_by_customer(customer_id), wo_service.get_by_customer(customer_id)
     )
 
 
+@async_router.get("/{customer_id}")
+async def customer_detail_async(
+    customer_id: int,
+    request: Request,
+    user=Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    customer = await AsyncCustomerService(db).get_by_id(customer_id)
+    if not customer:
+        return RedirectResponse("/customers", status_code=303)
+
+    from app.services.vehicle_service import AsyncVehicleService
+    from app.services.work_order_service import AsyncWorkOrderService
+    vehicles = await AsyncVehicleService(db).get_by_customer(customer_id)
+    work_orders = await AsyncWorkOrderService(db).get_by_customer(customer_id)
+    return _detail_response(request, user, customer, vehicles, work_orders)
+
+
 @router.get("/{customer_id}/edit")
-async def edit_form(
+def edit_form(
     customer_id: int,
     request: Request,
     user=Depends(get_current_user),
@@ -133,7 +190,7 @@ async def edit_form(
 
 
 @router.post("/{customer_id}/edit")
-async def update_customer(
+def update_customer(
     customer_id: int,
     request: Request,
     user=Depends(get_current_user),
@@ -167,7 +224,7 @@ async def update_customer(
 
 
 @router.post("/{customer_id}/delete")
-async def delete_customer(
+def delete_customer(
     customer_id: int,
     request: Request,
     user=Depends(get_current_user),
@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+
+from app.core.dependencies import require_admin
+from app.core.query_stats import get_recent_requests
+from app.utils.cache import get_cache_stats
+
+router = APIRouter(prefix="/diagnostics", tags=["diagnostics"])
+
+
+@router.get("/queries")
+def recent_queries(user=Depends(require_admin)):
+    """Rolling per-request SQL stats (query count, DB time, N+1 suspects)."""
+    return JSONResponse({"requests": get_recent_requests()})
+
+
+@router.get("/cache")
+def cache_stats(user=Depends(require_admin)):
+    """Hit/miss/invalidation counters of the in-process caches."""
+    return JSONResponse({"caches": get_cache_stats()})
@@ -10,22 +10,27 @@ router = APIRouter(prefix="/parts", tags=["parts"])
 
 
 @router.get("/")
-async def part_list(
+def part_list(
     request: Request,
     q: str = Query(None),
+    cursor: str = Query(None),
+    direction: str = Query("next", pattern="^(next|prev)$"),
     page: int = Query(1, ge=1),
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     service = PartService(db)
     per_page = 20
-    skip = (page - 1) * per_page
+    next_cursor = prev_cursor = None
 
     if q:
-        parts = service.search(q)
-        total = len(parts)
+        result = service.search_page(q, page=page, per_page=per_page)
+        parts = result.items
+        total, page = result.total, result.page
     else:
-        parts = service.get_all(skip=skip, limit=per_page)
+        result = service.get_page(cursor=cursor, direction=direction, limit=per_page)
+        parts = result.items
+        next_cursor, prev_cursor = result.next_cursor, result.prev_cursor
         total = service.count()
 
     total_pages = max(1, (total + per_page - 1) // per_page)
@@ -39,12 +44,14 @@ async def part_list(
             "page": page,
             "total_pages": total_pages,
             "total": total,
+            "next_cursor": next_cursor,
+            "prev_cursor": prev_cursor,
         },
     )
 
 
 @router.get("/create")
-async def create_form(request: Request, user=Depends(get_current_user)):
+def create_form(request: Request, user=Depends(get_current_user)):
     return request.app.state.templates.TemplateResponse(
         "parts/form.html",
         {"request": request, "user": user, "part": None},
@@ -70,7 +77,7 @@ def _safe_float(val: str) -> float:
 
 
 @router.post("/create")
-async def create_part(
+def create_part(
     request: Request,
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -99,7 +106,7 @@ async def create_part(
 
 
 @router.get("/{part_id}/edit")
-async def edit_form(
+def edit_form(
     part_id: int,
     request: Request,
     user=Depends(get_current_user),
@@ -116,7 +123,7 @@ async def edit_form(
 
 
 @router.post("/{part_id}/edit")
-async def update_part(
+def update_part(
     part_id: int,
     request: Request,
     user=Depends(get_current_user),
@@ -146,7 +153,7 @@ async def update_part(
 
 
 @router.post("/{part_id}/delete")
-async def delete_part(
+def delete_part(
     part_id: int,
     request: Request,
     user=Depends(get_current_user),
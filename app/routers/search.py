@@ -0,0 +1,59 @@
+import time
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.core.dependencies import get_current_user
+from app.services.search_service import SearchService
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+@router.get("/")
+def omnisearch(
+    q: str = Query("", max_length=100),
+    user=Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Phone, plate, work order number, stock code or free text -> matching records."""
+    started = time.perf_counter()
+    result = SearchService(db).search(q)
+    return JSONResponse({
+        "query": q,
+        **result,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+    })
+
+
+@router.get("/customers")
+def suggest_customers(
+    q: str = Query("", max_length=100),
+    user=Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Typeahead options for the customer field of the work order form."""
+    return JSONResponse({"results": SearchService(db).suggest_customers(q)})
+
+
+@router.get("/vehicles")
+def suggest_vehicles(
+    q: str = Query("", max_length=100),
+    customer_id: Optional[int] = Query(None),
+    user=Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Typeahead options for the vehicle field, limited to customer_id when given."""
+    return JSONResponse({"results": SearchService(db).suggest_vehicles(q, customer_id)})
+
+
+@router.get("/parts")
+def suggest_parts(
+    q: str = Query("", max_length=100),
+    user=Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Typeahead options for the part field of the add-item form."""
+    return JSONResponse({"results": SearchService(db).suggest_parts(q)})
@@ -1,36 +1,25 @@
 from fastapi import APIRouter, Request, Depends, Form, Query
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import RedirectResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
-from app.core.dependencies import get_current_user
+from app.core.database import get_async_db, get_db
+from app.core.dependencies import get_current_user, get_current_user_async
 from app.core.enums import FuelType, TransmissionType
-from app.services.vehicle_service import VehicleService
+from app.services.vehicle_service import AsyncVehicleService, VehicleService
 from app.services.customer_service import CustomerService
 
 router = APIRouter(prefix="/vehicles", tags=["vehicles"])
+# List and detail on the AsyncSession; included ahead of router when
+# DB_ASYNC_READS is set (see create_app)
+async_router = APIRouter(prefix="/vehicles", tags=["vehicles"])
 
+PER_PAGE = 20
 
-@router.get("/")
-async def vehicle_list(
-    request: Request,
-    q: str = Query(None),
-    page: int = Query(1, ge=1),
-    user=Depends(get_current_user),
-    db: Session = Depends(get_db),
-):
-    service = VehicleService(db)
-    per_page = 20
-    skip = (page - 1) * per_page
 
-    if q:
-        vehicles = service.search(q)
-        total = len(vehicles)
-    else:
-        vehicles = service.get_all(skip=skip, limit=per_page)
-        total = service.count()
-
-    total_pages = max(1, (total + per_page - 1) // per_page)
+def _list_response(request: Request, user, q, page, vehicles, total, next_cursor=None, prev_cursor=None):
+    total_pages = max(1, (total + PER_PAGE - 1) // PER_PAGE)
     return request.app.state.templates.TemplateResponse(
         "vehicles/list.html",
         {
@@ -41,12 +30,68 @@ async def vehicle_list(
             "page": page,
             "total_pages": total_pages,
             "total": total,
+            "next_cursor": next_cursor,
+            "prev_cursor": prev_cursor,
         },
     )
 
 
+def _detail_response(request: Request, user, vehicle, work_orders):
+    return request.app.state.templates.TemplateResponse(
+        "vehicles/detail.html",
+        {
+            "request": request,
+            "user": user,
+            "vehicle": vehicle,
+            "work_orders": work_orders,
+        },
+    )
+
+
+@router.get("/")
+def vehicle_list(
+    request: Request,
+    q: str = Query(None),
+    cursor: str = Query(None),
+    direction: str = Query("next", pattern="^(next|prev)$"),
+    page: int = Query(1, ge=1),
+    user=Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    service = VehicleService(db)
+    if q:
+        result = service.search_page(q, page=page, per_page=PER_PAGE)
+        return _list_response(request, user, q, result.page, result.items, result.total)
+    result = service.get_page(cursor=cursor, direction=direction, limit=PER_PAGE)
+    return _list_response(
+        request, user, q, page, result.items, service.count(), result.next_cursor, result.prev_cursor
+    )
+
+
+@async_router.get("/")
+async def vehicle_list_async(
+    request: Request,
+    q: str = Query(None),
+    cursor: str = Query(None),
+    direction: str = Query("next", pattern="^(next|prev)$"),
+    page: int = Query(1, ge=1),
+    user=Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+    sync_db: Session = Depends(get_db),
+):
+    if q:
+        # Plate lookup and search (FTS5, cached totals) stay on the sync repositories
+        result = await run_in_threadpool(VehicleService(sync_db).search_page, q, page=page, per_page=PER_PAGE)
+        return _list_response(request, user, q, result.page, result.items, result.total)
+    service = AsyncVehicleService(db)
+    result = await service.get_page(cursor=cursor, direction=direction, limit=PER_PAGE)
+    return _list_response(
+        request, user, q, page, result.items, await service.count(), result.next_cursor, result.prev_cursor
+    )
+
+
 @router.get("/create")
-async def create_form(
+def create_form(
     request: Request,
     customer_id: int = Query(None),
     user=Depends(get_current_user),
@@ -79,7 +124,7 @@ def _safe_int(val: str) -> int | None:
 
 
 @router.post("/create")
-async def create_vehicle(
+def create_vehicle(
     request: Request,
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -114,33 +159,41 @@ async def create_vehicle(
 
 
 @router.get("/{vehicle_id}")
-async def vehicle_detail(
+def vehicle_detail(
     vehicle_id: int,
     request: Request,
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     service = VehicleService(db)
-    vehicle = service.get_by_id(vehicle_id)
+    vehicle = service.get_detail(vehicle_id)
     if not vehicle:
         return RedirectResponse("/vehicles", status_code=303)
 
     from app.services.work_order_service import WorkOrderService
     wo_service = WorkOrderService(db)
 
-    return request.app.state.templates.TemplateResponse(
-        "vehicles/detail.html",
-        {
-            "request": request,
-            "user": user,
-            "vehicle": vehicle,
-            "work_orders": wo_service.get_by_vehicle(vehicle_id),
-        },
-    )
+    return _detail_response(request, user, vehicle, wo_service.get_by_vehicle(vehicle_id))
+
+
+@async_router.get("/{vehicle_id}")
+async def vehicle_detail_async(
+    vehicle_id: int,
+    request: Request,
+    user=Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    vehicle = await AsyncVehicleService(db).get_detail(vehicle_id)
+    if not vehicle:
+        return RedirectResponse("/vehicles", status_code=303)
+
+    from app.services.work_order_service import AsyncWorkOrderService
+    work_orders = await AsyncWorkOrderService(db).get_by_vehicle(vehicle_id)
+    return _detail_response(request, user, vehicle, work_orders)
 
 
 @router.get("/{vehicle_id}/edit")
-async def edit_form(
+def edit_form(
     vehicle_id: int,
     request: Request,
     user=Depends(get_current_user),
@@ -167,7 +220,7 @@ async def edit_form(
 
 
 @router.post("/{vehicle_id}/edit")
-async def update_vehicle(
+def update_vehicle(
     vehicle_id: int,
     request: Request,
     user=Depends(get_current_user),
@@ -203,7 +256,7 @@ async def update_vehicle(
 
 
 @router.post("/{vehicle_id}/delete")
-async def delete_vehicle(
+def delete_vehicle(
     vehicle_id: int,
     request: Request,
     user=Depends(get_current_user),
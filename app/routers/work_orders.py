@@ -1,72 +1,104 @@
 from fastapi import APIRouter, Request, Depends, Form, Query, UploadFile, File
 from fastapi.responses import RedirectResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
-from app.core.dependencies import get_current_user
+from app.core.database import get_async_db, get_db
+from app.core.dependencies import get_current_user, get_current_user_async
 from app.core.enums import WorkOrderStatus, WorkOrderItemType
-from app.services.work_order_service import WorkOrderService
+from app.services.work_order_service import AsyncWorkOrderService, WorkOrderService
 from app.services.customer_service import CustomerService
 from app.services.vehicle_service import VehicleService
-from app.services.part_service import PartService
 from app.services.auth_service import AuthService
 from app.services.payment_service import PaymentService
 from app.services.invoice_service import InvoiceService
 from app.services.photo_service import PhotoService
 
 router = APIRouter(prefix="/work-orders", tags=["work_orders"])
+# List on the AsyncSession; included ahead of router when DB_ASYNC_READS is
+# set (see create_app)
+async_router = APIRouter(prefix="/work-orders", tags=["work_orders"])
 
+PER_PAGE = 20
 
-@router.get("/")
-async def work_order_list(
-    request: Request,
-    status: str = Query(None),
-    page: int = Query(1, ge=1),
-    user=Depends(get_current_user),
-    db: Session = Depends(get_db),
-):
-    service = WorkOrderService(db)
-    per_page = 20
-    skip = (page - 1) * per_page
 
-    if status:
-        work_orders = service.get_by_status(WorkOrderStatus(status))
-        total = len(work_orders)
-    else:
-        work_orders = service.get_all(skip=skip, limit=per_page)
-        total = service.count()
-
-    total_pages = max(1, (total + per_page - 1) // per_page)
+def _list_response(request: Request, user, status, page, result, total):
+    total_pages = max(1, (total + PER_PAGE - 1) // PER_PAGE)
     return request.app.state.templates.TemplateResponse(
         "work_orders/list.html",
         {
             "request": request,
             "user": user,
-            "work_orders": work_orders,
+            "work_orders": result.items,
             "statuses": WorkOrderStatus,
             "current_status": status,
             "page": page,
             "total_pages": total_pages,
             "total": total,
+            "next_cursor": result.next_cursor,
+            "prev_cursor": result.prev_cursor,
         },
     )
 
 
+@router.get("/")
+def work_order_list(
+    request: Request,
+    status: str = Query(None),
+    cursor: str = Query(None),
+    direction: str = Query("next", pattern="^(next|prev)$"),
+    page: int = Query(1, ge=1),
+    user=Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    service = WorkOrderService(db)
+    if status:
+        result = service.get_page_by_status(
+            WorkOrderStatus(status), cursor=cursor, direction=direction, limit=PER_PAGE
+        )
+        total = service.count_by_status(WorkOrderStatus(status))
+    else:
+        result = service.get_page(cursor=cursor, direction=direction, limit=PER_PAGE)
+        total = service.count()
+    return _list_response(request, user, status, page, result, total)
+
+
+@async_router.get("/")
+async def work_order_list_async(
+    request: Request,
+    status: str = Query(None),
+    cursor: str = Query(None),
+    direction: str = Query("next", pattern="^(next|prev)$"),
+    page: int = Query(1, ge=1),
+    user=Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    service = AsyncWorkOrderService(db)
+    if status:
+        result = await service.get_page_by_status(
+            WorkOrderStatus(status), cursor=cursor, direction=direction, limit=PER_PAGE
+        )
+        total = await service.count_by_status(WorkOrderStatus(status))
+    else:
+        result = await service.get_page(cursor=cursor, direction=direction, limit=PER_PAGE)
+        total = await service.count()
+    return _list_response(request, user, status, page, result, total)
+
+
 @router.get("/create")
-async def create_form(
+def create_form(
     request: Request,
     vehicle_id: int = Query(None),
     customer_id: int = Query(None),
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    cust_service = CustomerService(db)
-    v_service = VehicleService(db)
-    auth_service = AuthService(db)
-
-    customers = cust_service.get_all(limit=500)
-    vehicles = v_service.get_all(limit=500)
-    technicians = auth_service.get_technicians()
+    # Customers and vehicles are picked through the /search typeahead
+    # endpoints; only a preselected one is loaded here.
+    vehicle = VehicleService(db).get_by_id(vehicle_id) if vehicle_id else None
+    if vehicle and not customer_id:
+        customer_id = vehicle.customer_id
+    customer = CustomerService(db).get_by_id(customer_id) if customer_id else None
 
     return request.app.state.templates.TemplateResponse(
         "work_orders/form.html",
@@ -74,11 +106,9 @@ async def create_form(
             "request": request,
             "user": user,
             "work_order": None,
-            "customers": customers,
-            "vehicles": vehicles,
-            "technicians": technicians,
-            "selected_vehicle_id": vehicle_id,
-            "selected_customer_id": customer_id,
+            "technicians": AuthService(db).get_technicians(),
+            "selected_vehicle": vehicle,
+            "selected_customer": customer,
             "statuses": WorkOrderStatus,
         },
     )
@@ -94,7 +124,7 @@ def _safe_int(val: str) -> int | None:
 
 
 @router.post("/create")
-async def create_work_order(
+def create_work_order(
     request: Request,
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -121,20 +151,19 @@ async def create_work_order(
 
 
 @router.get("/{wo_id}")
-async def work_order_detail(
+def work_order_detail(
     wo_id: int,
     request: Request,
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     service = WorkOrderService(db)
-    wo = service.get_by_id(wo_id)
+    wo = service.get_detail(wo_id)
     if not wo:
         return RedirectResponse("/work-orders", status_code=303)
 
     pay_service = PaymentService(db)
     inv_service = InvoiceService(db)
-    part_service = PartService(db)
     photo_service = PhotoService(db)
 
     from app.services.work_order_service import VALID_TRANSITIONS
@@ -142,7 +171,6 @@ async def work_order_detail(
     payments = pay_service.get_by_work_order(wo_id)
     total_paid = pay_service.get_total_for_work_order(wo_id)
     invoice = inv_service.get_by_work_order(wo_id)
-    parts = part_service.get_all(limit=500)
     photos = photo_service.get_by_work_order(wo_id)
 
     return request.app.state.templates.TemplateResponse(
@@ -156,7 +184,6 @@ async def work_order_detail(
             "total_paid": total_paid,
             "remaining": float(wo.grand_total) - total_paid,
             "invoice": invoice,
-            "parts": parts,
             "photos": photos,
             "item_types": WorkOrderItemType,
             "statuses": WorkOrderStatus,
@@ -165,39 +192,33 @@ async def work_order_detail(
 
 
 @router.get("/{wo_id}/edit")
-async def edit_form(
+def edit_form(
     wo_id: int,
     request: Request,
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     service = WorkOrderService(db)
-    wo = service.get_by_id(wo_id)
+    wo = service.get_detail(wo_id, with_items=False)
     if not wo:
         return RedirectResponse("/work-orders", status_code=303)
 
-    cust_service = CustomerService(db)
-    v_service = VehicleService(db)
-    auth_service = AuthService(db)
-
     return request.app.state.templates.TemplateResponse(
         "work_orders/form.html",
         {
             "request": request,
             "user": user,
             "work_order": wo,
-            "customers": cust_service.get_all(limit=500),
-            "vehicles": v_service.get_all(limit=500),
-            "technicians": auth_service.get_technicians(),
-            "selected_vehicle_id": wo.vehicle_id,
-            "selected_customer_id": wo.customer_id,
+            "technicians": AuthService(db).get_technicians(),
+            "selected_vehicle": wo.vehicle,
+            "selected_customer": wo.customer,
             "statuses": WorkOrderStatus,
         },
     )
 
 
 @router.post("/{wo_id}/edit")
-async def update_work_order(
+def update_work_order(
     wo_id: int,
     request: Request,
     user=Depends(get_current_user),
@@ -227,7 +248,7 @@ async def update_work_order(
 
 
 @router.post("/{wo_id}/status")
-async def change_status(
+def change_status(
     wo_id: int,
     request: Request,
     user=Depends(get_current_user),
@@ -243,7 +264,7 @@ async def change_status(
 
 
 @router.post("/{wo_id}/add-item")
-async def add_item(
+def add_item(
     wo_id: int,
     request: Request,
     user=Depends(get_current_user),
@@ -296,7 +317,7 @@ async def add_item(
 
 
 @router.post("/{wo_id}/remove-item/{item_id}")
-async def remove_item(
+def remove_item(
     wo_id: int,
     item_id: int,
     request: Request,
@@ -309,7 +330,7 @@ async def remove_item(
 
 
 @router.post("/{wo_id}/delete")
-async def delete_work_order(
+def delete_work_order(
     wo_id: int,
     request: Request,
     user=Depends(get_current_user),
@@ -347,7 +368,7 @@ async def upload_photo(
 
 
 @router.post("/{wo_id}/photos/{photo_id}/delete")
-async def delete_photo(
+def delete_photo(
     wo_id: int,
     photo_id: int,
     request: Request,
@@ -1,20 +1,31 @@
 from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.database import unit_of_work
 from app.models.customer import Customer
-from app.repositories.customer_repo import CustomerRepository
+from app.repositories.customer_repo import AsyncCustomerRepository, CustomerRepository
 from app.repositories.audit_log_repo import AuditLogRepository
 from app.core.enums import AuditAction
+from app.utils.pagination import OffsetPage, Page, NEXT
+from app.services.dashboard_service import invalidate_dashboard, ACTIVE_ORDERS, KPIS, RECENT_COMPLETED
+from app.services.report_service import invalidate_reports
+from app.utils.cache import invalidate_on_commit
+from app.utils.search import typeahead_cache
 
 
 class CustomerService:
     def __init__(self, db: Session):
+        self.db = db
         self.repo = CustomerRepository(db)
         self.audit = AuditLogRepository(db)
 
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Customer]:
         return self.repo.get_all(skip=skip, limit=limit)
 
+    def get_page(self, cursor: Optional[str] = None, direction: str = NEXT, limit: int = 20) -> Page:
+        return self.repo.get_page(cursor=cursor, direction=direction, limit=limit)
+
     def count(self) -> int:
         return self.repo.count()
 
@@ -24,32 +35,64 @@ class CustomerService:
     def search(self, query: str) -> List[Customer]:
         return self.repo.search(query)
 
+    def search_page(self, query: str, page: int = 1, per_page: int = 20) -> OffsetPage:
+        return self.repo.search_page(query, page=page, per_page=per_page)
+
     def create(self, data: dict, user_id: int = None) -> Customer:
-        customer = self.repo.create(data)
-        if user_id:
-            self.audit.log(user_id, "Customer", customer.id, AuditAction.CREATE, data)
-        return customer
+        with unit_of_work(self.db):
+            invalidate_dashboard(self.db, KPIS)
+            customer = self.repo.create(data)
+            if user_id:
+                self.audit.log(user_id, "Customer", customer.id, AuditAction.CREATE, data)
+            return customer
 
     def update(self, customer_id: int, data: dict, user_id: int = None) -> Optional[Customer]:
-        customer = self.repo.get_active_by_id(customer_id)
-        if not customer:
-            return None
-        # Track changes
-        changes = {}
-        for key, value in data.items():
-            old_val = getattr(customer, key, None)
-            if old_val != value:
-                changes[key] = {"old": str(old_val), "new": str(value)}
-        customer = self.repo.update(customer, data)
-        if user_id and changes:
-            self.audit.log(user_id, "Customer", customer.id, AuditAction.UPDATE, changes)
-        return customer
+        with unit_of_work(self.db):
+            invalidate_dashboard(self.db, RECENT_COMPLETED, ACTIVE_ORDERS)
+            customer = self.repo.get_active_by_id(customer_id)
+            if not customer:
+                return None
+            # Track changes
+            changes = {}
+            for key, value in data.items():
+                old_val = getattr(customer, key, None)
+                if old_val != value:
+                    changes[key] = {"old": str(old_val), "new": str(value)}
+            # The revenue report lists customer names for every date range
+            invalidate_reports(self.db, all_days="full_name" in changes)
+            # Vehicle suggestions carry their owner's name
+            invalidate_on_commit(self.db, typeahead_cache, "vehicles")
+            customer = self.repo.update(customer, data)
+            if user_id and changes:
+                self.audit.log(user_id, "Customer", customer.id, AuditAction.UPDATE, changes)
+            return customer
 
     def delete(self, customer_id: int, user_id: int = None) -> bool:
-        customer = self.repo.get_active_by_id(customer_id)
-        if not customer:
-            return False
-        self.repo.soft_delete(customer)
-        if user_id:
-            self.audit.log(user_id, "Customer", customer_id, AuditAction.DELETE)
-        return True
+        with unit_of_work(self.db):
+            invalidate_dashboard(self.db, KPIS)
+            invalidate_reports(self.db)
+            customer = self.repo.get_active_by_id(customer_id)
+            if not customer:
+                return False
+            self.repo.soft_delete(customer)
+            invalidate_on_commit(self.db, typeahead_cache, "vehicles")
+            if user_id:
+                self.audit.log(user_id, "Customer", customer_id, AuditAction.DELETE)
+            return True
+
+
+class AsyncCustomerService:
+    """Reads of the customer list and detail pages on an AsyncSession."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.repo = AsyncCustomerRepository(db)
+
+    async def get_page(self, cursor: Optional[str] = None, direction: str = NEXT, limit: int = 20) -> Page:
+        return await self.repo.get_page(cursor=cursor, direction=direction, limit=limit)
+
+    async def count(self) -> int:
+        return await self.repo.count()
+
+    async def get_by_id(self, customer_id: int) -> Optional[Customer]:
+        return await self.repo.get_active_by_id(customer_id)
@@ -0,0 +1,40 @@
+from datetime import date
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.repositories.dashboard_repo import DashboardRepository
+from app.utils.cache import TTLCache, invalidate_on_commit
+
+# Dashboard widgets, cached separately so a write only drops what it affects
+KPIS = "kpis"
+LOW_STOCK = "low_stock"
+RECENT_COMPLETED = "recent_completed"
+ACTIVE_ORDERS = "active_orders"
+ORDER_WIDGETS = (KPIS, RECENT_COMPLETED, ACTIVE_ORDERS)
+
+dashboard_cache = TTLCache("dashboard", default_ttl=settings.DASHBOARD_CACHE_TTL)
+
+
+def invalidate_dashboard(db: Session, *widgets: str) -> None:
+    """Drop the given dashboard widgets once db's transaction commits."""
+    invalidate_on_commit(db, dashboard_cache, *widgets)
+
+
+class DashboardService:
+    def __init__(self, db: Session):
+        self.repo = DashboardRepository(db)
+
+    def get_dashboard(self) -> dict:
+        """Everything the dashboard page shows: KPIs plus the three short lists."""
+        # KPIs are keyed by day so "revenue today" rolls over at midnight
+        data = dict(dashboard_cache.get_or_set((KPIS, date.today()), self.repo.get_kpis))
+        data.update(
+            low_stock_parts=dashboard_cache.get_or_set(LOW_STOCK, self.repo.get_low_stock),
+            recent_completed=dashboard_cache.get_or_set(
+                RECENT_COMPLETED, lambda: self.repo.get_recent_completed(5)
+            ),
+            active_work_orders=dashboard_cache.get_or_set(
+                ACTIVE_ORDERS, lambda: self.repo.get_active_orders(5)
+            ),
+        )
+        return data
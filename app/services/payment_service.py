@@ -1,14 +1,19 @@
+from datetime import date
 from typing import List, Optional
 from sqlalchemy.orm import Session
 
+from app.core.database import unit_of_work
 from app.models.payment import Payment
 from app.repositories.payment_repo import PaymentRepository
 from app.repositories.audit_log_repo import AuditLogRepository
 from app.core.enums import AuditAction
+from app.services.dashboard_service import invalidate_dashboard, KPIS
+from app.services.report_service import invalidate_reports
 
 
 class PaymentService:
     def __init__(self, db: Session):
+        self.db = db
         self.repo = PaymentRepository(db)
         self.audit = AuditLogRepository(db)
 
@@ -19,16 +24,22 @@ class PaymentService:
         return self.repo.get_total_for_work_order(work_order_id)
 
     def create(self, data: dict, user_id: int = None) -> Payment:
-        payment = self.repo.create(data)
-        if user_id:
-            self.audit.log(user_id, "Payment", payment.id, AuditAction.CREATE, data)
-        return payment
+        with unit_of_work(self.db):
+            invalidate_dashboard(self.db, KPIS)
+            invalidate_reports(self.db, date.today())
+            payment = self.repo.create(data)
+            if user_id:
+                self.audit.log(user_id, "Payment", payment.id, AuditAction.CREATE, data)
+            return payment
 
     def delete(self, payment_id: int, user_id: int = None) -> bool:
-        payment = self.repo.get_by_id(payment_id)
-        if not payment:
-            return False
-        self.repo.hard_delete(payment)
-        if user_id:
-            self.audit.log(user_id, "Payment", payment_id, AuditAction.DELETE)
-        return True
+        with unit_of_work(self.db):
+            invalidate_dashboard(self.db, KPIS)
+            invalidate_reports(self.db, date.today())
+            payment = self.repo.get_by_id(payment_id)
+            if not payment:
+                return False
+            self.repo.hard_delete(payment)
+            if user_id:
+                self.audit.log(user_id, "Payment", payment_id, AuditAction.DELETE)
+            return True
@@ -0,0 +1,127 @@
+import time
+from datetime import date, datetime, timedelta
+from typing import Iterator, Optional
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.repositories.daily_revenue_repo import DailyRevenueRepository
+from app.repositories.report_repo import ReportRepository
+from app.utils.cache import TTLCache, on_commit
+
+# Column headers of each report's export, in row order
+EXPORT_HEADERS = {
+    "revenue": ["İş Emri", "Tamamlanma", "Plaka", "Müşteri", "İşçilik", "Parça", "KDV", "Toplam"],
+    "technician": ["Teknisyen", "Tamamlanan İş", "Toplam Gelir", "Ort. Tutar", "İşçilik Payı (%)", "Ort. Teslim Süresi (saat)"],
+    "vehicles": ["Plaka", "Marka", "Model", "Müşteri", "İş Emri Sayısı"],
+    "parts": ["Stok Kodu", "Parça Adı", "Toplam Kullanım"],
+    "debt": ["Müşteri", "Telefon", "Borç"],
+}
+
+# Rows fetched per round trip while exporting
+EXPORT_BATCH_SIZE = 1000
+
+# Reports filtered by completion date; the others show current state and
+# are cached once, whatever range the page asks for
+DATED_REPORTS = ("revenue", "technician")
+
+report_cache = TTLCache("reports", default_ttl=settings.REPORT_CACHE_TTL, max_entries=settings.REPORT_CACHE_SIZE)
+
+
+def invalidate_reports(db: Session, day: Optional[date] = None, all_days: bool = False) -> None:
+    """Once db commits, drop the undated reports and, if day is given, every
+    dated report whose range includes that completion day. all_days drops
+    every dated report too, for edits to what their rows display (a
+    customer's name, a vehicle's plate) rather than to the orders in them.
+    """
+    def affected(key) -> bool:
+        report_type, start, end = key
+        if report_type not in DATED_REPORTS or all_days:
+            return True
+        return day is not None and start <= day <= end
+
+    on_commit(db, lambda: report_cache.invalidate_where(affected))
+
+
+def _rounded(value, digits: int):
+    return round(float(value), digits) if value is not None else None
+
+
+class ReportService:
+    def __init__(self, db: Session):
+        self.repo = ReportRepository(db)
+        self.revenue = DailyRevenueRepository(db)
+
+    def get_report(self, report_type: str, start: date, end: date) -> dict:
+        """Template data for one report, served from report_cache when possible.
+
+        start and end are inclusive dates. The result carries a "report_cache"
+        entry (hit, timing, when it was computed) for the page footer.
+        """
+        if report_type not in EXPORT_HEADERS:
+            return {}
+        dated = report_type in DATED_REPORTS
+        key = (report_type, start, end) if dated else (report_type, None, None)
+        # A range that ended before today only changes if an old order is edited
+        ttl = settings.REPORT_CACHE_PAST_TTL if dated and end < date.today() else None
+
+        computed = []
+
+        def load():
+            computed.append(True)
+            return {"data": self._build_report(report_type, start, end), "computed_at": datetime.now()}
+
+        started = time.perf_counter()
+        entry = report_cache.get_or_set(key, load, ttl=ttl)
+        return {
+            **entry["data"],
+            "report_cache": {
+                "hit": not computed,
+                "elapsed_ms": (time.perf_counter() - started) * 1000,
+                "computed_at": entry["computed_at"],
+            },
+        }
+
+    def _build_report(self, report_type: str, start: date, end: date) -> dict:
+        if report_type == "revenue":
+            totals = self.revenue.totals_between(start, end + timedelta(days=1))
+            return {
+                "orders": self.repo.get_closed_orders(start, end),
+                "total_revenue": float(totals["grand_total"]),
+            }
+        if report_type == "technician":
+            return {"tech_stats": self.repo.get_technician_stats(start, end)}
+        if report_type == "vehicles":
+            return {"vehicle_stats": self.repo.get_most_serviced_vehicles()}
+        if report_type == "parts":
+            return {"part_stats": self.repo.get_most_used_parts()}
+        if report_type == "debt":
+            return {"customers_with_debt": self.repo.get_customers_with_debt()}
+        return {}
+
+    def export_rows(self, report_type: str, start: date, end: date) -> Iterator[tuple]:
+        """Rows of one report in EXPORT_HEADERS order.
+
+        Long reports are read with yield_per, so only one batch of rows is
+        held in memory at a time however large the date range is.
+        """
+        if report_type == "revenue":
+            for o in self.repo.closed_orders_query(start, end).yield_per(EXPORT_BATCH_SIZE):
+                yield (
+                    o.work_order_number, o.completed_at.replace(microsecond=0), o.plate_number, o.customer_name,
+                    o.labor_total, o.parts_total, o.vat_total, o.grand_total,
+                )
+        elif report_type == "technician":
+            for ts in self.repo.get_technician_stats(start, end):
+                yield (
+                    ts.full_name, ts.order_count, ts.revenue, _rounded(ts.avg_ticket, 2),
+                    _rounded(ts.labor_share, 1), _rounded(ts.avg_turnaround_hours, 1),
+                )
+        elif report_type == "vehicles":
+            for v in self.repo.get_most_serviced_vehicles():
+                yield v.plate_number, v.brand, v.model, v.customer_name, v.order_count
+        elif report_type == "parts":
+            for name, code, total_used in self.repo.get_most_used_parts():
+                yield code, name, total_used
+        elif report_type == "debt":
+            for c in self.repo.customers_with_debt_query().yield_per(EXPORT_BATCH_SIZE):
+                yield c.full_name, c.phone, c.total_debt
@@ -0,0 +1,192 @@
+import re
+from typing import List, Optional, Tuple
+from sqlalchemy.orm import Session
+
+from app.repositories.customer_repo import CustomerRepository
+from app.repositories.part_repo import PartRepository
+from app.repositories.vehicle_repo import VehicleRepository
+from app.repositories.work_order_repo import WorkOrderRepository
+from app.services.vehicle_service import VehicleService
+from app.utils.search import typeahead_cache
+from app.utils.text import fold_text, plate_key
+
+# Query kinds, each answered by one indexed lookup
+ORDER_NUMBER = "order_number"
+PHONE = "phone"
+PLATE = "plate"
+STOCK_CODE = "stock_code"
+TEXT = "text"
+
+# Matches per source, and in the merged result
+RESULTS_PER_SOURCE = 5
+MAX_RESULTS = 20
+
+# Options returned per typeahead request
+SUGGESTION_LIMIT = 10
+
+# On the compact (plate_key) form: "IS-202610-0042" -> "IS2026100042"
+_ORDER_NUMBER = re.compile(r"IS(\d{1,10})")
+# 34 ABC 123, or its start (34 AB)
+_PLATE = re.compile(r"\d{2}[A-Z]{1,3}\d{0,5}")
+# Only characters people type in phone numbers
+_PHONE_CHARS = re.compile(r"[\d\s()+\-.]+")
+_LETTER = re.compile(r"[^\W\d_]")
+
+
+def classify_query(query: str) -> Tuple[str, str]:
+    """(kind, normalized query) for what the user most likely typed."""
+    raw = (query or "").strip()
+    compact = plate_key(raw)
+    if not compact:
+        return TEXT, raw
+    order = _ORDER_NUMBER.fullmatch(compact)
+    if order:
+        digits = order.group(1)
+        return ORDER_NUMBER, f"IS-{digits[:6]}" + (f"-{digits[6:]}" if len(digits) > 6 else "")
+    if _PHONE_CHARS.fullmatch(raw):
+        digits = re.sub(r"\D", "", raw)
+        if len(digits) >= 7:
+            if len(digits) == 12 and digits.startswith("90"):
+                digits = digits[2:]
+            if len(digits) == 10 and digits.startswith("5"):
+                digits = "0" + digits
+            return PHONE, digits
+    if _PLATE.fullmatch(compact):
+        return PLATE, compact
+    if " " not in raw and _LETTER.search(raw) and (any(ch.isdigit() for ch in raw) or "-" in raw):
+        return STOCK_CODE, raw
+    return TEXT, raw
+
+
+def _hit(kind: str, id: int, title: str, subtitle: str, url: str) -> dict:
+    return {"type": kind, "id": id, "title": title, "subtitle": subtitle or "", "url": url}
+
+
+def _customers(db: Session, query: str, limit: int) -> List[dict]:
+    return [
+        _hit("customer", c.id, c.full_name, c.phone, f"/customers/{c.id}")
+        for c in CustomerRepository(db).search(query, limit=limit)
+    ]
+
+
+def _vehicles(db: Session, query: str, limit: int) -> List[dict]:
+    return [
+        _hit("vehicle", v.id, v.plate_number, f"{v.brand} {v.model}", f"/vehicles/{v.id}")
+        for v in VehicleService(db).search(query, limit=limit)
+    ]
+
+
+def _parts(db: Session, query: str, limit: int) -> List[dict]:
+    return [
+        _hit("part", p.id, p.name, p.stock_code, f"/parts/{p.id}/edit")
+        for p in PartRepository(db).search(query, limit=limit)
+    ]
+
+
+def _work_orders(db: Session, number: str, limit: int) -> List[dict]:
+    return [
+        _hit("work_order", o.id, o.work_order_number, f"{o.plate_number} · {o.customer_name}", f"/work-orders/{o.id}")
+        for o in WorkOrderRepository(db).find_by_number(number, limit=limit)
+    ]
+
+
+# Kind -> the lookup that answers it
+_LOOKUPS = {
+    ORDER_NUMBER: _work_orders,
+    PHONE: _customers,
+    PLATE: _vehicles,
+    STOCK_CODE: _parts,
+}
+
+# Sources searched for queries that fit no single kind. They run one after
+# the other: each is an indexed lookup of a few ms, and running them on
+# threads measured no faster (the time goes to building rows under the GIL).
+FANOUT_SOURCES = (_customers, _vehicles, _parts)
+
+
+def _merge(query: str, results: List[List[dict]]) -> List[dict]:
+    """Interleave per-source results by rank (1st of each, then 2nd, ...);
+    a title equal to the query goes first whatever its source.
+    """
+    folded = fold_text(query)
+    scored = []
+    for source_index, hits in enumerate(results):
+        for rank, hit in enumerate(hits):
+            exact = fold_text(hit["title"]) == folded or fold_text(hit["subtitle"]) == folded
+            scored.append(((not exact, rank, source_index), hit))
+    scored.sort(key=lambda item: item[0])
+    return [hit for _, hit in scored[:MAX_RESULTS]]
+
+
+class SearchService:
+    """One search box for customers, vehicles, work orders and parts."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def search(self, query: str) -> dict:
+        """Classify query and run the lookup for its kind; free text (or a
+        lookup that finds nothing) is searched in every source and merged.
+        """
+        if not fold_text(query):
+            # Punctuation only: the fanout would match every search_key
+            return {"kind": TEXT, "results": []}
+        kind, normalized = classify_query(query)
+        lookup = _LOOKUPS.get(kind)
+        if lookup:
+            hits = lookup(self.db, normalized, MAX_RESULTS)
+            if hits:
+                return {"kind": kind, "results": hits}
+        results = [source(self.db, query, RESULTS_PER_SOURCE) for source in FANOUT_SOURCES]
+        return {"kind": TEXT, "results": _merge(query, results)}
+
+    def _suggest(self, table: str, scope: Optional[int], query: str, loader) -> List[dict]:
+        """Typeahead results from typeahead_cache, keyed by what was typed."""
+        return typeahead_cache.get_or_set((table, scope, fold_text(query)), loader)
+
+    def suggest_customers(self, query: str) -> List[dict]:
+        if not fold_text(query):
+            return []
+        return self._suggest("customers", None, query, lambda: _customers(self.db, query, SUGGESTION_LIMIT))
+
+    def suggest_vehicles(self, query: str, customer_id: Optional[int] = None) -> List[dict]:
+        """Vehicles matching query; with customer_id, that customer's vehicles
+        (all of them for an empty query). Each carries its owner so picking
+        a vehicle first can fill in the customer.
+        """
+        if customer_id is None and not fold_text(query):
+            return []
+
+        def load() -> List[dict]:
+            repo = VehicleRepository(self.db)
+            if customer_id is not None:
+                vehicles = repo.find_for_customer(customer_id, query, limit=SUGGESTION_LIMIT)
+            else:
+                vehicles = VehicleService(self.db).search(query, limit=SUGGESTION_LIMIT)
+            owners = dict(CustomerRepository(self.db).get_names({v.customer_id for v in vehicles}))
+            return [
+                {
+                    **_hit("vehicle", v.id, v.plate_number, f"{v.brand} {v.model}", f"/vehicles/{v.id}"),
+                    "customer_id": v.customer_id,
+                    "customer_name": owners.get(v.customer_id, ""),
+                }
+                for v in vehicles
+            ]
+
+        return self._suggest("vehicles", customer_id, query, load)
+
+    def suggest_parts(self, query: str) -> List[dict]:
+        """Active parts with the price and stock the work order item form fills in."""
+        if not fold_text(query):
+            return []
+
+        def load() -> List[dict]:
+            return [
+                {
+                    **_hit("part", p.id, p.name, f"{p.stock_code} · Stok: {p.stock_quantity}", f"/parts/{p.id}/edit"),
+                    "sale_price": float(p.sale_price),
+                }
+                for p in PartRepository(self.db).search(query, limit=SUGGESTION_LIMIT)
+            ]
+
+        return self._suggest("parts", None, query, load)
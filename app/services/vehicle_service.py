@@ -1,62 +1,118 @@
 from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.database import unit_of_work
 from app.models.vehicle import Vehicle
-from app.repositories.vehicle_repo import VehicleRepository
+from app.repositories.vehicle_repo import AsyncVehicleRepository, VehicleRepository
 from app.repositories.audit_log_repo import AuditLogRepository
 from app.core.enums import AuditAction
+from app.utils.pagination import OffsetPage, Page, NEXT
+from app.services.dashboard_service import invalidate_dashboard, ACTIVE_ORDERS, RECENT_COMPLETED
+from app.services.report_service import invalidate_reports
 
 
 class VehicleService:
     def __init__(self, db: Session):
+        self.db = db
         self.repo = VehicleRepository(db)
         self.audit = AuditLogRepository(db)
 
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Vehicle]:
         return self.repo.get_all(skip=skip, limit=limit)
 
+    def get_page(self, cursor: Optional[str] = None, direction: str = NEXT, limit: int = 20) -> Page:
+        return self.repo.get_page(cursor=cursor, direction=direction, limit=limit)
+
     def count(self) -> int:
         return self.repo.count()
 
     def get_by_id(self, vehicle_id: int) -> Optional[Vehicle]:
         return self.repo.get_active_by_id(vehicle_id)
 
+    def get_detail(self, vehicle_id: int) -> Optional[Vehicle]:
+        return self.repo.get_detail(vehicle_id)
+
     def get_by_customer(self, customer_id: int) -> List[Vehicle]:
         return self.repo.get_by_customer(customer_id)
 
-    def search(self, query: str) -> List[Vehicle]:
-        return self.repo.search(query)
+    def search(self, query: str, limit: int = 50) -> List[Vehicle]:
+        # Same order as search_page(): plate matches, else full-text search
+        if any(ch.isdigit() for ch in query):
+            vehicles = self.repo.lookup_plate(query, limit=limit)
+            if vehicles:
+                return vehicles
+        return self.repo.search(query, limit=limit)
+
+    def search_page(self, query: str, page: int = 1, per_page: int = 20) -> OffsetPage:
+        # Input with a digit is nearly always a plate or its last digits;
+        # fall back to full-text search when no plate matches.
+        if any(ch.isdigit() for ch in query):
+            total = self.repo.count_plate_matches(query)
+            if total:
+                result = OffsetPage(total=total, per_page=per_page)
+                result.page = min(page, result.total_pages)
+                result.items = self.repo.lookup_plate(query, skip=(result.page - 1) * per_page, limit=per_page)
+                return result
+        return self.repo.search_page(query, page=page, per_page=per_page)
 
     def create(self, data: dict, user_id: int = None) -> Vehicle:
-        # Normalize plate number
-        if "plate_number" in data:
-            data["plate_number"] = data["plate_number"].upper().strip()
-        vehicle = self.repo.create(data)
-        if user_id:
-            self.audit.log(user_id, "Vehicle", vehicle.id, AuditAction.CREATE, data)
-        return vehicle
+        with unit_of_work(self.db):
+            # Normalize plate number
+            if "plate_number" in data:
+                data["plate_number"] = data["plate_number"].upper().strip()
+            vehicle = self.repo.create(data)
+            if user_id:
+                self.audit.log(user_id, "Vehicle", vehicle.id, AuditAction.CREATE, data)
+            return vehicle
 
     def update(self, vehicle_id: int, data: dict, user_id: int = None) -> Optional[Vehicle]:
-        vehicle = self.repo.get_active_by_id(vehicle_id)
-        if not vehicle:
-            return None
-        if "plate_number" in data:
-            data["plate_number"] = data["plate_number"].upper().strip()
-        changes = {}
-        for key, value in data.items():
-            old_val = getattr(vehicle, key, None)
-            if old_val != value:
-                changes[key] = {"old": str(old_val), "new": str(value)}
-        vehicle = self.repo.update(vehicle, data)
-        if user_id and changes:
-            self.audit.log(user_id, "Vehicle", vehicle.id, AuditAction.UPDATE, changes)
-        return vehicle
+        with unit_of_work(self.db):
+            invalidate_dashboard(self.db, RECENT_COMPLETED, ACTIVE_ORDERS)
+            vehicle = self.repo.get_active_by_id(vehicle_id)
+            if not vehicle:
+                return None
+            if "plate_number" in data:
+                data["plate_number"] = data["plate_number"].upper().strip()
+            changes = {}
+            for key, value in data.items():
+                old_val = getattr(vehicle, key, None)
+                if old_val != value:
+                    changes[key] = {"old": str(old_val), "new": str(value)}
+            # The revenue report lists plates for every date range
+            invalidate_reports(self.db, all_days="plate_number" in changes)
+            vehicle = self.repo.update(vehicle, data)
+            if user_id and changes:
+                self.audit.log(user_id, "Vehicle", vehicle.id, AuditAction.UPDATE, changes)
+            return vehicle
 
     def delete(self, vehicle_id: int, user_id: int = None) -> bool:
-        vehicle = self.repo.get_active_by_id(vehicle_id)
-        if not vehicle:
-            return False
-        self.repo.soft_delete(vehicle)
-        if user_id:
-            self.audit.log(user_id, "Vehicle", vehicle_id, AuditAction.DELETE)
-        return True
+        with unit_of_work(self.db):
+            invalidate_reports(self.db)
+            vehicle = self.repo.get_active_by_id(vehicle_id)
+            if not vehicle:
+                return False
+            self.repo.soft_delete(vehicle)
+            if user_id:
+                self.audit.log(user_id, "Vehicle", vehicle_id, AuditAction.DELETE)
+            return True
+
+
+class AsyncVehicleService:
+    """Reads of the vehicle list and detail pages on an AsyncSession."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.repo = AsyncVehicleRepository(db)
+
+    async def get_page(self, cursor: Optional[str] = None, direction: str = NEXT, limit: int = 20) -> Page:
+        return await self.repo.get_page(cursor=cursor, direction=direction, limit=limit)
+
+    async def count(self) -> int:
+        return await self.repo.count()
+
+    async def get_detail(self, vehicle_id: int) -> Optional[Vehicle]:
+        return await self.repo.get_detail(vehicle_id)
+
+    async def get_by_customer(self, customer_id: int) -> List[Vehicle]:
+        return await self.repo.get_by_customer(customer_id)
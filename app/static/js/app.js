@@ -12,3 +12,117 @@ document.addEventListener('DOMContentLoaded', function () {
         alerts.forEach(a => a.style.display = 'none');
     }, 5000);
 });
+
+// Typeahead: a text input that looks options up as the user types and
+// stores the chosen id in a hidden input.
+//   input     text input showing the chosen option
+//   hidden    hidden input submitted with the form
+//   url       JSON endpoint returning {results: [{id, title, subtitle, ...}]}
+//   params()  extra query parameters (optional)
+//   onSelect(item)  called after an option is chosen (optional)
+//   allowEmpty()  whether to query for an empty input, e.g. to list a
+//                 customer's vehicles on focus (optional)
+// A required input only validates once an option has been chosen.
+function typeahead(options) {
+    const input = options.input;
+    const hidden = options.hidden;
+    const wrapper = document.createElement('div');
+    wrapper.className = 'typeahead';
+    input.parentNode.insertBefore(wrapper, input);
+    wrapper.appendChild(input);
+    const menu = document.createElement('div');
+    menu.className = 'typeahead-menu';
+    menu.style.display = 'none';
+    wrapper.appendChild(menu);
+
+    let items = [];
+    let active = -1;
+    let timer = null;
+    let controller = null;
+
+    function allowEmpty() {
+        return options.allowEmpty ? options.allowEmpty() : false;
+    }
+
+    function validate() {
+        if (input.required) input.setCustomValidity(hidden.value ? '' : 'Lütfen listeden seçiniz.');
+    }
+
+    function close() {
+        menu.style.display = 'none';
+        active = -1;
+    }
+
+    function highlight(index) {
+        active = index;
+        menu.querySelectorAll('.typeahead-option').forEach((el, i) => {
+            el.classList.toggle('active', i === active);
+            if (i === active) el.scrollIntoView({ block: 'nearest' });
+        });
+    }
+
+    function choose(item) {
+        hidden.value = item.id;
+        input.value = item.subtitle ? `${item.title} (${item.subtitle})` : item.title;
+        hidden.dispatchEvent(new Event('change'));
+        close();
+        if (options.onSelect) options.onSelect(item);
+    }
+
+    function render() {
+        menu.innerHTML = '';
+        if (!items.length) {
+            menu.innerHTML = '<div class="typeahead-empty">Sonuç bulunamadı</div>';
+        }
+        items.forEach((item, i) => {
+            const el = document.createElement('div');
+            el.className = 'typeahead-option';
+            el.textContent = item.title;
+            if (item.subtitle) {
+                const sub = document.createElement('small');
+                sub.textContent = item.subtitle;
+                el.appendChild(sub);
+            }
+            // mousedown fires before the input's blur closes the menu
+            el.addEventListener('mousedown', e => { e.preventDefault(); choose(item); });
+            el.addEventListener('mouseenter', () => highlight(i));
+            menu.appendChild(el);
+        });
+        menu.style.display = '';
+        highlight(items.length ? 0 : -1);
+    }
+
+    function lookup() {
+        const q = input.value.trim();
+        if (!q && !allowEmpty()) { close(); return; }
+        // Only the latest request may render
+        if (controller) controller.abort();
+        controller = new AbortController();
+        const params = new URLSearchParams({ q, ...(options.params ? options.params() : {}) });
+        fetch(`${options.url}?${params}`, { signal: controller.signal, headers: { 'Accept': 'application/json' } })
+            .then(r => r.json())
+            .then(data => { items = data.results || []; render(); })
+            .catch(err => { if (err.name !== 'AbortError') close(); });
+    }
+
+    input.setAttribute('autocomplete', 'off');
+    hidden.addEventListener('change', validate);
+    validate();
+    input.addEventListener('input', () => {
+        hidden.value = '';
+        hidden.dispatchEvent(new Event('change'));
+        clearTimeout(timer);
+        timer = setTimeout(lookup, options.delay || 250);
+    });
+    input.addEventListener('focus', () => { if (!hidden.value && allowEmpty()) lookup(); });
+    input.addEventListener('blur', close);
+    input.addEventListener('keydown', e => {
+        if (menu.style.display === 'none') return;
+        if (e.key === 'ArrowDown') { e.preventDefault(); highlight(Math.min(active + 1, items.length - 1)); }
+        else if (e.key === 'ArrowUp') { e.preventDefault(); highlight(Math.max(active - 1, 0)); }
+        else if (e.key === 'Enter' && active >= 0) { e.preventDefault(); choose(items[active]); }
+        else if (e.key === 'Escape') { close(); }
+    });
+
+    return { lookup, close };
+}
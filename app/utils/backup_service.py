@@ -1,8 +1,20 @@
-import shutil
 import os
+import sqlite3
+from contextlib import closing
 from datetime import datetime
 from pathlib import Path
 from app.core.config import settings
+from app.utils.cache import invalidate_all_caches
+
+
+def _copy_database(source, target) -> None:
+    """Copy a database through SQLite's backup API.
+
+    Unlike a file copy this includes pages still in the WAL, and the app's
+    open connections see the new contents instead of a file swapped under them.
+    """
+    with closing(sqlite3.connect(source)) as src, closing(sqlite3.connect(target)) as dst:
+        src.backup(dst)
 
 
 class BackupService:
@@ -17,7 +29,7 @@ class BackupService:
         backup_filename = f"otoservis_backup_{timestamp}.db"
         backup_path = settings.BACKUP_DIR / backup_filename
 
-        shutil.copy2(db_path, backup_path)
+        _copy_database(db_path, backup_path)
         return str(backup_path)
 
     @staticmethod
@@ -44,9 +56,11 @@ class BackupService:
         db_path = settings.DATABASE_URL.replace("sqlite:///", "")
         # Create a pre-restore backup
         pre_restore = settings.BACKUP_DIR / f"pre_restore_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
-        shutil.copy2(db_path, pre_restore)
+        _copy_database(db_path, pre_restore)
         # Restore
-        shutil.copy2(backup_path, db_path)
+        _copy_database(backup_path, db_path)
+        # Cached reports, dashboard widgets and search results describe the old data
+        invalidate_all_caches()
         return True
 
     @staticmethod
@@ -0,0 +1,128 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+_caches: Dict[str, "TTLCache"] = {}
+
+
+class TTLCache:
+    """Small thread-safe in-process cache with per-key TTL and hit/miss counters.
+
+    Entries are normally dropped by explicit invalidation after a write
+    commits; the TTL only bounds staleness for changes nobody invalidates
+    (e.g. another process writing to the same database). With max_entries
+    set, the least recently used entry is evicted once the cache is full.
+    """
+
+    def __init__(self, name: str, default_ttl: float = 60.0, max_entries: Optional[int] = None):
+        self.name = name
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by every invalidation; a value computed while one happened
+        # may already be stale, so it is returned but not stored.
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+        _caches[name] = self
+
+    def get_or_set(self, key: Hashable, loader: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry[1]
+            self.misses += 1
+            generation = self._generation
+        value = loader()
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (now + (self.default_ttl if ttl is None else ttl), value)
+                self._entries.move_to_end(key)
+                while self.max_entries is not None and len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+    def invalidate(self, *keys: Hashable) -> None:
+        """Drop the given keys (or entries whose key starts with them), or everything."""
+        with self._lock:
+            self._generation += 1
+            self.invalidations += 1
+            if not keys:
+                self._entries.clear()
+                return
+            for cached in list(self._entries):
+                base = cached[0] if isinstance(cached, tuple) else cached
+                if cached in keys or base in keys:
+                    del self._entries[cached]
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop every entry whose key matches predicate."""
+        with self._lock:
+            self._generation += 1
+            self.invalidations += 1
+            for cached in [k for k in self._entries if predicate(k)]:
+                del self._entries[cached]
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+                "invalidations": self.invalidations,
+                "evictions": self.evictions,
+                "max_entries": self.max_entries,
+                "default_ttl": self.default_ttl,
+            }
+
+
+def get_cache_stats() -> dict:
+    return {name: cache.stats() for name, cache in _caches.items()}
+
+
+def invalidate_all_caches() -> None:
+    """Empty every cache, e.g. after the database file was replaced."""
+    for cache in _caches.values():
+        cache.invalidate()
+
+
+# Session.info key collecting invalidation callbacks to run once the session commits
+_PENDING = "cache_invalidations"
+
+
+def on_commit(db: Session, invalidation: Callable[[], None]) -> None:
+    """Run a cache invalidation after db's current transaction commits.
+
+    Dropping entries earlier would let a concurrent reader re-cache the old
+    values before the write is visible; a rollback discards the request.
+    """
+    db.info.setdefault(_PENDING, []).append(invalidation)
+
+
+def invalidate_on_commit(db: Session, cache: TTLCache, *keys: Hashable) -> None:
+    """Invalidate cache keys after db's current transaction commits."""
+    on_commit(db, lambda: cache.invalidate(*keys))
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_invalidations(session: Session) -> None:
+    for invalidation in session.info.pop(_PENDING, []):
+        invalidation()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_invalidations(session: Session) -> None:
+    session.info.pop(_PENDING, None)
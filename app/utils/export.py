@@ -0,0 +1,45 @@
+import csv
+import io
+import tempfile
+from typing import Any, Iterable, Iterator, Sequence
+
+from openpyxl import Workbook
+
+# Rows buffered before a CSV chunk is yielded to the response
+CSV_CHUNK_ROWS = 500
+# Block size used to stream the finished XLSX file
+FILE_CHUNK_SIZE = 64 * 1024
+
+
+def stream_csv(headers: Sequence[str], rows: Iterable[Sequence[Any]]) -> Iterator[bytes]:
+    """Yield a UTF-8 CSV (with BOM so Excel detects the encoding) in chunks."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write("\ufeff")
+    writer.writerow(headers)
+    for count, row in enumerate(rows, start=1):
+        writer.writerow(row)
+        if count % CSV_CHUNK_ROWS == 0:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode("utf-8")
+
+
+def stream_xlsx(headers: Sequence[str], rows: Iterable[Sequence[Any]], title: str = "Rapor") -> Iterator[bytes]:
+    """Yield an XLSX workbook with one sheet.
+
+    A write-only workbook keeps rows in temporary files instead of memory;
+    the zip can only be produced once every row is written, so it is saved
+    to a temporary file and streamed from there.
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title=title[:31])
+    sheet.append(list(headers))
+    for row in rows:
+        sheet.append(list(row))
+    with tempfile.TemporaryFile() as output:
+        workbook.save(output)
+        output.seek(0)
+        while chunk := output.read(FILE_CHUNK_SIZE):
+            yield chunk
@@ -0,0 +1,138 @@
+"""Database maintenance commands.
+
+Usage:
+    python -m app.utils.maintenance check-counters
+    python -m app.utils.maintenance rebuild-counters
+    python -m app.utils.maintenance check-totals
+    python -m app.utils.maintenance fix-totals
+    python -m app.utils.maintenance check-revenue
+    python -m app.utils.maintenance rebuild-revenue
+    python -m app.utils.maintenance rebuild-search
+    python -m app.utils.maintenance check-plates
+"""
+import argparse
+import sys
+
+from app.core.database import SessionLocal, init_db
+from app.repositories.customer_repo import CustomerRepository
+from app.repositories.daily_revenue_repo import DailyRevenueRepository
+from app.repositories.part_repo import PartRepository
+from app.repositories.vehicle_repo import VehicleRepository
+from app.repositories.work_order_repo import WorkOrderRepository
+from app.services.work_order_service import WorkOrderService
+
+COUNTED_REPOSITORIES = [CustomerRepository, VehicleRepository, WorkOrderRepository, PartRepository]
+
+
+def check_counters(db) -> int:
+    """Compare entity_counters against COUNT(*); returns the number of drifted tables."""
+    drifted = 0
+    for repo_cls in COUNTED_REPOSITORIES:
+        repo = repo_cls(db)
+        stored = repo.counters.get(repo.model.__tablename__)
+        actual = repo.count_live_rows()
+        status = "OK" if stored == actual else "DRIFT"
+        drifted += stored != actual
+        print(f"{repo.model.__tablename__:<12} stored={stored} actual={actual} {status}")
+    return drifted
+
+
+def rebuild_counters(db) -> int:
+    """Overwrite every counter with a fresh COUNT(*)."""
+    for repo_cls in COUNTED_REPOSITORIES:
+        repo = repo_cls(db)
+        stored, actual = repo.rebuild_counter()
+        print(f"{repo.model.__tablename__:<12} {stored} -> {actual}")
+    return 0
+
+
+def _report_totals(drift: list, verb: str) -> int:
+    for entry in drift:
+        fields = ", ".join(f"{k} {v['stored']} != {v['expected']}" for k, v in entry["fields"].items())
+        print(f"{entry['work_order_number']}: {fields}")
+    print(f"{len(drift)} work order(s) {verb}")
+    return len(drift)
+
+
+def check_totals(db) -> int:
+    """Recompute work order totals from their items and list any drift."""
+    return _report_totals(WorkOrderService(db).verify_totals(), "with drifted totals")
+
+
+def fix_totals(db) -> int:
+    """Overwrite drifted work order totals with the recomputed values."""
+    _report_totals(WorkOrderService(db).verify_totals(fix=True), "fixed")
+    return 0
+
+
+def check_revenue(db) -> int:
+    """Compare the daily_revenue rollup with a fresh aggregate over work_orders."""
+    drift = DailyRevenueRepository(db).find_drift()
+    for entry in drift:
+        fields = ", ".join(f"{k} {v['stored']} != {v['expected']}" for k, v in entry["fields"].items())
+        print(f"{entry['day']} technician={entry['technician_id']}: {fields}")
+    print(f"{len(drift)} rollup row(s) drifted")
+    return len(drift)
+
+
+def rebuild_revenue(db) -> int:
+    """Recompute the daily_revenue rollup from work_orders."""
+    before, after = DailyRevenueRepository(db).rebuild()
+    print(f"daily_revenue {before} -> {after} rows")
+    return 0
+
+
+def rebuild_search(db) -> int:
+    """Recompute search keys and repopulate the full-text search indexes."""
+    for repo_cls in COUNTED_REPOSITORIES:
+        repo = repo_cls(db)
+        if repo.fts_table:
+            changed = repo.rebuild_search_keys()
+            print(f"{repo.model.__tablename__:<14} {changed} search keys updated")
+            status = "rebuilt" if repo.rebuild_search_index() else "not available"
+            print(f"{repo.fts_table:<14} {status}")
+    return 0
+
+
+def check_plates(db) -> int:
+    """List vehicles whose plate duplicates another one apart from spacing.
+
+    Migration 0008 leaves these without a plate_key, so plate lookups miss
+    them. Correct or delete one of each pair; changing the plate assigns the
+    key again.
+    """
+    conflicts = VehicleRepository(db).find_plate_key_conflicts()
+    for vehicle, holder in conflicts:
+        deleted = " (deleted)" if vehicle.is_deleted else ""
+        print(f"vehicle {vehicle.id}{deleted} {vehicle.plate_number!r} duplicates vehicle {holder.id} {holder.plate_number!r}")
+    print(f"{len(conflicts)} vehicle(s) with a duplicate plate")
+    return len(conflicts)
+
+
+COMMANDS = {
+    "check-counters": check_counters,
+    "rebuild-counters": rebuild_counters,
+    "check-totals": check_totals,
+    "fix-totals": fix_totals,
+    "check-revenue": check_revenue,
+    "rebuild-revenue": rebuild_revenue,
+    "rebuild-search": rebuild_search,
+    "check-plates": check_plates,
+}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.utils.maintenance")
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    args = parser.parse_args(argv)
+
+    init_db()
+    db = SessionLocal()
+    try:
+        return 1 if COMMANDS[args.command](db) else 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Sequence
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query
+
+NEXT = "next"
+PREV = "prev"
+
+
+@dataclass
+class Page:
+    """One page of a keyset-paginated list plus the cursors around it."""
+
+    items: List[Any] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    @property
+    def has_prev(self) -> bool:
+        return self.prev_cursor is not None
+
+
+@dataclass
+class OffsetPage:
+    """One page of a result addressed by page number, with the total row count."""
+
+    items: List[Any] = field(default_factory=list)
+    total: int = 0
+    page: int = 1
+    per_page: int = 20
+
+    @property
+    def total_pages(self) -> int:
+        return max(1, (self.total + self.per_page - 1) // self.per_page)
+
+    @property
+    def has_next(self) -> bool:
+        return self.page < self.total_pages
+
+    @property
+    def has_prev(self) -> bool:
+        return self.page > 1
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Pack the sort-key values of a row into an opaque, URL-safe token."""
+    raw = json.dumps(list(values), separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: Optional[str], size: int) -> Optional[list]:
+    """Unpack a cursor token; a missing or tampered token yields None (first page)."""
+    if not token:
+        return None
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, binascii.Error, UnicodeError):
+        return None
+    if not isinstance(values, list) or len(values) != size:
+        return None
+    return values
+
+
+def _keyset_window(query, columns: Sequence, keys: Optional[list], backwards: bool, limit: int, descending: bool):
+    """Apply the cursor bound, order and limit + 1 to a Query or select()."""
+    # Walking backwards flips both the comparison and the sort; rows are
+    # reversed again in _keyset_page so the page always renders in the same order.
+    forward_desc = descending != backwards
+    if keys is not None:
+        row, bound = tuple_(*columns), tuple_(*keys)
+        query = query.filter(row < bound if forward_desc else row > bound)
+    order = [c.desc() if forward_desc else c.asc() for c in columns]
+    return query.order_by(*order).limit(limit + 1)
+
+
+def _keyset_page(rows: list, columns: Sequence, keys: Optional[list], backwards: bool, limit: int) -> Page:
+    """Build the Page (items and cursors) from the limit + 1 fetched rows."""
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if backwards:
+        rows.reverse()
+
+    def key_of(item) -> str:
+        return encode_cursor([getattr(item, c.key) for c in columns])
+
+    page = Page(items=rows)
+    if rows:
+        if backwards:
+            page.next_cursor = key_of(rows[-1])
+            page.prev_cursor = key_of(rows[0]) if has_more else None
+        else:
+            page.next_cursor = key_of(rows[-1]) if has_more else None
+            page.prev_cursor = key_of(rows[0]) if keys is not None else None
+    return page
+
+
+def keyset_paginate(
+    query: Query,
+    columns: Sequence,
+    cursor: Optional[str] = None,
+    direction: str = NEXT,
+    limit: int = 20,
+    descending: bool = True,
+) -> Page:
+    """Fetch one page of ``query`` ordered by ``columns`` using a keyset cursor.
+
+    Instead of OFFSET, the page is located with a row-value comparison against
+    the sort key of the last (or first) row the user saw, so the database seeks
+    straight into the index no matter how deep the page is. ``columns`` must be
+    unique as a tuple (end with the primary key) and should match an index.
+    """
+    keys = decode_cursor(cursor, len(columns))
+    backwards = direction == PREV and keys is not None
+    rows = _keyset_window(query, columns, keys, backwards, limit, descending).all()
+    return _keyset_page(rows, columns, keys, backwards, limit)
+
+
+async def keyset_paginate_async(
+    db: AsyncSession,
+    stmt: Select,
+    columns: Sequence,
+    cursor: Optional[str] = None,
+    direction: str = NEXT,
+    limit: int = 20,
+    descending: bool = True,
+) -> Page:
+    """keyset_paginate() for a select() run on an AsyncSession."""
+    keys = decode_cursor(cursor, len(columns))
+    backwards = direction == PREV and keys is not None
+    window = _keyset_window(stmt, columns, keys, backwards, limit, descending)
+    rows = list((await db.execute(window)).scalars().all())
+    return _keyset_page(rows, columns, keys, backwards, limit)
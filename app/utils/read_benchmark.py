@@ -0,0 +1,92 @@
+"""Load test for the list and detail pages, to compare the sync handlers with
+the DB_ASYNC_READS ones on the same database.
+
+Usage (against a running server):
+    python -m app.utils.read_benchmark --url http://127.0.0.1:8000 --password ... \\
+        --concurrency 32 --requests 4000
+
+Each worker logs in, then requests the customer, vehicle and work order
+lists and random customer/vehicle detail pages in turn. Prints throughput
+and latency percentiles.
+"""
+import argparse
+import http.client
+import random
+import statistics
+import sys
+import threading
+import time
+from urllib.parse import urlencode, urlsplit
+
+
+def _paths(customer_ids: int, vehicle_ids: int, rng: random.Random):
+    while True:
+        yield "/customers/"
+        yield f"/customers/{rng.randint(1, customer_ids)}"
+        yield "/vehicles/"
+        yield f"/vehicles/{rng.randint(1, vehicle_ids)}"
+        yield "/work-orders/"
+
+
+def _worker(args, count: int, seed: int, latencies: list, errors: list):
+    url = urlsplit(args.url)
+    conn = http.client.HTTPConnection(url.hostname, url.port or 80, timeout=60)
+    body = urlencode({"username": args.username, "password": args.password})
+    conn.request("POST", "/auth/login", body, {"Content-Type": "application/x-www-form-urlencoded"})
+    response = conn.getresponse()
+    response.read()
+    cookie = (response.getheader("set-cookie") or "").split(";")[0]
+    if not cookie:
+        errors.append("login failed")
+        return
+
+    paths = _paths(args.customers, args.vehicles, random.Random(seed))
+    for _ in range(count):
+        path = next(paths)
+        started = time.perf_counter()
+        conn.request("GET", path, headers={"Cookie": cookie})
+        response = conn.getresponse()
+        response.read()
+        latencies.append(time.perf_counter() - started)
+        if response.status not in (200, 303):
+            errors.append(f"{path}: {response.status}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.utils.read_benchmark")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=4000, help="total, split across workers")
+    parser.add_argument("--customers", type=int, default=1000, help="highest customer id to open")
+    parser.add_argument("--vehicles", type=int, default=1000, help="highest vehicle id to open")
+    args = parser.parse_args(argv)
+
+    latencies, errors = [], []
+    per_worker = max(1, args.requests // args.concurrency)
+    workers = [
+        threading.Thread(target=_worker, args=(args, per_worker, seed, latencies, errors))
+        for seed in range(args.concurrency)
+    ]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+
+    if not latencies:
+        print(f"no requests completed: {errors[:5]}")
+        return 1
+    ms = sorted(value * 1000 for value in latencies)
+    print(
+        f"{len(ms)} requests in {elapsed:.1f}s = {len(ms) / elapsed:.0f} req/s; "
+        f"p50 {statistics.median(ms):.1f} ms, p95 {ms[int(len(ms) * 0.95) - 1]:.1f} ms, "
+        f"p99 {ms[int(len(ms) * 0.99) - 1]:.1f} ms; {len(errors)} errors"
+    )
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
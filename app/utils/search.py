@@ -0,0 +1,74 @@
+import re
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.utils.cache import TTLCache
+
+_WORD = re.compile(r"\w+")
+
+# Above this many matches results are listed newest first instead of by
+# bm25: ranking has to score every match, which for a short prefix such as
+# "05" on phone numbers means the whole table.
+FTS_RANK_LIMIT = 1000
+
+# Match totals keyed (table, kind, folded query), so paging through one
+# search counts once; invalidated by table name on writes
+search_count_cache = TTLCache(
+    "search_counts", default_ttl=settings.SEARCH_COUNT_TTL, max_entries=settings.SEARCH_COUNT_CACHE_SIZE
+)
+
+# Typeahead suggestions keyed (table, scope, folded query), LRU-bounded;
+# invalidated by table name on writes like search_count_cache
+typeahead_cache = TTLCache(
+    "typeahead", default_ttl=settings.TYPEAHEAD_CACHE_TTL, max_entries=settings.TYPEAHEAD_CACHE_SIZE
+)
+
+# (database URL, table) -> whether the FTS5 table exists; checked once per
+# database. Keyed by URL, not bind: in split mode the bind is a per-request
+# Connection, and the reader and writer engines share one database.
+_fts_tables: Dict[Tuple[str, str], bool] = {}
+
+
+def fts_match_expression(query: str) -> Optional[str]:
+    """Turn user input into an FTS5 MATCH expression: every word as a prefix.
+
+    Words are quoted so FTS5 operators in the input (AND, NEAR, -, ^, ...)
+    are taken literally. Returns None if the input has no words.
+    """
+    words = _WORD.findall(query or "")
+    if not words:
+        return None
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def starts_with(column, prefix: str) -> tuple:
+    """Criteria for column LIKE 'prefix%' as a range the column's index can scan.
+
+    A case-sensitive LIKE cannot use a plain SQLite index; >= / < can.
+    """
+    return column >= prefix, column < prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def has_fts_table(db: Session, table: str) -> bool:
+    """Whether the session's database has the FTS5 table (SQLite only)."""
+    bind = db.get_bind()
+    if bind.dialect.name != "sqlite":
+        return False
+    key = (str(bind.engine.url), table)
+    if key not in _fts_tables:
+        found = db.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": table}
+        ).first()
+        _fts_tables[key] = found is not None
+    return _fts_tables[key]
+
+
+def fts_match_count(db: Session, table: str, match: str, cap: int) -> int:
+    """Number of index matches, counting no further than cap."""
+    return db.execute(
+        text(f"SELECT count(*) FROM (SELECT 1 FROM {table} WHERE {table} MATCH :match LIMIT :cap)"),
+        {"match": match, "cap": cap},
+    ).scalar()
@@ -0,0 +1,51 @@
+import re
+import unicodedata
+from typing import Iterable, Optional
+
+# Turkish letters folded to their ASCII base before Unicode decomposition.
+# str.lower() maps "I" to "i" and "İ" to "i̇", and "ı" has no decomposition,
+# so the dotted/dotless pairs all become plain "i" here.
+_TURKISH_FOLD = str.maketrans({
+    "İ": "i", "I": "i", "ı": "i",
+    "Ş": "s", "ş": "s",
+    "Ğ": "g", "ğ": "g",
+    "Ç": "c", "ç": "c",
+    "Ö": "o", "ö": "o",
+    "Ü": "u", "ü": "u",
+})
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def fold_text(value: Optional[str]) -> str:
+    """Lowercase, Turkish-folded, diacritic-free words separated by single spaces.
+
+    "İSMAİL Şahin-Öz" -> "ismail sahin oz"
+    """
+    if not value:
+        return ""
+    value = unicodedata.normalize("NFKD", value.translate(_TURKISH_FOLD))
+    value = "".join(ch for ch in value if not unicodedata.combining(ch)).lower()
+    return _NON_WORD.sub(" ", value).strip()
+
+
+def build_search_key(words: Iterable[Optional[str]] = (), codes: Iterable[Optional[str]] = ()) -> str:
+    """Search key for a row: folded words of every field, plus the compact
+    form of code-like fields (phones, plates, stock codes) so they match
+    whether or not the user types the spaces.
+    """
+    parts = [fold_text(w) for w in words]
+    for code in codes:
+        folded = fold_text(code)
+        parts.append(folded)
+        if " " in folded:
+            parts.append(folded.replace(" ", ""))
+    return " ".join(p for p in parts if p)
+
+
+def plate_key(value: Optional[str]) -> str:
+    """Canonical plate: uppercase letters and digits only, "34 abc 123" -> "34ABC123".
+
+    Plates use only the Latin letters shared with ASCII, so a Turkish
+    keyboard's "i"/"ı" both map to "I" instead of "İ".
+    """
+    return fold_text(value).replace(" ", "").upper()
@@ -25,6 +25,8 @@ a = Analysis(
         (os.path.join(PROJECT_DIR, 'app', 'templates'), os.path.join('app', 'templates')),
         # Static files (CSS, JS)
         (os.path.join(PROJECT_DIR, 'app', 'static'), os.path.join('app', 'static')),
+        # Alembic migrations (loaded from disk at startup by init_db)
+        (os.path.join(PROJECT_DIR, 'app', 'migrations'), os.path.join('app', 'migrations')),
     ],
     hiddenimports=[
         # FastAPI / Starlette / Uvicorn
@@ -54,6 +56,14 @@ a = Analysis(
         'sqlalchemy',
         'sqlalchemy.dialects.sqlite',
         'sqlalchemy.sql.default_comparator',
+        'sqlalchemy.ext.asyncio',
+        'sqlalchemy.dialects.sqlite.aiosqlite',
+        'aiosqlite',
+
+        # Alembic
+        'alembic',
+        'alembic.runtime.migration',
+        'alembic.ddl.sqlite',
 
         # Jinja2
         'jinja2',
@@ -76,6 +86,9 @@ a = Analysis(
         'reportlab.pdfbase.ttfonts',
         'reportlab.pdfbase.pdfmetrics',
 
+        # Report export
+        'openpyxl',
+
         # Other
         'multipart',
         'aiofiles',
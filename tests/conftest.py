@@ -0,0 +1,124 @@
+import itertools
+import os
+import tempfile
+
+# Settings resolve the data directory on import: point it at a scratch
+# directory before anything from app is imported.
+os.environ["XDG_DATA_HOME"] = tempfile.mkdtemp(prefix="otoservis-tests-")
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.core.database import SessionLocal, engine, init_db  # noqa: E402
+from app.core.enums import WorkOrderItemType  # noqa: E402
+from app.services.customer_service import CustomerService  # noqa: E402
+from app.services.part_service import PartService  # noqa: E402
+from app.services.vehicle_service import VehicleService  # noqa: E402
+from app.services.work_order_service import WorkOrderService  # noqa: E402
+
+ADMIN_PASSWORD = "classic123"
+
+_serial = itertools.count(1)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def schema():
+    """One migrated database for the whole run; tests create their own rows."""
+    init_db()
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def query_plans(db):
+    """query_plans(call) -> EXPLAIN QUERY PLAN details of each SELECT call runs."""
+
+    def explain(call):
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append((statement, parameters))
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            call()
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        connection = db.connection()
+        return [
+            [row[3] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)]
+            for statement, parameters in statements
+        ]
+
+    return explain
+
+
+@pytest.fixture
+def factory(db):
+    """Creates rows through the services, with unique phones, plates and codes."""
+
+    class Factory:
+        def customer(self, **data):
+            n = next(_serial)
+            return CustomerService(db).create({"full_name": f"Müşteri {n}", "phone": f"0555{n:07d}", **data})
+
+        def vehicle(self, customer=None, **data):
+            n = next(_serial)
+            customer = customer or self.customer()
+            return VehicleService(db).create({
+                "customer_id": customer.id, "plate_number": f"34 T {n:05d}", "brand": "Fiat", "model": "Egea", **data,
+            })
+
+        def part(self, **data):
+            n = next(_serial)
+            return PartService(db).create({
+                "stock_code": f"TP-{n:05d}", "name": f"Parça {n}", "sale_price": 100, "stock_quantity": 10, **data,
+            })
+
+        def work_order(self, vehicle=None, parts=(), **data):
+            vehicle = vehicle or self.vehicle()
+            service = WorkOrderService(db)
+            work_order = service.create({"vehicle_id": vehicle.id, "customer_id": vehicle.customer_id, **data})
+            for part, quantity in parts:
+                service.add_item(work_order.id, {
+                    "type": WorkOrderItemType.PART, "part_id": part.id, "description": part.name,
+                    "quantity": quantity, "unit_price": part.sale_price,
+                })
+            return work_order
+
+    return Factory()
+
+
+def make_client(async_reads: bool = False) -> TestClient:
+    """A logged-in TestClient on a fresh app, with or without DB_ASYNC_READS."""
+    from app.main import create_app
+
+    previous, settings.DB_ASYNC_READS = settings.DB_ASYNC_READS, async_reads
+    try:
+        app = create_app()
+    finally:
+        settings.DB_ASYNC_READS = previous
+    client = TestClient(app)
+    client.__enter__()
+    client.post("/auth/login", data={"username": "admin", "password": ADMIN_PASSWORD}, follow_redirects=False)
+    return client
+
+
+@pytest.fixture(params=[False, True], ids=["sync", "async"])
+def client(request):
+    """Logged-in client on the sync handlers, then on the DB_ASYNC_READS ones."""
+    client = make_client(async_reads=request.param)
+    try:
+        yield client
+    finally:
+        client.__exit__(None, None, None)
@@ -0,0 +1,37 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.core.database import AsyncSessionLocal
+from app.core.enums import WorkOrderStatus
+from app.services.work_order_service import WorkOrderService
+
+
+def test_list_and_detail_pages_render(client, factory, db):
+    vehicle = factory.vehicle()
+    work_order = factory.work_order(vehicle)
+    WorkOrderService(db).change_status(work_order.id, WorkOrderStatus.APPROVED)
+
+    for url, expected in [
+        ("/customers/", vehicle.customer.full_name),
+        (f"/customers/{vehicle.customer_id}", vehicle.plate_number),
+        ("/vehicles/", vehicle.plate_number),
+        (f"/vehicles/{vehicle.id}", work_order.work_order_number),
+        ("/work-orders/", work_order.work_order_number),
+        ("/work-orders/?status=approved", work_order.work_order_number),
+    ]:
+        response = client.get(url, follow_redirects=False)
+        assert response.status_code == 200, url
+        assert expected in response.text, url
+
+
+def test_async_engine_refuses_writes():
+    async def write():
+        async with AsyncSessionLocal() as db:
+            await db.execute(text("UPDATE entity_counters SET live_count = live_count + 1"))
+
+    # Writes have to go through the sync services (counters, cache invalidation)
+    with pytest.raises(OperationalError, match="readonly"):
+        asyncio.run(write())
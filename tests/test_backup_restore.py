@@ -0,0 +1,23 @@
+from app.repositories.customer_repo import CustomerRepository
+from app.utils.backup_service import BackupService
+from app.utils.cache import _caches
+
+
+def test_restore_brings_back_consistent_counters_and_empties_caches(db, factory):
+    factory.customer()
+    repo = CustomerRepository(db)
+    before = repo.count_live_rows()
+    filename = BackupService.create_backup().rsplit("/", 1)[-1]
+
+    for _ in range(3):
+        factory.customer()
+    assert repo.counters.get("customers") == before + 3
+    for name, cache in _caches.items():
+        cache.get_or_set(("restore-test", name), lambda: "stale")
+    db.close()
+
+    assert BackupService.restore_backup(filename)
+
+    assert all(cache.stats()["entries"] == 0 for cache in _caches.values())
+    assert repo.count_live_rows() == before
+    assert repo.counters.get("customers") == before
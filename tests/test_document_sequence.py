@@ -0,0 +1,48 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.core.database import SessionLocal
+from app.services.work_order_service import WorkOrderService
+
+THREADS = 8
+CREATES_PER_THREAD = 20
+
+
+def _sequence(number: str) -> int:
+    return int(number.rsplit("-", 1)[1])
+
+
+def test_concurrent_creates_get_unique_gapless_numbers(factory):
+    vehicle = factory.vehicle()
+
+    def create_orders(_):
+        db = SessionLocal()
+        try:
+            service = WorkOrderService(db)
+            return [
+                service.create({"vehicle_id": vehicle.id, "customer_id": vehicle.customer_id}).work_order_number
+                for _ in range(CREATES_PER_THREAD)
+            ]
+        finally:
+            db.close()
+
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        numbers = [number for batch in pool.map(create_orders, range(THREADS)) for number in batch]
+
+    assert len(set(numbers)) == THREADS * CREATES_PER_THREAD
+    sequence = sorted(_sequence(number) for number in numbers)
+    assert sequence == list(range(sequence[0], sequence[0] + len(sequence)))
+
+
+def test_rolled_back_create_hands_its_number_back(db, factory):
+    vehicle = factory.vehicle()
+    service = WorkOrderService(db)
+    before = service.create({"vehicle_id": vehicle.id, "customer_id": vehicle.customer_id})
+
+    with pytest.raises(IntegrityError):
+        service.create({"vehicle_id": vehicle.id, "customer_id": -1})
+
+    after = service.create({"vehicle_id": vehicle.id, "customer_id": vehicle.customer_id})
+    assert _sequence(after.work_order_number) == _sequence(before.work_order_number) + 1
@@ -0,0 +1,81 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.core.config import settings
+from app.core.enums import PaymentMethod, WorkOrderItemType
+from app.services.payment_service import PaymentService
+from app.services.work_order_service import WorkOrderService
+from app.utils.cache import invalidate_all_caches
+
+# Statements per page (X-DB-Queries) with cold caches, however many rows it
+# shows: the session user, the rows with their eager loads, then the total
+# or the detail page's side lists.
+QUERY_COUNTS = {
+    "dashboard": 5,
+    "customer_list": 3,
+    "customer_detail": 4,
+    "vehicle_list": 3,
+    "vehicle_detail": 3,
+    "work_order_list": 3,
+    "work_order_detail": 7,
+    "part_list": 3,
+}
+
+
+def _urls(vehicle, work_order) -> dict:
+    return {
+        "dashboard": "/",
+        "customer_list": "/customers/",
+        "customer_detail": f"/customers/{vehicle.customer_id}",
+        "vehicle_list": "/vehicles/",
+        "vehicle_detail": f"/vehicles/{vehicle.id}",
+        "work_order_list": "/work-orders/",
+        "work_order_detail": f"/work-orders/{work_order.id}",
+        "part_list": "/parts/",
+    }
+
+
+def _add_related_rows(db, factory, customer, vehicle, work_order):
+    """More vehicles, work orders, items and payments on every page above."""
+    part = factory.part()
+    factory.work_order(factory.vehicle(customer), parts=[(part, 1)])
+    factory.work_order(vehicle, parts=[(part, 1)])
+    WorkOrderService(db).add_item(work_order.id, {
+        "type": WorkOrderItemType.PART, "part_id": part.id, "description": part.name,
+        "quantity": 1, "unit_price": part.sale_price,
+    })
+    PaymentService(db).create({"work_order_id": work_order.id, "amount": 10, "payment_method": PaymentMethod.CASH})
+
+
+def test_list_and_detail_pages_run_a_fixed_number_of_queries(client, db, factory):
+    customer = factory.customer()
+    vehicle = factory.vehicle(customer)
+    work_order = factory.work_order(vehicle, parts=[(factory.part(), 1)])
+    urls = _urls(vehicle, work_order)
+
+    for _ in range(3):
+        for name, url in urls.items():
+            invalidate_all_caches()
+            response = client.get(url, follow_redirects=False)
+            # Under raise_on_sql a missed eager load is a 500 from the error handler
+            assert response.status_code == 200, name
+            assert int(response.headers["X-DB-Queries"]) == QUERY_COUNTS[name], name
+            assert response.headers["X-DB-N-Plus-One"] == "0", name
+        _add_related_rows(db, factory, customer, vehicle, work_order)
+
+
+@pytest.mark.skipif(settings.DEBUG, reason="this run already uses raise_on_sql")
+def test_pages_load_nothing_lazily_under_raise_on_sql():
+    # RELATIONSHIP_LAZY is chosen when the models are imported, so the pages
+    # are requested again in a fresh interpreter with DEBUG on.
+    root = Path(__file__).resolve().parents[1]
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider",
+         f"{__file__}::test_list_and_detail_pages_run_a_fixed_number_of_queries"],
+        cwd=root, env={**os.environ, "DEBUG": "true"}, capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stdout[-4000:]
@@ -0,0 +1,88 @@
+from datetime import date
+
+import pytest
+
+from app.core.enums import WorkOrderStatus
+from app.repositories.customer_repo import CustomerRepository
+from app.repositories.part_repo import PartRepository
+from app.repositories.report_repo import ReportRepository
+from app.repositories.vehicle_repo import VehicleRepository
+from app.repositories.work_order_repo import WorkOrderRepository
+from app.utils.pagination import NEXT, PREV, encode_cursor
+
+CURSOR = encode_cursor([1000])
+
+# (repository method, index the page query must search)
+KEYSET_PAGES = {
+    "customers": (lambda db, **kw: CustomerRepository(db).get_page(**kw), "ix_customers_live_id"),
+    "vehicles": (lambda db, **kw: VehicleRepository(db).get_page(**kw), "ix_vehicles_live_id"),
+    "work_orders": (lambda db, **kw: WorkOrderRepository(db).get_page(**kw), "ix_work_orders_live_id"),
+    "work_orders_by_status": (
+        lambda db, **kw: WorkOrderRepository(db).get_page_by_status(WorkOrderStatus.PENDING, **kw),
+        "ix_work_orders_live_status_id",
+    ),
+    "parts": (lambda db, **kw: PartRepository(db).get_page(**kw), "INTEGER PRIMARY KEY"),
+}
+
+
+@pytest.mark.parametrize("direction", [NEXT, PREV])
+@pytest.mark.parametrize("name", KEYSET_PAGES)
+def test_keyset_page_seeks_into_index(db, query_plans, name, direction):
+    get_page, index = KEYSET_PAGES[name]
+    [plan] = query_plans(lambda: get_page(db, cursor=CURSOR, direction=direction))
+    assert index in plan[0] and plan[0].startswith("SEARCH"), plan
+    assert not [step for step in plan if step.startswith("SCAN") or "TEMP B-TREE" in step], plan
+
+
+@pytest.mark.parametrize("name", KEYSET_PAGES)
+def test_first_page_reads_index_in_order(db, query_plans, name):
+    get_page, index = KEYSET_PAGES[name]
+    [plan] = query_plans(lambda: get_page(db))
+    # No cursor to seek to: the page walks the index (parts: the rowid
+    # b-tree) in order and stops after LIMIT rows, without sorting
+    if index != "INTEGER PRIMARY KEY":
+        assert index in plan[0], plan
+    assert not [step for step in plan if "TEMP B-TREE" in step], plan
+
+
+@pytest.mark.parametrize("get_rows, index", [
+    (lambda db: VehicleRepository(db).get_by_customer(1), "ix_vehicles_live_customer_id"),
+    (lambda db: WorkOrderRepository(db).get_by_customer(1), "ix_work_orders_live_customer_id"),
+    (lambda db: WorkOrderRepository(db).get_by_vehicle(1), "ix_work_orders_live_vehicle_id"),
+])
+def test_detail_page_lists_search_by_parent(db, query_plans, get_rows, index):
+    [plan] = query_plans(lambda: get_rows(db))
+    assert plan[0].startswith("SEARCH") and index in plan[0], plan
+    assert not [step for step in plan if step.startswith("SCAN") or "TEMP B-TREE" in step], plan
+
+
+def _table_steps(plans, table):
+    return [step for plan in plans for step in plan if step.split()[1] == table]
+
+
+@pytest.mark.parametrize("query", ["34ABC", "34 abc 123", "123"])
+def test_plate_lookup_range_scans_plate_key_indexes(db, query_plans, query):
+    def lookup():
+        repo = VehicleRepository(db)
+        repo.lookup_plate(query)
+        repo.count_plate_matches(f"{query}-count")
+
+    steps = _table_steps(query_plans(lookup), "vehicles")
+    # Plates starting with the input, then plates ending with it
+    assert any(step.startswith("SEARCH vehicles USING INDEX ix_vehicles_plate_key (") for step in steps), steps
+    assert any(step.startswith("SEARCH vehicles USING INDEX ix_vehicles_live_plate_key_rev (") for step in steps), steps
+    assert all(step.startswith("SEARCH") for step in steps), steps
+
+
+def test_exact_plate_lookup_searches_plate_key(db, query_plans):
+    [plan] = query_plans(lambda: VehicleRepository(db).get_by_plate("34 abc 123"))
+    assert plan == ["SEARCH vehicles USING INDEX ix_vehicles_plate_key (plate_key=?)"]
+
+
+@pytest.mark.parametrize("report", ["get_closed_orders", "get_technician_stats"])
+def test_report_date_range_searches_status_completed_index(db, query_plans, report):
+    plans = query_plans(lambda: getattr(ReportRepository(db), report)(date(2026, 1, 1), date(2026, 1, 31)))
+    [step] = _table_steps(plans, "work_orders")
+    # Half-open completed_at bounds on the (status, completed_at) index, not date(completed_at)
+    assert step.startswith("SEARCH work_orders USING INDEX ix_work_orders_live_status_completed"), step
+    assert "completed_at>" in step and "completed_at<" in step, step
@@ -0,0 +1,38 @@
+import pytest
+from sqlalchemy import event
+
+from app.core.database import engine
+from app.repositories.customer_repo import CustomerRepository
+from app.repositories.part_repo import PartRepository
+from app.repositories.vehicle_repo import VehicleRepository
+from app.services.search_service import TEXT, SearchService
+
+PUNCTUATION_QUERIES = ["", "   ", "!!!", "--", "_.,"]
+
+
+@pytest.mark.parametrize("query", PUNCTUATION_QUERIES)
+def test_search_without_word_characters_returns_nothing(query):
+    # No session: any lookup or fanout would fail on db=None
+    assert SearchService(None).search(query) == {"kind": TEXT, "results": []}
+
+
+@pytest.mark.parametrize("repository", [CustomerRepository, VehicleRepository, PartRepository])
+@pytest.mark.parametrize("query", PUNCTUATION_QUERIES)
+def test_repository_search_without_word_characters_matches_nothing(db, factory, repository, query):
+    factory.vehicle()
+    factory.part()
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    repo = repository(db)
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        assert repo.search(query) == []
+        assert repo.count_search(query) == 0
+        page = repo.search_page(query, page=3)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert (page.items, page.total, page.page) == ([], 0, 1)
+    assert statements == []
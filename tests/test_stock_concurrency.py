@@ -0,0 +1,56 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from app.core.database import SessionLocal
+from app.core.enums import WorkOrderStatus
+from app.models.part import Part
+from app.services.work_order_service import WorkOrderService
+
+WORKERS = 16
+
+
+def _in_progress_orders(db, factory, part, quantity):
+    service = WorkOrderService(db)
+    orders = [factory.work_order(parts=[(part, quantity)]) for _ in range(WORKERS)]
+    for order in orders:
+        service.change_status(order.id, WorkOrderStatus.APPROVED)
+        service.change_status(order.id, WorkOrderStatus.IN_PROGRESS)
+    return [order.id for order in orders]
+
+
+def _complete_in_parallel(order_ids):
+    def complete(order_id):
+        db = SessionLocal()
+        try:
+            order = WorkOrderService(db).change_status(order_id, WorkOrderStatus.COMPLETED)
+            return order.status
+        finally:
+            db.close()
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        return list(pool.map(complete, order_ids))
+
+
+def _stock(db, part):
+    db.expire_all()
+    return db.get(Part, part.id).stock_quantity
+
+
+def test_parallel_completions_take_every_unit_out_of_stock(db, factory):
+    part = factory.part(stock_quantity=100)
+    order_ids = _in_progress_orders(db, factory, part, quantity=3)
+
+    statuses = _complete_in_parallel(order_ids)
+
+    assert statuses == [WorkOrderStatus.COMPLETED] * WORKERS
+    assert _stock(db, part) == 100 - 3 * WORKERS
+
+
+def test_parallel_completions_stop_at_zero_stock(db, factory):
+    part = factory.part(stock_quantity=10)
+    order_ids = _in_progress_orders(db, factory, part, quantity=1)
+
+    statuses = _complete_in_parallel(order_ids)
+
+    # Orders beyond the stock still complete (the shortfall is logged)
+    assert statuses == [WorkOrderStatus.COMPLETED] * WORKERS
+    assert _stock(db, part) == 0